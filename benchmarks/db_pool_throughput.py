@@ -0,0 +1,149 @@
+"""Compare direct vs PgBouncer throughput on the meal and cart hot queries.
+
+Each iteration opens a session, runs the queries behind the menu page and the
+cart page, and closes the session, the same way a request does. Run from the
+project root with the usual environment loaded:
+
+    python -m benchmarks.db_pool_throughput --pooled-port 6432
+
+The pooled target is connected to with POSTGRES_PGBOUNCER_MODE enabled.
+"""
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from src.core.config import get_settings, Settings
+from src.core.database import create_engine_from_settings
+from src.models.cart import CartModel
+from src.models.cart_item import CartItemModel
+from src.models.meal import MealModel
+from src.models.meal_category import MealCategoryModel  # noqa: F401
+from src.models.order import OrderModel  # noqa: F401
+from src.models.order_item import OrderItemModel  # noqa: F401
+from src.models.user import UserModel  # noqa: F401
+from src.repositories.sqlalchemy.cart import SQLAlchemyCartRepository
+from src.repositories.sqlalchemy.cart_item import (
+    SQLAlchemyCartItemRepository
+)
+from src.repositories.sqlalchemy.meal import SQLAlchemyMealRepository
+
+
+async def pick_sample_ids(engine: AsyncEngine) -> tuple[int, int]:
+    async with engine.connect() as conn:
+        category_id = await conn.scalar(
+            select(MealModel.category_id)
+            .group_by(MealModel.category_id)
+            .order_by(func.count().desc())
+            .limit(1)
+        )
+        user_id = await conn.scalar(
+            select(CartModel.user_id)
+            .join(CartItemModel, CartItemModel.cart_id == CartModel.id)
+            .limit(1)
+        )
+
+    if category_id is None or user_id is None:
+        raise SystemExit(
+            "Benchmark needs at least one meal and one non-empty cart"
+        )
+
+    return category_id, user_id
+
+
+async def run_iteration(
+    session_factory: async_sessionmaker, category_id: int, user_id: int
+) -> None:
+    async with session_factory() as session:
+        meal_repo = SQLAlchemyMealRepository(session)
+        await meal_repo.get_all_by_category_id(category_id, 10, 0)
+        await meal_repo.get_total_count(category_id)
+
+        cart = await SQLAlchemyCartRepository(session).get_by_user_id(user_id)
+        await SQLAlchemyCartItemRepository(session).get_all_by_cart_id(cart.id)
+
+
+async def run_target(
+    name: str,
+    settings: Settings,
+    concurrency: int,
+    duration: float,
+    sample_ids: tuple[int, int] | None = None
+) -> tuple[int, int]:
+    engine = create_engine_from_settings(settings.postgres_url, settings, name)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    sample_ids = sample_ids or await pick_sample_ids(engine)
+    latencies: list[float] = []
+    deadline = perf_counter() + duration
+
+    async def worker() -> None:
+        while perf_counter() < deadline:
+            start = perf_counter()
+            await run_iteration(session_factory, *sample_ids)
+            latencies.append(perf_counter() - start)
+
+    # Warm up the pool and statement caches before measuring
+    await asyncio.gather(*(
+        run_iteration(session_factory, *sample_ids)
+        for _ in range(concurrency)
+    ))
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - started
+    await engine.dispose()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+    print(
+        f"{name:<8} {len(latencies) / elapsed:>10.1f} "
+        f"{statistics.median(latencies) * 1000:>9.2f} {p95 * 1000:>9.2f}"
+    )
+
+    return sample_ids
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pooled-host", default=None)
+    parser.add_argument("--pooled-port", type=int, default=6432)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument(
+        "--statement-cache-size", type=int, default=None,
+        help="Override both statement cache sizes for the pooled target"
+    )
+    args = parser.parse_args()
+
+    settings = get_settings()
+    pooled_update = {
+        "postgres_host": args.pooled_host or settings.postgres_host,
+        "postgres_port": args.pooled_port,
+        "postgres_pgbouncer_mode": True
+    }
+    if args.statement_cache_size is not None:
+        pooled_update["postgres_statement_cache_size"] = (
+            args.statement_cache_size
+        )
+        pooled_update["postgres_prepared_statement_cache_size"] = (
+            args.statement_cache_size
+        )
+    pooled_settings = settings.model_copy(update=pooled_update)
+
+    print(
+        f"concurrency={args.concurrency}, duration={args.duration}s, "
+        f"iteration = 4 queries"
+    )
+    print(f"{'target':<8} {'iter/s':>10} {'p50 ms':>9} {'p95 ms':>9}")
+    sample_ids = await run_target(
+        "direct", settings, args.concurrency, args.duration
+    )
+    await run_target(
+        "pooled", pooled_settings, args.concurrency, args.duration, sample_ids
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
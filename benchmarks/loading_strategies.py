@@ -0,0 +1,148 @@
+"""Compare the old joined eager loads with the explicit per-query loads.
+
+Cart items used to join carts -> users and meals, and order history joined
+users and every item's full meal row. Both are measured against the queries
+the repositories run now. Run from the project root with the usual
+environment loaded:
+
+    python -m benchmarks.loading_strategies --iterations 500
+"""
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from src.core.database import async_engine, async_session
+from src.models.cart import CartModel
+from src.models.cart_item import CartItemModel
+from src.models.meal import MealModel  # noqa: F401
+from src.models.meal_category import MealCategoryModel  # noqa: F401
+from src.models.order import OrderModel
+from src.models.order_item import OrderItemModel
+from src.models.user import UserModel  # noqa: F401
+
+
+def build_cases(cart_id: int, user_id: int) -> dict[str, tuple[Select, Select]]:
+    return {
+        "cart items": (
+            select(CartItemModel)
+            .options(
+                joinedload(CartItemModel.cart).joinedload(CartModel.user),
+                joinedload(CartItemModel.meal)
+            )
+            .where(CartItemModel.cart_id == cart_id),
+            select(CartItemModel).where(CartItemModel.cart_id == cart_id)
+        ),
+        "order history": (
+            select(OrderModel)
+            .options(
+                joinedload(OrderModel.user),
+                selectinload(OrderModel.items)
+                .joinedload(OrderItemModel.meal)
+            )
+            .where(OrderModel.user_id == user_id)
+            .order_by(OrderModel.created_at.desc()),
+            select(OrderModel)
+            .options(selectinload(OrderModel.items))
+            .where(OrderModel.user_id == user_id)
+            .order_by(OrderModel.created_at.desc())
+        ),
+        "order items": (
+            select(OrderItemModel)
+            .options(joinedload(OrderItemModel.meal))
+            .join(OrderModel)
+            .where(OrderModel.user_id == user_id),
+            select(OrderItemModel)
+            .join(OrderModel)
+            .where(OrderModel.user_id == user_id)
+        )
+    }
+
+
+async def pick_sample_ids(session: AsyncSession) -> tuple[int, int]:
+    cart_id = await session.scalar(
+        select(CartItemModel.cart_id)
+        .group_by(CartItemModel.cart_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    )
+    user_id = await session.scalar(
+        select(OrderModel.user_id)
+        .group_by(OrderModel.user_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    )
+
+    if cart_id is None or user_id is None:
+        raise SystemExit(
+            "Benchmark needs at least one non-empty cart and one order"
+        )
+
+    return cart_id, user_id
+
+
+async def measure_width(
+    session: AsyncSession, stmt: Select
+) -> tuple[int, float]:
+    sql = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    columns = await session.execute(
+        text(f"SELECT * FROM ({sql}) AS t LIMIT 0")
+    )
+    row_bytes = await session.scalar(
+        text(f"SELECT avg(pg_column_size(t.*)) FROM ({sql}) AS t")
+    )
+
+    return len(columns.keys()), float(row_bytes or 0)
+
+
+async def measure_latency(stmt: Select, iterations: int) -> list[float]:
+    latencies = []
+
+    for _ in range(iterations):
+        async with async_session() as session:
+            start = perf_counter()
+            result = await session.execute(stmt)
+            result.unique().scalars().all()
+            latencies.append(perf_counter() - start)
+
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    async with async_session() as session:
+        cases = build_cases(*await pick_sample_ids(session))
+
+        print(
+            f"{'query':<14} {'strategy':<9} {'columns':>7} "
+            f"{'row bytes':>9} {'p50 ms':>8} {'p95 ms':>8}"
+        )
+        for name, statements in cases.items():
+            for strategy, stmt in zip(("joined", "explicit"), statements):
+                columns, row_bytes = await measure_width(session, stmt)
+                latencies = sorted(
+                    await measure_latency(stmt, args.iterations)
+                )
+                p95 = latencies[int(len(latencies) * 0.95) - 1]
+                print(
+                    f"{name:<14} {strategy:<9} {columns:>7} "
+                    f"{row_bytes:>9.0f} "
+                    f"{statistics.median(latencies) * 1000:>8.2f} "
+                    f"{p95 * 1000:>8.2f}"
+                )
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
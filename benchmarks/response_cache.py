@@ -0,0 +1,123 @@
+"""Measure GET /meal-categories/{id}/meals with and without the response cache.
+
+Both apps mount the same v1 routers in-process and are driven through an
+ASGI transport, so the numbers cover the middleware, DI, service and
+repository path but not the network. The cached app uses the configured
+cache backend (CACHE_BACKEND). Run from the project root with the usual
+environment loaded:
+
+    python -m benchmarks.response_cache --concurrency 20 --duration 10
+"""
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import func, select
+
+from src.controllers.v1 import api_v1_router
+from src.core.config import get_settings
+from src.core.database import async_engine
+from src.core.exceptions_setup import setup_exception_handlers
+from src.middlewares.response_cache import setup_response_cache
+from src.models.meal import MealModel
+
+
+def build_app(with_response_cache: bool) -> FastAPI:
+    app = FastAPI()
+    app.include_router(api_v1_router, prefix="/api")
+    setup_exception_handlers(app)
+
+    if with_response_cache:
+        settings = get_settings().model_copy(
+            update={"response_cache_enabled": True}
+        )
+        setup_response_cache(app, settings)
+
+    return app
+
+
+async def pick_category_id() -> int:
+    async with async_engine.connect() as conn:
+        category_id = await conn.scalar(
+            select(MealModel.category_id)
+            .group_by(MealModel.category_id)
+            .order_by(func.count().desc())
+            .limit(1)
+        )
+
+    if category_id is None:
+        raise SystemExit("Benchmark needs at least one meal")
+
+    return category_id
+
+
+async def run_target(
+    name: str, app: FastAPI, url: str, concurrency: int, duration: float
+) -> float:
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        async def worker(deadline: float) -> None:
+            while perf_counter() < deadline:
+                start = perf_counter()
+                response = await client.get(url)
+                response.raise_for_status()
+                latencies.append(perf_counter() - start)
+
+        # Warm up the pool, statement caches and the response cache
+        await worker(perf_counter() + 1)
+        latencies.clear()
+
+        started = perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(worker(deadline) for _ in range(concurrency)))
+        elapsed = perf_counter() - started
+
+    latencies.sort()
+    rps = len(latencies) / elapsed
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+    print(
+        f"{name:<8} {rps:>10.1f} {statistics.median(latencies) * 1000:>9.2f} "
+        f"{p95 * 1000:>9.2f}"
+    )
+
+    return rps
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--per-page", type=int, default=10)
+    args = parser.parse_args()
+
+    category_id = await pick_category_id()
+    url = (
+        f"/api/v1/meal-categories/{category_id}/meals"
+        f"?page=1&per_page={args.per_page}"
+    )
+
+    print(
+        f"GET {url}, concurrency={args.concurrency}, "
+        f"duration={args.duration}s"
+    )
+    print(f"{'target':<8} {'req/s':>10} {'p50 ms':>9} {'p95 ms':>9}")
+    uncached = await run_target(
+        "uncached", build_app(False), url, args.concurrency, args.duration
+    )
+    cached = await run_target(
+        "cached", build_app(True), url, args.concurrency, args.duration
+    )
+    print(f"speedup  {cached / uncached:>10.1f}x")
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
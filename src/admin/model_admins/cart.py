@@ -1,7 +1,12 @@
+from functools import partial
+
 from fastapi_amis_admin.admin import admin
 
+from src.admin.services import call_after_commit, notify_invalidation
 from src.admin.site import site
+from src.core.cache import cache
 from src.models.cart import CartModel
+from src.services.cart.service import CART_CACHE_KEY
 
 
 @site.register_admin
@@ -13,3 +18,32 @@ class CartModelAdmin(admin.ModelAdmin):
     page_schema = "CartModel"
     model = CartModel
     display_item_action_as_column = True
+
+    # Admin edits bypass CartService, so cached carts are dropped here
+    async def update_items(self, request, item_id, values):
+        # Collected before the update, user_id itself may be edited
+        user_ids = {cart.user_id for cart in await self.fetch_items(*item_id)}
+        items = await super().update_items(request, item_id, values)
+        user_ids.update(cart.user_id for cart in items)
+        await notify_invalidation(self.db.session, "cart", user_ids)
+        call_after_commit(
+            self.db.session, partial(self._evict_carts, user_ids)
+        )
+        return items
+
+    async def delete_items(self, request, item_id):
+        items = await super().delete_items(request, item_id)
+        await notify_invalidation(
+            self.db.session, "cart", (cart.user_id for cart in items)
+        )
+        call_after_commit(
+            self.db.session,
+            partial(self._evict_carts, {cart.user_id for cart in items})
+        )
+        return items
+
+    @staticmethod
+    async def _evict_carts(user_ids: set[int]) -> None:
+        await cache.delete(
+            *(CART_CACHE_KEY.format(user_id=user_id) for user_id in user_ids)
+        )
@@ -1,10 +1,16 @@
+from functools import partial
+
 from fastapi_amis_admin import admin
 from fastapi_amis_admin.amis.components import (
     InputImage, Action, Form, InputFile, Dialog
 )
 from src.admin import site
+from src.admin.services import call_after_commit, notify_invalidation
+from src.core.cache import negative_cache, response_cache
 from src.core.utils.type_converters import url_to_str
 from src.models.meal import MealModel
+from src.services.meal.service import MEAL_TAG, MEALS_TAG
+from src.services.menu.snapshot import menu_snapshot_store
 
 
 @site.register_admin
@@ -61,6 +67,76 @@ class MealModelAdmin(admin.ModelAdmin):
             data["image_url"] = url_to_str(data["image_url"])
         return data
 
+    # Admin edits bypass MealService, so the menu snapshot is dropped here
+    async def create_items(self, request, items):
+        created = await super().create_items(request, items)
+        await self._notify_invalidation(created)
+        call_after_commit(self.db.session, menu_snapshot_store.invalidate)
+        call_after_commit(
+            self.db.session,
+            partial(negative_cache.forget, "meal", *(m.id for m in created))
+        )
+        call_after_commit(
+            self.db.session,
+            partial(
+                response_cache.purge,
+                *{MEALS_TAG.format(category_id=m.category_id) for m in created}
+            )
+        )
+        return created
+
+    async def update_items(self, request, item_id, values):
+        # Collected before the update, a meal may be moved to another category
+        before = await self.fetch_items(*item_id)
+        tags = self._response_tags(before)
+        category_ids = {meal.category_id for meal in before}
+        items = await super().update_items(request, item_id, values)
+        tags |= self._response_tags(items)
+        await notify_invalidation(
+            self.db.session,
+            "category_meals",
+            category_ids | {meal.category_id for meal in items}
+        )
+        await notify_invalidation(
+            self.db.session, "meal", (meal.id for meal in items)
+        )
+        call_after_commit(self.db.session, menu_snapshot_store.invalidate)
+        call_after_commit(
+            self.db.session, partial(response_cache.purge, *tags)
+        )
+        return items
+
+    async def delete_items(self, request, item_id):
+        items = await super().delete_items(request, item_id)
+        await self._notify_invalidation(items)
+        call_after_commit(self.db.session, menu_snapshot_store.invalidate)
+        call_after_commit(
+            self.db.session,
+            partial(response_cache.purge, *self._response_tags(items))
+        )
+        return items
+
+    async def _notify_invalidation(self, meals: list[MealModel]) -> None:
+        await notify_invalidation(
+            self.db.session, "meal", (meal.id for meal in meals)
+        )
+        await notify_invalidation(
+            self.db.session,
+            "category_meals",
+            (meal.category_id for meal in meals)
+        )
+
+    @staticmethod
+    def _response_tags(meals: list[MealModel]) -> set[str]:
+        return {
+            tag
+            for meal in meals
+            for tag in (
+                MEALS_TAG.format(category_id=meal.category_id),
+                MEAL_TAG.format(meal_id=meal.id)
+            )
+        }
+
     async def get_list_table(self, request):
         table = await super().get_list_table(request)
         import_button = Action(
@@ -1,7 +1,14 @@
+from functools import partial
+
 from fastapi_amis_admin.admin import admin
 
+from src.admin.services import call_after_commit, notify_invalidation
 from src.admin.site import site
+from src.core.cache import negative_cache, response_cache
 from src.models.meal_category import MealCategoryModel
+from src.services.meal_category.cache import meal_category_cache
+from src.services.meal_category.service import CATEGORIES_TAG, CATEGORY_TAG
+from src.services.menu.snapshot import menu_snapshot_store
 
 
 @site.register_admin
@@ -14,3 +21,52 @@ class MealCategoryModelAdmin(admin.ModelAdmin):
     page_schema = "MealCategoryModel"
     model = MealCategoryModel
     display_item_action_as_column = True
+
+    # Admin edits bypass MealCategoryService, so caches are dropped here
+    async def create_items(self, request, items):
+        created = await super().create_items(request, items)
+        await notify_invalidation(
+            self.db.session, "meal_category", (c.id for c in created)
+        )
+        call_after_commit(self.db.session, menu_snapshot_store.invalidate)
+        call_after_commit(
+            self.db.session,
+            partial(
+                negative_cache.forget,
+                "meal_category",
+                *(category.id for category in created)
+            )
+        )
+        call_after_commit(
+            self.db.session, partial(response_cache.purge, CATEGORIES_TAG)
+        )
+        return created
+
+    async def update_items(self, request, item_id, values):
+        items = await super().update_items(request, item_id, values)
+        await notify_invalidation(
+            self.db.session, "meal_category", (c.id for c in items)
+        )
+        call_after_commit(
+            self.db.session, partial(self._invalidate_caches, items)
+        )
+        return items
+
+    async def delete_items(self, request, item_id):
+        items = await super().delete_items(request, item_id)
+        await notify_invalidation(
+            self.db.session, "meal_category", (c.id for c in items)
+        )
+        call_after_commit(
+            self.db.session, partial(self._invalidate_caches, items)
+        )
+        return items
+
+    @staticmethod
+    async def _invalidate_caches(categories: list[MealCategoryModel]):
+        meal_category_cache.clear()
+        menu_snapshot_store.invalidate()
+        await response_cache.purge(
+            CATEGORIES_TAG,
+            *(CATEGORY_TAG.format(category_id=c.id) for c in categories)
+        )
@@ -1,7 +1,13 @@
+from functools import partial
+
 from fastapi_amis_admin.admin import admin
 
+from src.admin.services import call_after_commit, notify_invalidation
 from src.admin.site import site
+from src.core.cache import cache, negative_cache
 from src.models.user import UserModel, UserIdentityModel
+from src.services.cart.service import CART_CACHE_KEY
+from src.services.user.service import USER_CACHE_KEY
 
 
 @site.register_admin
@@ -14,6 +20,57 @@ class UserModelAdmin(admin.ModelAdmin):
     model = UserModel
     display_item_action_as_column = True
 
+    # Admin edits bypass UserService, so cached profiles are dropped here
+    async def create_items(self, request, items):
+        created = await super().create_items(request, items)
+        await notify_invalidation(
+            self.db.session, "user", (user.id for user in created)
+        )
+        call_after_commit(
+            self.db.session,
+            partial(
+                negative_cache.forget, "user", *(user.id for user in created)
+            )
+        )
+        return created
+
+    async def update_items(self, request, item_id, values):
+        items = await super().update_items(request, item_id, values)
+        await notify_invalidation(
+            self.db.session, "user", (user.id for user in items)
+        )
+        call_after_commit(
+            self.db.session,
+            partial(self._evict_users, [user.id for user in items])
+        )
+        return items
+
+    async def delete_items(self, request, item_id):
+        items = await super().delete_items(request, item_id)
+        await notify_invalidation(
+            self.db.session, "user", (user.id for user in items)
+        )
+        call_after_commit(
+            self.db.session,
+            partial(
+                self._evict_users,
+                [user.id for user in items],
+                with_carts=True
+            )
+        )
+        return items
+
+    @staticmethod
+    async def _evict_users(
+        user_ids: list[int], with_carts: bool = False
+    ) -> None:
+        keys = [USER_CACHE_KEY.format(user_id=user_id) for user_id in user_ids]
+        if with_carts:
+            keys += [
+                CART_CACHE_KEY.format(user_id=user_id) for user_id in user_ids
+            ]
+        await cache.delete(*keys)
+
 
 @site.register_admin
 class UserIdentityModelAdmin(admin.ModelAdmin):
@@ -1,10 +1,46 @@
+import inspect
 from io import BytesIO
+from typing import Any, Callable, Iterable
 
 import pandas as pd
 from fastapi import UploadFile
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import negative_cache, response_cache
 from src.core.database import get_session
+from src.core.invalidation import invalidation_bus
+from src.core.utils.background import run_in_background
 from src.models.meal import MealModel
+from src.services.meal.service import MEALS_TAG
+from src.services.menu.snapshot import menu_snapshot_store
+
+
+def call_after_commit(
+    session: AsyncSession, callback: Callable[[], Any]
+) -> None:
+    # Admin CRUD commits when its request scope closes, after the hooks return
+    event.listen(
+        session.sync_session,
+        "after_commit",
+        lambda _session: _run_callback(callback),
+        once=True
+    )
+
+
+def _run_callback(callback: Callable[[], Any]) -> None:
+    result = callback()
+
+    # The commit event is synchronous, coroutines finish in the background
+    if inspect.isawaitable(result):
+        run_in_background(result, "Admin: After-commit callback")
+
+
+async def notify_invalidation(
+    session: AsyncSession, entity: str, entity_ids: Iterable[int]
+) -> None:
+    # Delivered to the other workers when the admin request commits
+    await invalidation_bus.notify(session, entity, *set(entity_ids))
 
 
 async def get_df_from_file(file: UploadFile):
@@ -33,4 +69,19 @@ async def create_meal_objects_from_df(df):
 
     async for session in get_session():
         session.add_all(meal_objects)
+        await session.flush()
+        await notify_invalidation(
+            session, "meal", (meal.id for meal in meal_objects)
+        )
+        await notify_invalidation(
+            session,
+            "category_meals",
+            (meal.category_id for meal in meal_objects)
+        )
         await session.commit()
+
+    menu_snapshot_store.invalidate()
+    await negative_cache.forget("meal", *(meal.id for meal in meal_objects))
+    await response_cache.purge(*{
+        MEALS_TAG.format(category_id=meal.category_id) for meal in meal_objects
+    })
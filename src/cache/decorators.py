@@ -0,0 +1,176 @@
+import inspect
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable, TypeVar, get_type_hints
+
+from pydantic import TypeAdapter, ValidationError
+
+from src.cache.interface import ICache
+from src.core.logging import logger
+from src.exceptions.cache import CacheBackendError
+from src.monitoring.metrics import CACHE_HITS, CACHE_MISSES
+
+Method = TypeVar("Method", bound=Callable[..., Awaitable[Any]])
+
+
+class _CachedMethod:
+    """Shared plumbing of the decorators below.
+
+    Keys are ``str.format`` templates over the method's arguments, e.g.
+    ``"user:{user_id}"``. Values are stored as JSON of the method's return
+    annotation. A failing backend is logged and bypassed, never raised.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[Any]],
+        cache_attr: str,
+        uow_attr: str = "uow"
+    ) -> None:
+        self.method = method
+        self.cache_attr = cache_attr
+        self.uow_attr = uow_attr
+        self.name = method.__qualname__
+        self.signature = inspect.signature(method)
+        self._adapter: TypeAdapter | None = None
+
+    @property
+    def adapter(self) -> TypeAdapter:
+        # Resolved lazily, return annotations may be forward references
+        if self._adapter is None:
+            self._adapter = TypeAdapter(get_type_hints(self.method)["return"])
+        return self._adapter
+
+    def cache(self, instance: Any) -> ICache:
+        return getattr(instance, self.cache_attr)
+
+    async def after_commit(
+        self, instance: Any, action: Callable[[], Awaitable[None]]
+    ) -> None:
+        # Called inside a caller's transaction, the change isn't committed
+        # until the outermost unit of work exits
+        uow = getattr(instance, self.uow_attr, None)
+
+        if uow is not None and uow.in_transaction:
+            uow.add_after_commit_hook(action)
+        else:
+            await action()
+
+    def key(self, template: str, args: tuple, kwargs: dict) -> str:
+        bound = self.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return template.format(**bound.arguments)
+
+    async def load(self, cache: ICache, key: str) -> Any | None:
+        try:
+            raw = await cache.get(key)
+        except CacheBackendError as e:
+            logger.warning(f"Cache: Failed to read {key}: {e}")
+            return None
+
+        if raw is None:
+            CACHE_MISSES.labels(cache=self.name).inc()
+            return None
+
+        try:
+            value = self.adapter.validate_json(raw)
+        except ValidationError as e:
+            logger.warning(f"Cache: Dropping undecodable entry {key}: {e}")
+            CACHE_MISSES.labels(cache=self.name).inc()
+            return None
+
+        CACHE_HITS.labels(cache=self.name).inc()
+        return value
+
+    async def store(
+        self, cache: ICache, key: str, value: Any, ttl: float | None
+    ) -> None:
+        try:
+            await cache.set(key, self.adapter.dump_json(value), ttl)
+        except CacheBackendError as e:
+            logger.warning(f"Cache: Failed to write {key}: {e}")
+
+    async def evict(self, cache: ICache, keys: list[str]) -> None:
+        try:
+            await cache.delete(*keys)
+        except CacheBackendError as e:
+            logger.warning(f"Cache: Failed to delete {keys}: {e}")
+
+
+def read_through(
+    key: str, ttl: float | None = None, cache_attr: str = "cache"
+) -> Callable[[Method], Method]:
+    """Serve the method's result from the cache and call it only on a miss.
+
+    ``None`` results are not cached.
+    """
+    def decorator(method: Method) -> Method:
+        cached = _CachedMethod(method, cache_attr)
+
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            cache = cached.cache(self)
+            cache_key = cached.key(key, (self, *args), kwargs)
+            value = await cached.load(cache, cache_key)
+
+            if value is not None:
+                return value
+
+            value = await method(self, *args, **kwargs)
+            if value is not None:
+                await cached.store(cache, cache_key, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def write_through(
+    key: str, ttl: float | None = None, cache_attr: str = "cache"
+) -> Callable[[Method], Method]:
+    """Store the method's result under ``key`` once it is committed.
+
+    Meant for write methods that run in a unit of work, so only committed
+    state reaches the cache. Called inside a caller's unit of work, the
+    value is stored by an after-commit hook and dropped on rollback.
+    """
+    def decorator(method: Method) -> Method:
+        cached = _CachedMethod(method, cache_attr)
+
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            value = await method(self, *args, **kwargs)
+
+            if value is not None:
+                cache_key = cached.key(key, (self, *args), kwargs)
+                await cached.after_commit(self, partial(
+                    cached.store, cached.cache(self), cache_key, value, ttl
+                ))
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def evict(
+    *keys: str, cache_attr: str = "cache"
+) -> Callable[[Method], Method]:
+    """Delete ``keys`` once the method's changes are committed, like
+    ``write_through``."""
+    def decorator(method: Method) -> Method:
+        cached = _CachedMethod(method, cache_attr)
+
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            value = await method(self, *args, **kwargs)
+            await cached.after_commit(self, partial(
+                cached.evict,
+                cached.cache(self),
+                [cached.key(key, (self, *args), kwargs) for key in keys]
+            ))
+            return value
+
+        return wrapper
+
+    return decorator
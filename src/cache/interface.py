@@ -0,0 +1,15 @@
+from typing import Protocol, Sequence
+
+
+class ICache(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]: ...
+
+    async def set(
+        self, key: str, value: bytes, ttl: float | None = None
+    ) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+    async def close(self) -> None: ...
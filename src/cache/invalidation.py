@@ -0,0 +1,203 @@
+import asyncio
+import inspect
+import json
+from collections import defaultdict
+from typing import Any, Callable
+from uuid import uuid4
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import logger
+from src.core.utils.background import run_in_background
+from src.monitoring.metrics import INVALIDATION_MESSAGES
+
+# Called with the changed entity's ID, or with None when everything cached
+# about the entity has to go (after the listener missed messages)
+InvalidationCallback = Callable[[int | None], Any]
+
+MAX_RECONNECT_DELAY = 30.0
+
+NOTIFY_MANY = text(
+    "SELECT pg_notify(:channel, payload) "
+    "FROM unnest(CAST(:payloads AS text[])) AS payload"
+)
+
+
+class InvalidationBus:
+    """Tells the other workers which entities changed, over LISTEN/NOTIFY.
+
+    Writers call ``notify`` inside their transaction, so Postgres delivers
+    the message only once the change is committed and drops it on rollback.
+    Every worker keeps one dedicated asyncpg connection listening on
+    ``channel`` and hands the messages of other workers to the callbacks
+    registered for the entity. Its own writes are already invalidated by
+    the after-commit hooks and are skipped. A disabled bus neither notifies
+    nor listens.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        connect_kwargs: dict[str, Any],
+        enabled: bool = True,
+        reconnect_delay: float = 1.0,
+        health_check_interval: float = 30.0
+    ) -> None:
+        self.enabled = enabled
+        self.channel = channel
+        self.connect_kwargs = connect_kwargs
+        self.reconnect_delay = reconnect_delay
+        self.health_check_interval = health_check_interval
+        self.origin = uuid4().hex
+        self._callbacks: defaultdict[str, list[InvalidationCallback]] = (
+            defaultdict(list)
+        )
+        self._task: asyncio.Task | None = None
+
+    def register(self, entity: str, callback: InvalidationCallback) -> None:
+        self._callbacks[entity].append(callback)
+
+    async def notify(
+        self, session: AsyncSession, entity: str, *entity_ids: int
+    ) -> None:
+        if not self.enabled or not entity_ids:
+            return
+
+        payloads = [
+            json.dumps(
+                {"entity": entity, "id": entity_id, "origin": self.origin}
+            )
+            for entity_id in entity_ids
+        ]
+        # One statement however many rows changed
+        await session.execute(
+            NOTIFY_MANY, {"channel": self.channel, "payloads": payloads}
+        )
+
+    async def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._start_listener(connected_before=False)
+
+    def _start_listener(self, connected_before: bool) -> None:
+        self._task = asyncio.create_task(
+            self._listen_forever(connected_before)
+        )
+        self._task.add_done_callback(self._on_listener_done)
+
+    def _on_listener_done(self, task: asyncio.Task) -> None:
+        if task.cancelled() or task is not self._task:
+            return
+
+        # Never meant to return, a stopped listener would leave every cache
+        # of this worker stale for good
+        logger.error(
+            f"Invalidation bus: Listener stopped unexpectedly, restarting: "
+            f"{task.exception()!r}"
+        )
+        self._start_listener(connected_before=True)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Invalidation bus: Stopped listening")
+
+    async def _listen_forever(self, connected_before: bool) -> None:
+        delay = self.reconnect_delay
+
+        while True:
+            # Any error, asyncpg.InterfaceError included, only costs a
+            # reconnect, the listener must outlive them all
+            try:
+                conn = await asyncpg.connect(**self.connect_kwargs)
+            except Exception as e:
+                logger.warning(
+                    f"Invalidation bus: Failed to connect, retrying in "
+                    f"{delay:.1f}s: {e!r}"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+                continue
+
+            try:
+                await conn.add_listener(self.channel, self._on_notification)
+                logger.info(
+                    f"Invalidation bus: Listening on channel '{self.channel}'"
+                )
+                delay = self.reconnect_delay
+
+                # Messages sent while disconnected are lost for good
+                if connected_before:
+                    self._dispatch_all()
+                connected_before = True
+
+                await self._wait_until_lost(conn)
+            except Exception as e:
+                logger.warning(
+                    f"Invalidation bus: Connection lost, reconnecting in "
+                    f"{delay:.1f}s: {e!r}"
+                )
+            finally:
+                conn.terminate()
+
+            # Backs off when the connection fails right after connecting
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def _wait_until_lost(self, conn: asyncpg.Connection) -> None:
+        lost = asyncio.Event()
+        conn.add_termination_listener(lambda _conn: lost.set())
+
+        while not lost.is_set():
+            try:
+                await asyncio.wait_for(
+                    lost.wait(), timeout=self.health_check_interval
+                )
+            except TimeoutError:
+                # A silently dropped TCP connection never terminates itself
+                await conn.execute("SELECT 1", timeout=self.reconnect_delay)
+
+        logger.warning("Invalidation bus: Connection was closed")
+
+    def _on_notification(
+        self, _conn: asyncpg.Connection, _pid: int, _channel: str, payload: str
+    ) -> None:
+        try:
+            message = json.loads(payload)
+            entity, entity_id = message["entity"], message["id"]
+        except (ValueError, KeyError) as e:
+            logger.error(f"Invalidation bus: Malformed message {payload}: {e}")
+            return
+
+        if message.get("origin") == self.origin:
+            return
+
+        INVALIDATION_MESSAGES.labels(entity=entity).inc()
+        logger.debug(f"Invalidation bus: {entity} {entity_id} changed")
+        self._dispatch(entity, entity_id)
+
+    def _dispatch_all(self) -> None:
+        logger.info("Invalidation bus: Dropping every registered cache")
+        for entity in self._callbacks:
+            self._dispatch(entity, None)
+
+    def _dispatch(self, entity: str, entity_id: int | None) -> None:
+        for callback in self._callbacks.get(entity, ()):
+            try:
+                result = callback(entity_id)
+                if inspect.isawaitable(result):
+                    run_in_background(
+                        result, f"Invalidation bus: {entity} callback"
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Invalidation bus: {entity} callback failed: {e}"
+                )
@@ -0,0 +1,97 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+from src.core.logging import logger
+from src.monitoring.metrics import CACHE_HITS, CACHE_MISSES, CACHE_EVICTIONS
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLLRUCache(Generic[K, V]):
+    """Bounded per-process cache with a TTL on every entry.
+
+    Once ``maxsize`` entries are stored, the least recently used one is
+    evicted to make room. Hits, misses and evictions are counted in
+    Prometheus under the cache ``name``.
+
+    Every invalidation bumps the cache's ``generation``. A loader reads it
+    before loading and passes it to ``set``, which drops the value when its
+    key was invalidated meanwhile, so a load racing with a write cannot
+    store the old value. The last ``maxsize`` invalidated keys are
+    remembered, a load older than the ones forgotten is dropped for any key.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl_seconds: float) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self.generation = 0
+        self._invalidated_at: OrderedDict[K, int] = OrderedDict()
+        self._forgotten_through = 0
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                CACHE_HITS.labels(cache=self.name).inc()
+                return value
+            del self._entries[key]
+
+        CACHE_MISSES.labels(cache=self.name).inc()
+        return None
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl_seconds: float | None = None,
+        generation: int | None = None
+    ) -> None:
+        if generation is not None and self._is_outdated(key, generation):
+            logger.debug(
+                f"Cache {self.name}: Discarding outdated value of key {key}"
+            )
+            return
+
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (value, time.monotonic() + ttl_seconds)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            CACHE_EVICTIONS.labels(cache=self.name).inc()
+
+    def delete(self, key: K) -> None:
+        # Recorded even when nothing is cached, a load may be in flight
+        self.generation += 1
+        self._invalidated_at[key] = self.generation
+        self._invalidated_at.move_to_end(key)
+
+        while len(self._invalidated_at) > self.maxsize:
+            _key, generation = self._invalidated_at.popitem(last=False)
+            self._forgotten_through = generation
+
+        if self._entries.pop(key, None) is not None:
+            logger.debug(f"Cache {self.name}: Key {key} was invalidated")
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._invalidated_at.clear()
+        self._forgotten_through = self.generation
+        self._entries.clear()
+        logger.debug(f"Cache {self.name}: All keys were invalidated")
+
+    def _is_outdated(self, key: K, generation: int) -> bool:
+        return (
+            generation < self._forgotten_through
+            or self._invalidated_at.get(key, 0) > generation
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
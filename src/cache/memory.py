@@ -0,0 +1,34 @@
+from typing import Sequence
+
+from src.cache.lru import TTLLRUCache
+
+
+class InMemoryCache:
+    """ICache kept in the worker's memory, nothing is shared between
+    workers. Used when no Redis is configured and in local runs."""
+
+    def __init__(self, maxsize: int, default_ttl: float) -> None:
+        self._lru: TTLLRUCache[str, bytes] = TTLLRUCache(
+            "memory", maxsize=maxsize, ttl_seconds=default_ttl
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        return self._lru.get(key)
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        return [self._lru.get(key) for key in keys]
+
+    async def set(
+        self, key: str, value: bytes, ttl: float | None = None
+    ) -> None:
+        self._lru.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._lru.delete(key)
+
+    def clear(self) -> None:
+        self._lru.clear()
+
+    async def close(self) -> None:
+        self.clear()
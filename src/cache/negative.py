@@ -0,0 +1,56 @@
+from src.cache.interface import ICache
+from src.core.logging import logger
+from src.exceptions.cache import CacheBackendError
+from src.monitoring.metrics import NEGATIVE_CACHE_HITS
+
+
+class NegativeCache:
+    """Remembers ids that were looked up and not found.
+
+    Entries live for a short ``ttl`` and are meant to be forgotten as soon
+    as a row with that id is committed. A failing backend only means the
+    lookup goes to the database.
+    """
+
+    def __init__(self, cache: ICache, ttl: float) -> None:
+        self.cache = cache
+        self.ttl = ttl
+
+    @staticmethod
+    def key(entity: str, entity_id: int) -> str:
+        return f"missing:{entity}:{entity_id}"
+
+    async def is_missing(
+        self, entity: str, entity_id: int, record_hit: bool = True
+    ) -> bool:
+        """Pass ``record_hit=False`` for a check that does not answer the
+        request itself, so each absorbed lookup is counted once."""
+        try:
+            missing = await self.cache.get(self.key(entity, entity_id))
+        except CacheBackendError as e:
+            logger.warning(f"Negative cache: Failed to read {entity}: {e}")
+            return False
+
+        if missing is None:
+            return False
+
+        if record_hit:
+            NEGATIVE_CACHE_HITS.labels(entity=entity).inc()
+        return True
+
+    async def remember(self, entity: str, entity_id: int) -> None:
+        try:
+            await self.cache.set(self.key(entity, entity_id), b"1", self.ttl)
+        except CacheBackendError as e:
+            logger.warning(f"Negative cache: Failed to write {entity}: {e}")
+
+    async def forget(self, entity: str, *entity_ids: int) -> None:
+        if not entity_ids:
+            return
+
+        try:
+            await self.cache.delete(
+                *(self.key(entity, entity_id) for entity_id in entity_ids)
+            )
+        except CacheBackendError as e:
+            logger.warning(f"Negative cache: Failed to delete {entity}: {e}")
@@ -0,0 +1,23 @@
+from typing import Sequence
+
+
+class NullCache:
+    """ICache that stores nothing, every read is a miss. Stands in for a
+    cache that could not be kept coherent."""
+
+    async def get(self, key: str) -> bytes | None:
+        return None
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        return [None] * len(keys)
+
+    async def set(
+        self, key: str, value: bytes, ttl: float | None = None
+    ) -> None:
+        pass
+
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
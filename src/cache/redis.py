@@ -0,0 +1,93 @@
+from typing import Awaitable, Sequence, TypeVar
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from redis.exceptions import RedisError
+
+from src.core.logging import logger
+from src.exceptions.cache import CacheBackendError
+
+T = TypeVar("T")
+
+
+def create_redis_client(
+    host: str,
+    port: int,
+    db: int = 0,
+    password: str | None = None,
+    max_connections: int = 10,
+    timeout: float = 0.5
+) -> Redis:
+    # Callers wait up to `timeout` for a free connection instead of opening
+    # more, and a dropped pooled connection is retried once on a fresh one
+    pool = BlockingConnectionPool(
+        host=host,
+        port=port,
+        db=db,
+        password=password,
+        max_connections=max_connections,
+        timeout=timeout,
+        socket_timeout=timeout,
+        socket_connect_timeout=timeout,
+        retry=Retry(NoBackoff(), 1)
+    )
+    return Redis(connection_pool=pool)
+
+
+class RedisCache:
+    """ICache on a redis-py asyncio client, for Redis, Valkey or another
+    server speaking the Redis protocol.
+
+    Keys get ``key_prefix`` and every client error, timeouts included, is
+    raised as CacheBackendError.
+    """
+
+    def __init__(
+        self, client: Redis, key_prefix: str = "", default_ttl: float = 60.0
+    ) -> None:
+        self.client = client
+        self.key_prefix = key_prefix
+        self.default_ttl = default_ttl
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._call("GET", self.client.get(self.key_prefix + key))
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return await self._call(
+            "MGET", self.client.mget([self.key_prefix + key for key in keys])
+        )
+
+    async def set(
+        self, key: str, value: bytes, ttl: float | None = None
+    ) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        await self._call(
+            "SET",
+            self.client.set(
+                self.key_prefix + key, value, px=max(int(ttl * 1000), 1)
+            )
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._call(
+                "DEL",
+                self.client.delete(*(self.key_prefix + key for key in keys))
+            )
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        await self.client.connection_pool.disconnect()
+        logger.info("Redis cache: Closed connections")
+
+    @staticmethod
+    async def _call(command: str, call: Awaitable[T]) -> T:
+        try:
+            return await call
+        except RedisError as e:
+            raise CacheBackendError(
+                f"{command} failed: {type(e).__name__} {e}"
+            ) from e
@@ -0,0 +1,120 @@
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Sequence
+
+from src.cache.interface import ICache
+from src.core.logging import logger
+from src.exceptions.cache import CacheBackendError
+from src.monitoring.metrics import CACHE_HITS, CACHE_MISSES
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+class ResponseCache:
+    """Rendered responses kept on the shared cache and purged by tag.
+
+    Every tag has a version. An entry records the versions of its tags at
+    the time it was rendered and is stale once any of them was purged, so a
+    purge is one write no matter how many entries carry the tag.
+    """
+
+    def __init__(self, cache: ICache, tag_ttl: float) -> None:
+        self.cache = cache
+        self.tag_ttl = tag_ttl
+
+    async def lookup(
+        self, key: str, tags: Sequence[str]
+    ) -> tuple[CachedResponse | None, list[str]]:
+        """Return the fresh entry under ``key``, if any, and the current
+        versions of ``tags`` to store a newly rendered response with."""
+        try:
+            raw, *versions = await self.cache.mget(
+                [self._entry_key(key), *map(self._tag_key, tags)]
+            )
+            versions = await self._init_missing_versions(tags, versions)
+        except CacheBackendError as e:
+            logger.warning(f"Response cache: Failed to read {key}: {e}")
+            return None, []
+
+        entry = self._decode(raw, versions) if raw is not None else None
+
+        if entry is None:
+            CACHE_MISSES.labels(cache="response").inc()
+        else:
+            CACHE_HITS.labels(cache="response").inc()
+        return entry, versions
+
+    async def store(
+        self,
+        key: str,
+        response: CachedResponse,
+        versions: list[str],
+        ttl: float
+    ) -> None:
+        # Versions could not be read, the entry could not be validated
+        if not versions:
+            return
+
+        meta = json.dumps({
+            "status_code": response.status_code,
+            "headers": response.headers,
+            "versions": versions
+        }).encode()
+
+        try:
+            await self.cache.set(
+                self._entry_key(key), meta + b"\n" + response.body, ttl
+            )
+        except CacheBackendError as e:
+            logger.warning(f"Response cache: Failed to write {key}: {e}")
+
+    async def purge(self, *tags: str) -> None:
+        try:
+            for tag in tags:
+                await self._bump(tag)
+        except CacheBackendError as e:
+            logger.warning(f"Response cache: Failed to purge {tags}: {e}")
+            return
+        logger.debug(f"Response cache: Purged tags {tags}")
+
+    async def _init_missing_versions(
+        self, tags: Sequence[str], versions: list[bytes | None]
+    ) -> list[str]:
+        # An entry must never record a missing version, or a purge followed
+        # by the tag expiring would make it look fresh again
+        return [
+            version.decode() if version is not None else await self._bump(tag)
+            for tag, version in zip(tags, versions)
+        ]
+
+    async def _bump(self, tag: str) -> str:
+        version = uuid.uuid4().hex
+        await self.cache.set(self._tag_key(tag), version.encode(), self.tag_ttl)
+        return version
+
+    @staticmethod
+    def _decode(raw: bytes, versions: list[str]) -> CachedResponse | None:
+        meta, _, body = raw.partition(b"\n")
+        meta = json.loads(meta)
+
+        if meta["versions"] != versions:
+            return None
+        return CachedResponse(
+            status_code=meta["status_code"],
+            headers=[tuple(header) for header in meta["headers"]],
+            body=body
+        )
+
+    @staticmethod
+    def _entry_key(key: str) -> str:
+        return f"response:{key}"
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"response_tag:{tag}"
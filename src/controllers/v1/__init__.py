@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 from src.controllers.v1 import (
-    users, meals, meal_categories, cart, cart_items, orders, tokens, health
+    users, meals, meal_categories, menu, cart, cart_items, orders, tokens,
+    health
 )
 
 api_v1_router = APIRouter(prefix="/v1")
@@ -8,6 +9,7 @@ api_v1_router = APIRouter(prefix="/v1")
 api_v1_router.include_router(health.router)
 api_v1_router.include_router(meal_categories.router)
 api_v1_router.include_router(meals.router)
+api_v1_router.include_router(menu.router)
 api_v1_router.include_router(users.router)
 api_v1_router.include_router(tokens.router)
 api_v1_router.include_router(cart.router)
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, \
+    status
 
 from src.core.dependencies.meal_category import get_meal_category_service
 from src.core.logging import logger
+from src.core.utils.conditional_get import (
+    is_not_modified, not_modified_response
+)
 from src.exceptions.meal_category import (
     MealCategoryAlreadyExistsError, MealCategoryNotFoundError,
     NoMealCategoryUpdateDataError
@@ -54,11 +58,18 @@ async def create_category(
     response_model=PaginatedMealCategoryResponse,
     description=(
         "Retrieve a paginated list of all existing meal categories. Supports "
-        "`page` (page number) and `per_page` (page size) query parameters."
+        "`page` (page number) and `per_page` (page size) query parameters. "
+        "For cursor pagination pass `next_cursor`/`prev_cursor` from the "
+        "response as `after`/`before`."
     ),
-    response_description="Paginated list of meal categories"
+    response_description="Paginated list of meal categories",
+    responses={
+        304: {"description": "Not modified since the given validators"}
+    }
 )
 async def get_categories(
+    request: Request,
+    response: Response,
     pagination_params: PaginationParams = Depends(PaginationParams),
     service: IMealCategoryService = Depends(get_meal_category_service)
 ):
@@ -67,6 +78,15 @@ async def get_categories(
         f"per_page: {pagination_params.per_page}"
     )
     try:
+        validators = await service.get_categories_validators(
+            pagination_params
+        )
+
+        if is_not_modified(request, validators):
+            logger.info("API response: Meal categories not modified")
+            return not_modified_response(validators)
+
+        response.headers.update(validators.headers)
         result = await service.get_categories(pagination_params)
         logger.info(
             f"API response: Retrieved {len(result.items)} meal categories"
@@ -83,6 +103,7 @@ async def get_categories(
     description="Retrieve details of a specific meal category by its ID.",
     response_description="Meal category details",
     responses={
+        304: {"description": "Not modified since the given validators"},
         404: {
             "model": HTTPError,
             "description": "Meal category not found"
@@ -91,10 +112,22 @@ async def get_categories(
 )
 async def get_category(
     category_id: int,
+    request: Request,
+    response: Response,
     service: IMealCategoryService = Depends(get_meal_category_service)
 ):
     logger.info(f"API request: Get meal category {category_id}")
     try:
+        validators = await service.get_category_validators(category_id)
+
+        if validators:
+            if is_not_modified(request, validators):
+                logger.info(
+                    f"API response: Meal category {category_id} not modified"
+                )
+                return not_modified_response(validators)
+            response.headers.update(validators.headers)
+
         result = await service.get_category(category_id)
         logger.info(f"API response: Meal category {category_id} was retrieved")
         return result
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, \
-    File, Form
+    File, Form, Request, Response
 
 from src.core.dependencies.meal import get_meal_service
 from src.core.logging import logger
+from src.core.utils.conditional_get import (
+    is_not_modified, not_modified_response
+)
 from src.exceptions.meal import (
     MealNotFoundError, MealAlreadyExistsError, NoMealUpdateDataError,
     MealPriceError
@@ -79,10 +82,13 @@ async def create_meal(
         "Fetch a paginated list of all meals that belong to the specified "
         "meal category. Supports `page` (page number) and "
         "`per_page` (page size) query parameters. `total` field in response "
-        "indicates the total items in this particular category."
+        "indicates the total items in this particular category. "
+        "For cursor pagination pass `next_cursor`/`prev_cursor` from the "
+        "response as `after`/`before`."
     ),
     response_description="Paginated list of meals in the category",
     responses={
+        304: {"description": "Not modified since the given validators"},
         404: {
             "model": HTTPError,
             "description": "Meal category not found"
@@ -91,6 +97,8 @@ async def create_meal(
 )
 async def get_meals(
     category_id: int,
+    request: Request,
+    response: Response,
     pagination_params: PaginationParams = Depends(PaginationParams),
     service: IMealService = Depends(get_meal_service)
 ):
@@ -99,6 +107,17 @@ async def get_meals(
         f"{pagination_params.page}, per_page: {pagination_params.per_page}"
     )
     try:
+        validators = await service.get_meals_validators(
+            category_id, pagination_params
+        )
+
+        if is_not_modified(request, validators):
+            logger.info(
+                f"API response: Meals of category {category_id} not modified"
+            )
+            return not_modified_response(validators)
+
+        response.headers.update(validators.headers)
         result = await service.get_meals_by_category_id(
             category_id, pagination_params
         )
@@ -121,6 +140,7 @@ async def get_meals(
     ),
     response_description="Details of the requested meal",
     responses={
+        304: {"description": "Not modified since the given validators"},
         404: {
             "model": HTTPError,
             "description": "Meal or category not found"
@@ -130,10 +150,20 @@ async def get_meals(
 async def get_meal(
     category_id: int,
     meal_id: int,
+    request: Request,
+    response: Response,
     service: IMealService = Depends(get_meal_service)
 ):
     logger.info(f"API request: Get meal {meal_id} from category {category_id}")
     try:
+        validators = await service.get_meal_validators(meal_id, category_id)
+
+        if validators:
+            if is_not_modified(request, validators):
+                logger.info(f"API response: Meal {meal_id} not modified")
+                return not_modified_response(validators)
+            response.headers.update(validators.headers)
+
         result = await service.get_meal(meal_id, category_id)
         logger.info(
             f"API response: Meal {meal_id} was retrieved from category {category_id}"
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, Request, Response
+
+from src.core.dependencies.menu import get_menu_service
+from src.core.logging import logger
+from src.core.utils.conditional_get import (
+    CacheValidators, is_not_modified, not_modified_response
+)
+from src.schemas.menu import MenuRead
+from src.services.menu.interface import IMenuService
+
+router = APIRouter(prefix="/menu", tags=["Menu"])
+
+
+@router.get(
+    "",
+    description=(
+        "Retrieve all meal categories with their meals in one response. "
+        "The payload is served from a pre-built snapshot and carries an "
+        "`ETag`, send it back in `If-None-Match` to get `304 Not Modified` "
+        "while the menu is unchanged."
+    ),
+    response_description="Full menu grouped by category",
+    responses={
+        200: {"model": MenuRead},
+        304: {"description": "Menu has not changed since the given ETag"}
+    }
+)
+async def get_menu(
+    request: Request,
+    service: IMenuService = Depends(get_menu_service)
+):
+    logger.info("API request: Get menu")
+    snapshot = await service.get_menu()
+    validators = CacheValidators(etag=snapshot.etag)
+
+    if is_not_modified(request, validators):
+        logger.info("API response: Menu not modified")
+        return not_modified_response(validators)
+
+    logger.info(f"API response: Menu snapshot of {len(snapshot.body)} bytes")
+    return Response(
+        content=snapshot.body,
+        media_type="application/json",
+        headers=validators.headers
+    )
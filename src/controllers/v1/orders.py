@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, \
+    status
 
 from src.core.dependencies.order import get_order_service
 from src.core.logging import logger
+from src.core.utils.conditional_get import (
+    is_not_modified, not_modified_response
+)
 from src.exceptions.cart import CartNotFoundError
 from src.exceptions.cart_item import CartItemsNotFoundError
 from src.exceptions.order import OrdersNotFound, OrderNotFound
@@ -51,6 +55,7 @@ async def create_order(
     description="Retrieve all user orders that they have made.",
     response_description="Details of the user's orders",
     responses={
+        304: {"description": "Not modified since the given validators"},
         404: {
             "model": HTTPError,
             "description": "Orders not found for this user"
@@ -59,10 +64,19 @@ async def create_order(
 )
 async def get_orders(
     user_id: int,
+    request: Request,
+    response: Response,
     service: IOrderService = Depends(get_order_service)
 ):
     logger.info(f"API request: Get orders for user {user_id}")
     try:
+        validators = await service.get_orders_validators(user_id)
+
+        if is_not_modified(request, validators):
+            logger.info(f"API response: Orders of user {user_id} not modified")
+            return not_modified_response(validators)
+
+        response.headers.update(validators.headers)
         result = await service.get_orders(user_id)
         logger.info(
             f"API response: Retrieved {len(result)} orders for user {user_id}"
@@ -81,6 +95,7 @@ async def get_orders(
     description="Retrieve specific user order.",
     response_description="Details of the user's order",
     responses={
+        304: {"description": "Not modified since the given validators"},
         404: {
             "model": HTTPError,
             "description": "Order not found for this user"
@@ -90,10 +105,20 @@ async def get_orders(
 async def get_order(
     user_id: int,
     order_id: int,
+    request: Request,
+    response: Response,
     service: IOrderService = Depends(get_order_service)
 ):
     logger.info(f"API request: Get order {order_id} for user {user_id}")
     try:
+        validators = await service.get_order_validators(user_id, order_id)
+
+        if validators:
+            if is_not_modified(request, validators):
+                logger.info(f"API response: Order {order_id} not modified")
+                return not_modified_response(validators)
+            response.headers.update(validators.headers)
+
         result = await service.get_order(user_id, order_id)
         logger.info(
             f"API response: Order {order_id} was retrieved for user {user_id}"
@@ -222,7 +222,9 @@ async def get_user_by_provider(
     response_model=PaginatedUserResponse,
     description=(
         "Retrieve a paginated list of all registered users. Supports "
-        "`page` (page number) and `per_page` (page size) query parameters."
+        "`page` (page number) and `per_page` (page size) query parameters. "
+        "For cursor pagination pass `next_cursor`/`prev_cursor` from the "
+        "response as `after`/`before`."
     ),
     response_description="Paginated list of users"
 )
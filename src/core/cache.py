@@ -0,0 +1,61 @@
+from src.cache.interface import ICache
+from src.cache.memory import InMemoryCache
+from src.cache.null import NullCache
+from src.cache.negative import NegativeCache
+from src.cache.response import ResponseCache
+from src.cache.redis import RedisCache, create_redis_client
+from src.core.config import get_settings, Settings
+from src.core.logging import logger
+
+settings = get_settings()
+
+
+def create_cache_from_settings(settings: Settings) -> ICache:
+    if settings.cache_backend == "redis":
+        logger.info(
+            f"Initializing Redis cache: {settings.redis_host}:"
+            f"{settings.redis_port}/{settings.redis_db}"
+        )
+        client = create_redis_client(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            password=settings.redis_password,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_timeout_seconds
+        )
+        return RedisCache(
+            client,
+            key_prefix=settings.cache_key_prefix,
+            default_ttl=settings.cache_default_ttl_seconds
+        )
+
+    logger.info("Initializing in-memory cache")
+    return InMemoryCache(
+        maxsize=settings.cache_memory_maxsize,
+        default_ttl=settings.cache_default_ttl_seconds
+    )
+
+
+def create_cart_cache_from_settings(
+    settings: Settings, cache: ICache
+) -> ICache:
+    # Carts are changed by the cart subscriber in the FastStream process. A
+    # per-worker memory cache hears of that only over the invalidation bus
+    if (
+        settings.cache_backend == "memory"
+        and not settings.invalidation_bus_enabled
+    ):
+        logger.warning(
+            "Carts are not cached, the memory cache backend needs the "
+            "invalidation bus to see cart changes of other processes"
+        )
+        return NullCache()
+
+    return cache
+
+
+cache = create_cache_from_settings(settings)
+cart_cache = create_cart_cache_from_settings(settings, cache)
+negative_cache = NegativeCache(cache, settings.negative_cache_ttl_seconds)
+response_cache = ResponseCache(cache, settings.response_cache_tag_ttl_seconds)
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,6 +11,11 @@ class Settings(BaseSettings):
     fastapi_version: str
 
     enable_metrics: bool
+    n_plus_one_threshold: int = 5
+    pagination_count_cache_ttl_seconds: float = 30.0
+    meal_category_cache_maxsize: int = 256
+    meal_category_cache_ttl_seconds: float = 300.0
+    singleflight_timeout_seconds: float = 2.0
 
     cors_origins: str
 
@@ -18,12 +24,56 @@ class Settings(BaseSettings):
     postgres_password: str
     postgres_host: str
     postgres_port: int
+    postgres_echo: bool = False
+    postgres_pool_size: int = 10
+    postgres_max_overflow: int = 20
+    postgres_pool_timeout: float = 30.0
+    postgres_pool_recycle: int = 1800
+    postgres_pool_pre_ping: bool = True
+    postgres_statement_timeout_ms: int = 30000
+    postgres_idle_in_transaction_timeout_ms: int = 60000
+    postgres_pgbouncer_mode: bool = False
+    postgres_statement_cache_size: int = 100
+    postgres_prepared_statement_cache_size: int = 100
+    postgres_replica_host: str | None = None
+    postgres_replica_port: int | None = None
+    postgres_replica_max_lag_seconds: float = 5.0
+    postgres_replica_lag_check_interval_seconds: float = 2.0
+    invalidation_bus_enabled: bool = True
+    invalidation_bus_channel: str = "cafe_api_invalidation"
+    invalidation_bus_host: str | None = None
+    invalidation_bus_port: int | None = None
+    invalidation_bus_reconnect_seconds: float = 1.0
+    invalidation_bus_health_check_seconds: float = 30.0
+
+    cache_backend: Literal["memory", "redis"] = "memory"
+    cache_default_ttl_seconds: float = 60.0
+    cache_memory_maxsize: int = 10000
+    cache_key_prefix: str = "cafe_api:"
+    cart_cache_ttl_seconds: float = 30.0
+    user_cache_ttl_seconds: float = 30.0
+    negative_cache_ttl_seconds: float = 10.0
+    response_cache_enabled: bool = True
+    response_cache_route_ttls: dict[str, float] = {
+        "/api/v1/meal-categories": 30.0,
+        "/api/v1/meal-categories/{category_id}": 60.0,
+        "/api/v1/meal-categories/{category_id}/meals": 30.0,
+        "/api/v1/meal-categories/{category_id}/meals/{meal_id}": 60.0
+    }
+    response_cache_tag_ttl_seconds: float = 86400.0
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    redis_db: int = 0
+    redis_password: str | None = None
+    redis_max_connections: int = 20
+    redis_timeout_seconds: float = 0.5
 
     jwt_secret_key: str
     jwt_refresh_secret_key: str
     jwt_algorithm: str
     jwt_access_token_expire_minutes: int
     jwt_refresh_token_expire_days: int
+    jwt_decode_cache_maxsize: int = 10000
 
     kafka_host: str
     kafka_port: int
@@ -31,6 +81,20 @@ class Settings(BaseSettings):
     kafka_ui_port: int
     kafka_ui_username: str
     kafka_ui_password: str
+    kafka_producer_acks: Literal["0", "1", "all"] = "1"
+    kafka_producer_linger_ms: int = 5
+    kafka_producer_max_batch_size: int = 16384
+    # The other codecs need aiokafka extras that aren't installed
+    kafka_producer_compression: Literal["gzip"] | None = None
+    kafka_subscriber_max_workers: int = 4
+    outbox_relay_batch_size: int = 100
+    outbox_relay_poll_seconds: float = 0.5
+    outbox_relay_lease_seconds: float = 30.0
+    outbox_relay_publish_timeout_seconds: float = 5.0
+    processed_events_retention_hours: float = 168.0
+    processed_events_cleanup_interval_seconds: float = 3600.0
+    cart_subscriber_batch_size: int = 500
+    cart_subscriber_batch_timeout_ms: int = 100
 
     prometheus_port: int
 
@@ -60,6 +124,26 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+    @property
+    def postgres_replica_url(self) -> str | None:
+        if not self.postgres_replica_host:
+            return None
+
+        port = self.postgres_replica_port or self.postgres_port
+        return (
+            f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
+            f"@{self.postgres_replica_host}:{port}/{self.postgres_db}"
+        )
+
+    @property
+    def postgres_server_settings(self) -> dict[str, str]:
+        return {
+            "statement_timeout": str(self.postgres_statement_timeout_ms),
+            "idle_in_transaction_session_timeout": str(
+                self.postgres_idle_in_transaction_timeout_ms
+            )
+        }
+
     @property
     def kafka_bootstrap_servers(self) -> str:
         return f"{self.kafka_host}:{self.kafka_port}"
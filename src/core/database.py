@@ -1,25 +1,168 @@
-from typing import AsyncGenerator
+import asyncio
+from time import monotonic, perf_counter
+from typing import AsyncGenerator, Any
+from uuid import uuid4
 
+from fastapi import Depends
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
-    create_async_engine, async_sessionmaker, AsyncSession
+    create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from src.core.config import get_settings
+from src.core.config import get_settings, Settings
 from src.core.logging import logger
+from src.monitoring.metrics import DB_POOL_CHECKOUT_WAIT, DB_REPLICA_LAG
 
 settings = get_settings()
 
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(self.logging_name).observe(
+                perf_counter() - start
+            )
+
+
+def unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def build_connect_args(settings: Settings) -> dict[str, Any]:
+    connect_args = {
+        "statement_cache_size": settings.postgres_statement_cache_size,
+        "prepared_statement_cache_size": (
+            settings.postgres_prepared_statement_cache_size
+        )
+    }
+
+    if settings.postgres_pgbouncer_mode:
+        # In transaction pooling mode consecutive transactions may run on
+        # different server connections, so statement names must not collide.
+        # PgBouncer also rejects unknown startup parameters, timeouts have to
+        # be configured on the database role instead.
+        connect_args["prepared_statement_name_func"] = unique_statement_name
+    else:
+        connect_args["server_settings"] = settings.postgres_server_settings
+
+    return connect_args
+
+
+def create_engine_from_settings(
+    url: str, settings: Settings, engine_name: str = "primary"
+) -> AsyncEngine:
+    return create_async_engine(
+        url=url,
+        echo=settings.postgres_echo,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=engine_name,
+        pool_size=settings.postgres_pool_size,
+        max_overflow=settings.postgres_max_overflow,
+        pool_timeout=settings.postgres_pool_timeout,
+        pool_recycle=settings.postgres_pool_recycle,
+        pool_pre_ping=settings.postgres_pool_pre_ping,
+        connect_args=build_connect_args(settings)
+    )
+
+
 logger.info(
     f"Initializing database connection to: "
     f"{settings.postgres_host}:{settings.postgres_port}"
 )
-async_engine = create_async_engine(url=settings.postgres_url, echo=True)
+async_engine = create_engine_from_settings(settings.postgres_url, settings)
 async_session = async_sessionmaker(
     bind=async_engine, autoflush=False,
     autocommit=False, expire_on_commit=False
 )
-logger.info("Database engine and session factory were created")
+logger.info(
+    f"Database engine and session factory were created "
+    f"(pool_size={settings.postgres_pool_size}, "
+    f"max_overflow={settings.postgres_max_overflow}, "
+    f"pgbouncer_mode={settings.postgres_pgbouncer_mode})"
+)
+
+replica_engine: AsyncEngine | None = None
+async_replica_session: async_sessionmaker[AsyncSession] | None = None
+
+if settings.postgres_replica_url:
+    logger.info(
+        f"Initializing read replica connection to: "
+        f"{settings.postgres_replica_host}:"
+        f"{settings.postgres_replica_port or settings.postgres_port}"
+    )
+    replica_engine = create_engine_from_settings(
+        settings.postgres_replica_url, settings, "replica"
+    )
+    async_replica_session = async_sessionmaker(
+        bind=replica_engine, autoflush=False,
+        autocommit=False, expire_on_commit=False
+    )
+    logger.info("Read replica engine and session factory were created")
+
+
+class ReplicaLagChecker:
+    LAG_QUERY = text(
+        "SELECT CASE "
+        "WHEN NOT pg_is_in_recovery() "
+        "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE("
+        "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0"
+        ") END"
+    )
+
+    def __init__(
+        self, engine: AsyncEngine, max_lag: float, check_interval: float
+    ) -> None:
+        self.engine = engine
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._checked_at: float | None = None
+        self._usable = False
+
+    async def is_usable(self) -> bool:
+        now = monotonic()
+        if (
+            self._checked_at is not None
+            and now - self._checked_at < self.check_interval
+        ):
+            return self._usable
+
+        self._checked_at = now
+        try:
+            async with asyncio.timeout(self.check_interval):
+                async with self.engine.connect() as conn:
+                    lag = float(await conn.scalar(self.LAG_QUERY))
+            DB_REPLICA_LAG.set(lag)
+            self._usable = lag <= self.max_lag
+
+            if not self._usable:
+                logger.warning(
+                    f"Read replica lags {lag:.2f}s behind the primary, "
+                    f"routing reads to the primary"
+                )
+        except Exception as e:
+            logger.warning(
+                f"Read replica lag check failed, routing reads to the "
+                f"primary: {e}"
+            )
+            self._usable = False
+
+        return self._usable
+
+
+replica_lag_checker = (
+    ReplicaLagChecker(
+        replica_engine,
+        settings.postgres_replica_max_lag_seconds,
+        settings.postgres_replica_lag_check_interval_seconds
+    )
+    if replica_engine else None
+)
 
 
 class Base(DeclarativeBase):
@@ -43,3 +186,18 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             logger.debug("Database session was closed")
+
+
+async def get_read_session(
+    primary_session: AsyncSession = Depends(get_session)
+) -> AsyncGenerator[AsyncSession, None]:
+    if replica_lag_checker is None or not await replica_lag_checker.is_usable():
+        yield primary_session
+        return
+
+    logger.debug("Creating new read replica session")
+    async with async_replica_session() as session:
+        try:
+            yield session
+        finally:
+            logger.debug("Read replica session was closed")
@@ -0,0 +1,22 @@
+from src.cache.interface import ICache
+from src.cache.negative import NegativeCache
+from src.cache.response import ResponseCache
+from src.core.cache import (
+    cache, cart_cache, negative_cache, response_cache
+)
+
+
+def get_cache() -> ICache:
+    return cache
+
+
+def get_cart_cache() -> ICache:
+    return cart_cache
+
+
+def get_negative_cache() -> NegativeCache:
+    return negative_cache
+
+
+def get_response_cache() -> ResponseCache:
+    return response_cache
@@ -1,8 +1,12 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache.interface import ICache
 from src.core.database import get_session
+from src.core.dependencies.cache import get_cart_cache
+from src.core.dependencies.unit_of_work import get_unit_of_work
 from src.repositories.interfaces.cart import ICartRepository
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
 from src.repositories.sqlalchemy.cart import SQLAlchemyCartRepository
 from src.services.cart.interface import ICartService
 from src.services.cart.service import CartService
@@ -15,6 +19,8 @@ def get_cart_repo(
 
 
 def get_cart_service(
-    repository: ICartRepository = Depends(get_cart_repo)
+    repository: ICartRepository = Depends(get_cart_repo),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+    cache: ICache = Depends(get_cart_cache)
 ) -> ICartService:
-    return CartService(repository)
+    return CartService(repository, uow, cache)
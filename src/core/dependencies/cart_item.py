@@ -5,8 +5,10 @@ from src.core.database import get_session
 from src.core.dependencies.cart import get_cart_service
 from src.core.dependencies.meal import get_meal_service
 from src.core.dependencies.message_broker import get_event_publisher
+from src.core.dependencies.unit_of_work import get_unit_of_work
 from src.message_broker.publisher.interface import IEventPublisher
 from src.repositories.interfaces.cart_item import ICartItemRepository
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
 from src.repositories.sqlalchemy.cart_item import SQLAlchemyCartItemRepository
 from src.services.cart.interface import ICartService
 from src.services.cart_item.interface import ICartItemService
@@ -24,6 +26,9 @@ def get_cart_item_service(
     repository: ICartItemRepository = Depends(get_cart_item_repo),
     cart_service: ICartService = Depends(get_cart_service),
     meal_service: IMealService = Depends(get_meal_service),
-    publisher: IEventPublisher = Depends(get_event_publisher)
+    publisher: IEventPublisher = Depends(get_event_publisher),
+    uow: IUnitOfWork = Depends(get_unit_of_work)
 ) -> ICartItemService:
-    return CartItemService(repository, cart_service, meal_service, publisher)
+    return CartItemService(
+        repository, cart_service, meal_service, publisher, uow
+    )
@@ -1,25 +1,45 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_session
+from src.cache.negative import NegativeCache
+from src.cache.response import ResponseCache
+from src.core.database import get_session, get_read_session
+from src.core.dependencies.cache import (
+    get_negative_cache, get_response_cache
+)
 from src.core.dependencies.meal_category import get_meal_category_service
+from src.core.dependencies.menu import get_menu_snapshot_store
+from src.core.dependencies.singleflight import get_singleflight
+from src.core.dependencies.unit_of_work import get_unit_of_work
+from src.core.utils.singleflight import SingleFlight
 from src.repositories.interfaces.meal import IMealRepository
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
 from src.repositories.sqlalchemy.meal import SQLAlchemyMealRepository
 from src.services.meal.interface import IMealService
 from src.services.meal.service import MealService
 from src.services.meal_category.interface import IMealCategoryService
+from src.services.menu.snapshot import MenuSnapshotStore
 
 
 def get_meal_repo(
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_session),
+    read_db: AsyncSession = Depends(get_read_session)
 ) -> IMealRepository:
-    return SQLAlchemyMealRepository(db)
+    return SQLAlchemyMealRepository(db, read_db)
 
 
 def get_meal_service(
     repository: IMealRepository = Depends(get_meal_repo),
     category_service: IMealCategoryService = Depends(
         get_meal_category_service
-    )
+    ),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+    menu_snapshot_store: MenuSnapshotStore = Depends(get_menu_snapshot_store),
+    singleflight: SingleFlight = Depends(get_singleflight),
+    negative_cache: NegativeCache = Depends(get_negative_cache),
+    response_cache: ResponseCache = Depends(get_response_cache)
 ) -> IMealService:
-    return MealService(repository, category_service)
+    return MealService(
+        repository, category_service, uow, menu_snapshot_store, singleflight,
+        negative_cache, response_cache
+    )
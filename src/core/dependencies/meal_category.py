@@ -1,24 +1,54 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_session
+from src.cache.lru import TTLLRUCache
+from src.cache.negative import NegativeCache
+from src.cache.response import ResponseCache
+from src.core.database import get_session, get_read_session
+from src.core.dependencies.cache import (
+    get_negative_cache, get_response_cache
+)
+from src.core.dependencies.menu import get_menu_snapshot_store
+from src.core.dependencies.singleflight import get_singleflight
+from src.core.dependencies.unit_of_work import get_unit_of_work
+from src.core.utils.singleflight import SingleFlight
 from src.repositories.interfaces.meal_category import IMealCategoryRepository
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
 from src.repositories.sqlalchemy.meal_category import (
     SQLAlchemyMealCategoryRepository
 )
+from src.schemas.meal_category import MealCategoryRead
+from src.services.meal_category.cache import meal_category_cache
 from src.services.meal_category.interface import IMealCategoryService
 from src.services.meal_category.service import MealCategoryService
+from src.services.menu.snapshot import MenuSnapshotStore
 
 
 def get_meal_category_repo(
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_session),
+    read_db: AsyncSession = Depends(get_read_session)
 ) -> IMealCategoryRepository:
-    return SQLAlchemyMealCategoryRepository(db)
+    return SQLAlchemyMealCategoryRepository(db, read_db)
+
+
+def get_meal_category_cache() -> TTLLRUCache[int, MealCategoryRead]:
+    return meal_category_cache
 
 
 def get_meal_category_service(
     category_repo: IMealCategoryRepository = Depends(
         get_meal_category_repo
-    )
+    ),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+    cache: TTLLRUCache[int, MealCategoryRead] = Depends(
+        get_meal_category_cache
+    ),
+    menu_snapshot_store: MenuSnapshotStore = Depends(get_menu_snapshot_store),
+    singleflight: SingleFlight = Depends(get_singleflight),
+    negative_cache: NegativeCache = Depends(get_negative_cache),
+    response_cache: ResponseCache = Depends(get_response_cache)
 ) -> IMealCategoryService:
-    return MealCategoryService(category_repo)
+    return MealCategoryService(
+        category_repo, uow, cache, menu_snapshot_store, singleflight,
+        negative_cache, response_cache
+    )
@@ -0,0 +1,24 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_session
+from src.repositories.interfaces.menu import IMenuRepository
+from src.repositories.sqlalchemy.menu import SQLAlchemyMenuRepository
+from src.services.menu.interface import IMenuService
+from src.services.menu.service import MenuService
+from src.services.menu.snapshot import MenuSnapshotStore, menu_snapshot_store
+
+
+def get_menu_repo(db: AsyncSession = Depends(get_session)) -> IMenuRepository:
+    return SQLAlchemyMenuRepository(db)
+
+
+def get_menu_snapshot_store() -> MenuSnapshotStore:
+    return menu_snapshot_store
+
+
+def get_menu_service(
+    repository: IMenuRepository = Depends(get_menu_repo),
+    snapshot_store: MenuSnapshotStore = Depends(get_menu_snapshot_store)
+) -> IMenuService:
+    return MenuService(repository, snapshot_store)
@@ -1,20 +1,22 @@
 from fastapi import Depends
-from faststream.kafka import KafkaBroker
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.message_broker.broker.interface import IMessageBroker
-from src.message_broker.broker.kafka import KafkaMessageBroker
-from src.message_broker.config import get_kafka_broker
-from src.message_broker.publisher.event_publisher import EventPublisher
+from src.core.database import get_session
 from src.message_broker.publisher.interface import IEventPublisher
+from src.message_broker.publisher.outbox import OutboxEventPublisher
+from src.repositories.interfaces.outbox import IOutboxRepository
+from src.repositories.sqlalchemy.outbox import SQLAlchemyOutboxRepository
 
 
-async def get_message_broker(
-    broker: KafkaBroker = Depends(get_kafka_broker)
-) -> IMessageBroker:
-    return KafkaMessageBroker(broker)
+def get_outbox_repo(
+    db: AsyncSession = Depends(get_session)
+) -> IOutboxRepository:
+    return SQLAlchemyOutboxRepository(db)
 
 
+# Events are committed with the request's changes and relayed to Kafka by
+# the FastStream app, requests never wait for the broker
 async def get_event_publisher(
-    broker: IMessageBroker = Depends(get_message_broker)
+    repository: IOutboxRepository = Depends(get_outbox_repo)
 ) -> IEventPublisher:
-    return EventPublisher(broker)
+    return OutboxEventPublisher(repository)
@@ -5,7 +5,9 @@ from src.core.database import get_session
 from src.core.dependencies.cart import get_cart_service
 from src.core.dependencies.cart_item import get_cart_item_service
 from src.core.dependencies.order_item import get_order_item_service
+from src.core.dependencies.unit_of_work import get_unit_of_work
 from src.repositories.interfaces.order import IOrderRepository
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
 from src.repositories.sqlalchemy.order import SQLAlchemyOrderRepository
 from src.services.cart.interface import ICartService
 from src.services.cart_item.interface import ICartItemService
@@ -24,8 +26,9 @@ def get_order_service(
     repository: IOrderRepository = Depends(get_order_repo),
     cart_service: ICartService = Depends(get_cart_service),
     cart_item_service: ICartItemService = Depends(get_cart_item_service),
-    order_item_service: IOrderItemService = Depends(get_order_item_service)
+    order_item_service: IOrderItemService = Depends(get_order_item_service),
+    uow: IUnitOfWork = Depends(get_unit_of_work)
 ) -> IOrderService:
     return OrderService(
-        repository, cart_service, cart_item_service, order_item_service
+        repository, cart_service, cart_item_service, order_item_service, uow
     )
@@ -0,0 +1,5 @@
+from src.core.utils.singleflight import SingleFlight, singleflight
+
+
+def get_singleflight() -> SingleFlight:
+    return singleflight
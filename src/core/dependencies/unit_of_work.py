@@ -0,0 +1,12 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_session
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
+from src.repositories.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+
+
+def get_unit_of_work(
+    db: AsyncSession = Depends(get_session)
+) -> IUnitOfWork:
+    return SQLAlchemyUnitOfWork(db)
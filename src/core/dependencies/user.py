@@ -1,14 +1,19 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache.interface import ICache
+from src.cache.negative import NegativeCache
 from src.core.database import get_session
+from src.core.dependencies.cache import get_cache, get_negative_cache
 from src.core.dependencies.message_broker import get_event_publisher
+from src.core.dependencies.unit_of_work import get_unit_of_work
 from src.message_broker.publisher.interface import IEventPublisher
 from src.repositories.interfaces.user_identity import IUserIdentityRepository
 from src.repositories.sqlalchemy.user_identity import (
     SQLAlchemyUserIdentityRepository
 )
 from src.repositories.interfaces.user import IUserRepository
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
 from src.repositories.sqlalchemy.user import SQLAlchemyUserRepository
 from src.services.user.identity.interface import IUserIdentityService
 from src.services.user.identity.service import UserIdentityService
@@ -25,9 +30,10 @@ def get_user_identity_repo(
 def get_user_identity_service(
     user_identity_repo: IUserIdentityRepository = Depends(
         get_user_identity_repo
-    )
+    ),
+    uow: IUnitOfWork = Depends(get_unit_of_work)
 ) -> IUserIdentityService:
-    return UserIdentityService(user_identity_repo)
+    return UserIdentityService(user_identity_repo, uow)
 
 
 def get_user_repo(
@@ -41,6 +47,12 @@ def get_user_service(
     user_identity_service: IUserIdentityService = Depends(
         get_user_identity_service
     ),
-    publisher: IEventPublisher = Depends(get_event_publisher)
+    publisher: IEventPublisher = Depends(get_event_publisher),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+    cache: ICache = Depends(get_cache),
+    negative_cache: NegativeCache = Depends(get_negative_cache)
 ) -> IUserService:
-    return UserService(repository, user_identity_service, publisher)
+    return UserService(
+        repository, user_identity_service, publisher, uow, cache,
+        negative_cache
+    )
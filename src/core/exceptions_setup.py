@@ -2,6 +2,9 @@ from src.exceptions.handlers.cart_item import (
     register_cart_items_exception_handlers
 )
 from src.exceptions.handlers.meal import register_meals_exception_handlers
+from src.exceptions.handlers.pagination import (
+    register_pagination_exception_handlers
+)
 from src.exceptions.handlers.user import register_users_exception_handlers
 
 
@@ -9,3 +12,4 @@ def setup_exception_handlers(app):
     register_cart_items_exception_handlers(app)
     register_users_exception_handlers(app)
     register_meals_exception_handlers(app)
+    register_pagination_exception_handlers(app)
@@ -0,0 +1,20 @@
+from src.cache.invalidation import InvalidationBus
+from src.core.config import get_settings
+
+settings = get_settings()
+
+# LISTEN needs a session of its own, so behind PgBouncer in transaction
+# mode the listener has to reach Postgres directly
+invalidation_bus = InvalidationBus(
+    channel=settings.invalidation_bus_channel,
+    connect_kwargs={
+        "host": settings.invalidation_bus_host or settings.postgres_host,
+        "port": settings.invalidation_bus_port or settings.postgres_port,
+        "user": settings.postgres_user,
+        "password": settings.postgres_password,
+        "database": settings.postgres_db
+    },
+    enabled=settings.invalidation_bus_enabled,
+    reconnect_delay=settings.invalidation_bus_reconnect_seconds,
+    health_check_interval=settings.invalidation_bus_health_check_seconds
+)
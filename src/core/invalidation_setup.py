@@ -0,0 +1,93 @@
+from src.cache.invalidation import InvalidationBus
+from src.cache.memory import InMemoryCache
+from src.core.cache import cache, negative_cache, response_cache
+from src.core.utils.count_cache import count_cache
+from src.services.cart.service import CART_CACHE_KEY
+from src.services.meal.service import MEAL_TAG, MEALS_TAG
+from src.services.meal_category.cache import meal_category_cache
+from src.services.meal_category.service import CATEGORIES_TAG, CATEGORY_TAG
+from src.services.menu.snapshot import menu_snapshot_store
+from src.services.user.service import USER_CACHE_KEY
+
+
+def setup_invalidation_handlers(bus: InvalidationBus) -> None:
+    bus.register("meal_category", drop_meal_category)
+    bus.register("category_meals", drop_category_meals)
+    bus.register("user", drop_user_count)
+
+    # A Redis backend is shared, the writer has already updated it
+    if isinstance(cache, InMemoryCache):
+        bus.register("meal_category", drop_cached_meal_category)
+        bus.register("meal", drop_cached_meal)
+        bus.register("category_meals", drop_cached_category_meals)
+        bus.register("user", drop_cached_user)
+        bus.register("cart", drop_cached_cart)
+
+
+def drop_meal_category(category_id: int | None) -> None:
+    if category_id is None:
+        meal_category_cache.clear()
+    else:
+        meal_category_cache.delete(category_id)
+
+    menu_snapshot_store.invalidate()
+    count_cache.invalidate("meal_categories")
+    # Deleting a category deletes its meals
+    count_cache.invalidate("meals:")
+
+
+def drop_category_meals(_category_id: int | None) -> None:
+    menu_snapshot_store.invalidate()
+    count_cache.invalidate("meals:")
+
+
+def drop_user_count(_user_id: int | None) -> None:
+    count_cache.invalidate("users")
+
+
+async def drop_cached_meal_category(category_id: int | None) -> None:
+    if category_id is None:
+        cache.clear()
+        return
+
+    await negative_cache.forget("meal_category", category_id)
+    await response_cache.purge(
+        CATEGORIES_TAG, CATEGORY_TAG.format(category_id=category_id)
+    )
+
+
+async def drop_cached_meal(meal_id: int | None) -> None:
+    if meal_id is None:
+        cache.clear()
+        return
+
+    await negative_cache.forget("meal", meal_id)
+    await response_cache.purge(MEAL_TAG.format(meal_id=meal_id))
+
+
+async def drop_cached_category_meals(category_id: int | None) -> None:
+    if category_id is None:
+        cache.clear()
+        return
+
+    await response_cache.purge(MEALS_TAG.format(category_id=category_id))
+
+
+async def drop_cached_user(user_id: int | None) -> None:
+    if user_id is None:
+        cache.clear()
+        return
+
+    await negative_cache.forget("user", user_id)
+    await cache.delete(
+        USER_CACHE_KEY.format(user_id=user_id),
+        CART_CACHE_KEY.format(user_id=user_id)
+    )
+
+
+async def drop_cached_cart(user_id: int | None) -> None:
+    if user_id is None:
+        cache.clear()
+        return
+
+    await cache.delete(CART_CACHE_KEY.format(user_id=user_id))
@@ -2,6 +2,9 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.core.cache import cache
+from src.core.invalidation import invalidation_bus
+from src.core.invalidation_setup import setup_invalidation_handlers
 from src.core.logging import logger
 from src.message_broker.config import kafka_broker
 
@@ -12,6 +15,9 @@ async def lifespan(app: FastAPI):
     logger.info("Initializing Kafka broker...")
     await kafka_broker.start()
     logger.info("Kafka broker started successfully")
+    setup_invalidation_handlers(invalidation_bus)
+    await invalidation_bus.start()
+    logger.info("Cache invalidation bus was started")
 
     yield
 
@@ -19,3 +25,5 @@ async def lifespan(app: FastAPI):
     logger.info("Stopping Kafka broker...")
     await kafka_broker.stop()
     logger.info("Kafka broker stopped successfully")
+    await invalidation_bus.stop()
+    await cache.close()
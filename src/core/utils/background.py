@@ -0,0 +1,22 @@
+import asyncio
+from typing import Awaitable
+
+from src.core.logging import logger
+
+# Strong references, the event loop only keeps weak ones to its tasks
+_tasks: set[asyncio.Task] = set()
+
+
+def run_in_background(awaitable: Awaitable, name: str) -> None:
+    """Schedule ``awaitable`` without waiting for it. Failures are logged
+    under ``name`` instead of being lost with the task."""
+    task = asyncio.ensure_future(awaitable)
+    _tasks.add(task)
+
+    def on_done(done: asyncio.Task) -> None:
+        _tasks.discard(done)
+
+        if not done.cancelled() and done.exception() is not None:
+            logger.error(f"{name} failed: {done.exception()}")
+
+    task.add_done_callback(on_done)
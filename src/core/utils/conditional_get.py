@@ -0,0 +1,74 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    etag: str
+    last_modified: datetime | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                _as_utc(self.last_modified), usegmt=True
+            )
+        return headers
+
+
+def build_validators(
+    last_modified: datetime | None, *parts: object
+) -> CacheValidators:
+    """Derive validators from the version of what a response is built from.
+
+    ``parts`` has to cover everything else the body depends on (IDs, query
+    parameters, row counts), so equal ETags mean byte-identical bodies.
+    """
+    digest = hashlib.sha256(repr((last_modified, parts)).encode()).hexdigest()
+    return CacheValidators(
+        etag=f'"{digest[:32]}"', last_modified=last_modified
+    )
+
+
+def is_not_modified(request: Request, validators: CacheValidators) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+
+    # If-Modified-Since is ignored when If-None-Match is present (RFC 9110)
+    if if_none_match is not None:
+        tags = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return "*" in tags or validators.etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+
+    if not if_modified_since or validators.last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    # HTTP dates have a one second resolution
+    last_modified = _as_utc(validators.last_modified).replace(microsecond=0)
+    return last_modified <= _as_utc(since)
+
+
+def not_modified_response(validators: CacheValidators) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Timestamps are stored as naive UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
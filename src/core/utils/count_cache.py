@@ -0,0 +1,48 @@
+import time
+
+from src.core.config import get_settings
+from src.core.logging import logger
+
+settings = get_settings()
+
+
+class CountCache:
+    """Per-process cache of row counts behind estimated pagination totals.
+
+    Entries expire after ``ttl_seconds``, writes going through the
+    repositories drop them earlier by key prefix.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[int, float]] = {}
+
+    def get(self, key: str) -> int | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        count, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return count
+
+    def set(self, key: str, count: int) -> None:
+        self._entries[key] = (count, time.monotonic() + self.ttl_seconds)
+
+    def invalidate(self, prefix: str) -> None:
+        stale_keys = [key for key in self._entries if key.startswith(prefix)]
+
+        for key in stale_keys:
+            self._entries.pop(key, None)
+
+        if stale_keys:
+            logger.debug(
+                f"Count cache: Invalidated {len(stale_keys)} "
+                f"entries for '{prefix}'"
+            )
+
+
+count_cache = CountCache(settings.pagination_count_cache_ttl_seconds)
@@ -0,0 +1,166 @@
+"""Report foreign keys and filtered columns that no index covers.
+
+A column counts as covered when it is the leading column of an index, a
+unique constraint or the primary key. Filtered columns are collected from
+the ``where()``/``filter()`` calls of the SQLAlchemy repositories, where a
+call is covered if any of its columns on a table leads an index.
+
+Run from the project root:
+
+    python -m src.core.utils.index_audit
+"""
+import ast
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import Column, Index, MetaData, Table, UniqueConstraint
+from sqlalchemy.sql.elements import UnaryExpression
+
+from src.core.database import Base
+
+REPOSITORIES_DIR = (
+    Path(__file__).resolve().parents[2] / "repositories" / "sqlalchemy"
+)
+FILTER_METHODS = {"where", "filter"}
+
+
+@dataclass(frozen=True)
+class Finding:
+    table: str
+    columns: tuple[str, ...]
+    reason: str
+
+    def __str__(self) -> str:
+        return f"{self.table}({', '.join(self.columns)}): {self.reason}"
+
+
+def import_models() -> None:
+    # Models are not imported by src.models, register them on Base.metadata
+    from src.models import (  # noqa: F401
+        cart, cart_item, meal, meal_category, order, order_item, user
+    )
+
+
+def leading_column(index: Index) -> str | None:
+    expression = index.expressions[0]
+
+    if isinstance(expression, UnaryExpression):
+        expression = expression.element
+    if isinstance(expression, Column):
+        return expression.name
+    if isinstance(expression, str):
+        return expression
+
+    return None
+
+
+def indexed_leading_columns(table: Table) -> set[str]:
+    leading = set()
+
+    if table.primary_key.columns:
+        leading.add(table.primary_key.columns.values()[0].name)
+
+    for index in table.indexes:
+        if column := leading_column(index):
+            leading.add(column)
+
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and constraint.columns:
+            leading.add(constraint.columns.values()[0].name)
+
+    for column in table.columns:
+        if column.index or column.unique:
+            leading.add(column.name)
+
+    return leading
+
+
+def audit_foreign_keys(metadata: MetaData) -> list[Finding]:
+    findings = []
+
+    for table in metadata.sorted_tables:
+        leading = indexed_leading_columns(table)
+
+        for fk in table.foreign_keys:
+            if fk.parent.name not in leading:
+                findings.append(Finding(
+                    table.name, (fk.parent.name,),
+                    f"foreign key to {fk.column.table.name} has no index"
+                ))
+
+    return findings
+
+
+def collect_filtered_columns(
+    source: str, model_tables: dict[str, Table]
+) -> list[tuple[Table, tuple[str, ...]]]:
+    filters = []
+
+    for node in ast.walk(ast.parse(source)):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in FILTER_METHODS
+        ):
+            continue
+
+        columns_by_table: dict[str, list[str]] = {}
+        for arg in node.args:
+            for child in ast.walk(arg):
+                if (
+                    isinstance(child, ast.Attribute)
+                    and isinstance(child.value, ast.Name)
+                    and child.value.id in model_tables
+                ):
+                    columns_by_table.setdefault(
+                        child.value.id, []
+                    ).append(child.attr)
+
+        for model_name, columns in columns_by_table.items():
+            filters.append((model_tables[model_name], tuple(columns)))
+
+    return filters
+
+
+def audit_filtered_columns(
+    metadata: MetaData, repositories_dir: Path = REPOSITORIES_DIR
+) -> list[Finding]:
+    model_tables = {
+        mapper.class_.__name__: mapper.local_table
+        for mapper in Base.registry.mappers
+        if mapper.local_table.metadata is metadata
+    }
+    findings = set()
+
+    for path in sorted(repositories_dir.glob("*.py")):
+        for table, columns in collect_filtered_columns(
+            path.read_text(), model_tables
+        ):
+            if not set(columns) & indexed_leading_columns(table):
+                findings.add(Finding(
+                    table.name, columns,
+                    f"filtered in {path.name} without a covering index"
+                ))
+
+    return sorted(findings, key=str)
+
+
+def main() -> int:
+    import_models()
+    findings = (
+        audit_foreign_keys(Base.metadata)
+        + audit_filtered_columns(Base.metadata)
+    )
+
+    for finding in findings:
+        print(finding)
+
+    if not findings:
+        print("All foreign keys and filtered columns are indexed")
+
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
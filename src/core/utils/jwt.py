@@ -1,11 +1,22 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 from jose import jwt
 
+from src.cache.lru import TTLLRUCache
 from src.core.config import get_settings
 from src.core.logging import logger
 
 settings = get_settings()
 
+# Verified access token payloads keyed by token digest, each entry expires
+# together with its token
+access_token_cache: TTLLRUCache[bytes, dict] = TTLLRUCache(
+    "access_token",
+    maxsize=settings.jwt_decode_cache_maxsize,
+    ttl_seconds=settings.jwt_access_token_expire_minutes * 60
+)
+
 
 def create_access_token(subject: int) -> str:
     logger.debug(f"Creating access token for user {subject}")
@@ -49,6 +60,15 @@ def create_refresh_token(subject: int) -> str:
 
 
 def decode_access_token(token: str) -> dict:
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = access_token_cache.get(digest)
+
+    if payload is not None:
+        logger.debug(
+            f"Access token for user {payload.get('sub')} was already verified"
+        )
+        return dict(payload)
+
     logger.debug("Decoding access token")
     try:
         payload = jwt.decode(
@@ -57,6 +77,10 @@ def decode_access_token(token: str) -> dict:
         logger.debug(
             f"Access token decoded successfully for user {payload.get('sub')}"
         )
+
+        ttl_seconds = payload["exp"] - time.time() if "exp" in payload else 0
+        if ttl_seconds > 0:
+            access_token_cache.set(digest, dict(payload), ttl_seconds)
         return payload
     except Exception as e:
         logger.error(f"Failed to decode access token: {e}")
@@ -0,0 +1,82 @@
+import base64
+import binascii
+import json
+from typing import Any, Sequence
+
+from src.core.logging import logger
+from src.exceptions.pagination import (
+    InvalidCursorError, ConflictingCursorsError
+)
+from src.schemas.common import PaginationParams
+
+
+def encode_cursor(item_id: int) -> str:
+    payload = json.dumps({"id": item_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        item_id = payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        logger.warning(f"Failed to decode pagination cursor {cursor}: {e}")
+        raise InvalidCursorError(cursor)
+
+    if not isinstance(item_id, int) or isinstance(item_id, bool):
+        raise InvalidCursorError(cursor)
+
+    return item_id
+
+
+def decode_pagination_cursors(
+    pagination_params: PaginationParams
+) -> tuple[int | None, int | None]:
+    if pagination_params.after and pagination_params.before:
+        raise ConflictingCursorsError()
+
+    after_id = (
+        decode_cursor(pagination_params.after)
+        if pagination_params.after else None
+    )
+    before_id = (
+        decode_cursor(pagination_params.before)
+        if pagination_params.before else None
+    )
+
+    return after_id, before_id
+
+
+def split_keyset_page(
+    rows: Sequence[Any], pagination_params: PaginationParams
+) -> tuple[list[Any], str | None, str | None]:
+    """Trim a page fetched with ``per_page + 1`` rows and build its cursors.
+
+    Rows come in query order: ascending by ID, or descending when paging
+    backwards with ``before``. The extra row only tells whether another page
+    exists in the direction of travel.
+    """
+    per_page = pagination_params.per_page
+    has_more = len(rows) > per_page
+    items = list(rows[:per_page])
+
+    if pagination_params.before:
+        items.reverse()
+        next_cursor = encode_cursor(items[-1].id) if items else None
+        prev_cursor = encode_cursor(items[0].id) if has_more else None
+        return items, next_cursor, prev_cursor
+
+    next_cursor = encode_cursor(items[-1].id) if has_more else None
+    has_previous = bool(pagination_params.after) or pagination_params.page > 1
+    prev_cursor = (
+        encode_cursor(items[0].id) if items and has_previous else None
+    )
+
+    return items, next_cursor, prev_cursor
+
+
+def count_total_pages(total: int | None, per_page: int) -> int | None:
+    if total is None:
+        return None
+    return (total + per_page - 1) // per_page
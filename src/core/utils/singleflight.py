@@ -0,0 +1,90 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from src.core.config import get_settings
+from src.core.logging import logger
+from src.monitoring.metrics import (
+    SINGLEFLIGHT_EXECUTIONS, SINGLEFLIGHT_COALESCED, SINGLEFLIGHT_TIMEOUTS
+)
+
+settings = get_settings()
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls within this worker.
+
+    The first caller of a key runs the call, callers arriving while it is in
+    flight wait for its result or exception instead of running their own.
+    A waiter gives up after the key's timeout, or when the leader is
+    cancelled, and runs the call itself.
+    """
+
+    def __init__(self, default_timeout: float) -> None:
+        self.default_timeout = default_timeout
+        self._flights: dict[str, asyncio.Future] = {}
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        operation: str,
+        timeout: float | None = None
+    ) -> T:
+        flight = self._flights.get(key)
+
+        if flight is not None:
+            return await self._wait(key, flight, fn, operation, timeout)
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        SINGLEFLIGHT_EXECUTIONS.labels(operation=operation).inc()
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            # Mark it retrieved, there may be no waiters to do so
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    async def _wait(
+        self,
+        key: str,
+        flight: asyncio.Future,
+        fn: Callable[[], Awaitable[T]],
+        operation: str,
+        timeout: float | None
+    ) -> T:
+        SINGLEFLIGHT_COALESCED.labels(operation=operation).inc()
+        timeout = self.default_timeout if timeout is None else timeout
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(flight), timeout)
+        except TimeoutError:
+            SINGLEFLIGHT_TIMEOUTS.labels(operation=operation).inc()
+            logger.warning(
+                f"Singleflight: Timed out after {timeout}s waiting for "
+                f"{key}, running the call directly"
+            )
+        except asyncio.CancelledError:
+            if not flight.cancelled():
+                raise
+            logger.debug(
+                f"Singleflight: Leader of {key} was cancelled, "
+                f"running the call directly"
+            )
+
+        return await fn()
+
+
+singleflight = SingleFlight(settings.singleflight_timeout_seconds)
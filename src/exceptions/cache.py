@@ -0,0 +1,6 @@
+from src.exceptions.base import AppException
+
+
+class CacheBackendError(AppException):
+    def __init__(self, message: str):
+        super().__init__(f"Cache backend error: {message}")
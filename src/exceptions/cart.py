@@ -9,3 +9,11 @@ class CartAlreadyExistsError(ConflictError):
 class CartNotFoundError(NotFoundError):
     def __init__(self, user_id: int):
         super().__init__(f"Cart for user with ID={user_id} was not found")
+
+
+class CartVersionConflictError(ConflictError):
+    def __init__(self, user_id: int, version: int):
+        super().__init__(
+            f"Cart for user with ID={user_id} has changed since version "
+            f"{version}"
+        )
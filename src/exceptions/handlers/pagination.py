@@ -0,0 +1,18 @@
+from fastapi import Request, FastAPI
+from fastapi.responses import JSONResponse
+
+from src.exceptions.pagination import (
+    InvalidCursorError, ConflictingCursorsError
+)
+
+
+def register_pagination_exception_handlers(app: FastAPI):
+    @app.exception_handler(InvalidCursorError)
+    @app.exception_handler(ConflictingCursorsError)
+    async def pagination_cursor_error_handler(
+        request: Request, exc: InvalidCursorError | ConflictingCursorsError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=400,
+            content={"detail": str(exc)}
+        )
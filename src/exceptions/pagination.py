@@ -0,0 +1,11 @@
+from src.exceptions.base import ValidationError
+
+
+class InvalidCursorError(ValidationError):
+    def __init__(self, cursor: str):
+        super().__init__(f"Invalid pagination cursor '{cursor}'")
+
+
+class ConflictingCursorsError(ValidationError):
+    def __init__(self):
+        super().__init__("Only one of 'after' and 'before' can be provided")
@@ -9,10 +9,14 @@ from src.core.constants import APP_SUMMARY, APP_DESCRIPTION
 from src.core.exceptions_setup import setup_exception_handlers
 from src.core.logging import setup_logging, logger
 from src.core.lifespan import lifespan
-from src.message_broker.config import kafka_broker
+from src.message_broker.config import (
+    kafka_broker, outbox_relay, processed_events_cleaner
+)
 from src.message_broker.subscriber import cart, user
 from src.middlewares.cors import setup_cors
 from src.middlewares.profiler import setup_profiler
+from src.middlewares.query_stats import setup_query_stats
+from src.middlewares.response_cache import setup_response_cache
 from src.monitoring.prometheus import setup_instrumentator
 
 settings = get_settings()
@@ -28,7 +32,12 @@ app = FastAPI(
     redoc_url="/redoc",
     lifespan=lifespan
 )
-faststream = FastStream(kafka_broker)
+# The relay publishes through the broker, so it stops before the broker
+faststream = FastStream(
+    kafka_broker,
+    after_startup=[outbox_relay.start, processed_events_cleaner.start],
+    on_shutdown=[outbox_relay.stop, processed_events_cleaner.stop]
+)
 logger.info("FastStream was configured")
 logger.info("Configuring FastAPI application...")
 
@@ -40,12 +49,19 @@ logger.info("Admin router was included")
 site.mount_app(app)
 logger.info("Admin site was mounted")
 
+# Set up first so it runs inside CORS and never stores per-origin headers
+setup_response_cache(app, settings)
+logger.info("Response cache middleware was configured")
+
 setup_cors(app, settings)
 logger.info("CORS middleware was configured")
 
 setup_profiler(app)
 logger.info("Profile middleware was configured")
 
+setup_query_stats(app, settings)
+logger.info("Query stats middleware was configured")
+
 setup_exception_handlers(app)
 logger.info("Exception handlers were registered")
 
@@ -2,4 +2,6 @@ from typing import Protocol, Any
 
 
 class IMessageBroker(Protocol):
-    async def publish(self, topic: str, message: dict[str, Any]): ...
+    async def publish(
+        self, topic: str, message: dict[str, Any], key: str | None = None
+    ): ...
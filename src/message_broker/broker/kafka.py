@@ -8,10 +8,14 @@ class KafkaMessageBroker:
     def __init__(self, broker: KafkaBroker):
         self._broker = broker
 
-    async def publish(self, topic: str, message: dict[str, Any]):
+    async def publish(
+        self, topic: str, message: dict[str, Any], key: str | None = None
+    ):
         logger.debug(f"Kafka broker publishing message to topic '{topic}'")
         try:
-            await self._broker.publish(message, topic)
+            await self._broker.publish(
+                message, topic, key=key.encode() if key is not None else None
+            )
             logger.debug(
                 f"Kafka message published successfully to topic '{topic}'"
             )
@@ -1,15 +1,44 @@
+from datetime import timedelta
+
 from faststream.kafka import KafkaBroker
 
 from src.core.config import get_settings
+from src.core.database import async_session
 from src.core.logging import logger
+from src.message_broker.broker.kafka import KafkaMessageBroker
+from src.message_broker.outbox_relay import OutboxRelay
+from src.message_broker.processed_events_cleaner import (
+    ProcessedEventsCleaner
+)
 
 settings = get_settings()
 logger.info(
     f"Initializing Kafka broker with servers: {settings.kafka_bootstrap_servers}"
 )
-kafka_broker = KafkaBroker(settings.kafka_bootstrap_servers)
+# The producer batches what is sent within linger_ms, compressed per batch
+kafka_broker = KafkaBroker(
+    settings.kafka_bootstrap_servers,
+    acks=(
+        "all" if settings.kafka_producer_acks == "all"
+        else int(settings.kafka_producer_acks)
+    ),
+    linger_ms=settings.kafka_producer_linger_ms,
+    max_batch_size=settings.kafka_producer_max_batch_size,
+    compression_type=settings.kafka_producer_compression
+)
 
+# Run by the FastStream app, the API only writes events to the outbox
+outbox_relay = OutboxRelay(
+    async_session,
+    KafkaMessageBroker(kafka_broker),
+    batch_size=settings.outbox_relay_batch_size,
+    poll_interval=settings.outbox_relay_poll_seconds,
+    lease_seconds=settings.outbox_relay_lease_seconds,
+    publish_timeout=settings.outbox_relay_publish_timeout_seconds
+)
 
-async def get_kafka_broker() -> KafkaBroker:
-    logger.debug("Returning Kafka broker instance")
-    return kafka_broker
+processed_events_cleaner = ProcessedEventsCleaner(
+    async_session,
+    retention=timedelta(hours=settings.processed_events_retention_hours),
+    interval=settings.processed_events_cleanup_interval_seconds
+)
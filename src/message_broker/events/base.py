@@ -1,5 +1,20 @@
-from pydantic import BaseModel
+from typing import ClassVar
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field
 
 
 class BaseEvent(BaseModel):
-    pass
+    # Field whose value keys the event: events with the same key go to the
+    # same partition and are consumed in the order they were published
+    partition_key_field: ClassVar[str | None] = None
+
+    # Kept by every redelivery of the event, consumers that can't apply it
+    # twice record it to skip duplicates
+    event_id: UUID = Field(default_factory=uuid4)
+
+    @property
+    def partition_key(self) -> str | None:
+        if self.partition_key_field is None:
+            return None
+        return str(getattr(self, self.partition_key_field))
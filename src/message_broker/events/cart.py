@@ -1,7 +1,18 @@
+from decimal import Decimal
+from typing import ClassVar
+
 from src.message_broker.events.base import BaseEvent
 from src.schemas.cart import CartPatchUpdate
 
 
 class CartUpdatedEvent(BaseEvent):
+    partition_key_field: ClassVar[str] = "user_id"
+
     user_id: int
-    cart_data: CartPatchUpdate
+    # Signed change of the total, added in one UPDATE so concurrent events
+    # for a cart add up instead of overwriting each other
+    total_price_delta: Decimal | None = None
+    # Absolute update, dropped when the cart has changed since version.
+    # Events without a version are applied as they are
+    cart_data: CartPatchUpdate | None = None
+    version: int | None = None
@@ -1,5 +1,9 @@
+from typing import ClassVar
+
 from src.message_broker.events.base import BaseEvent
 
 
 class UserCreatedEvent(BaseEvent):
+    partition_key_field: ClassVar[str] = "user_id"
+
     user_id: int
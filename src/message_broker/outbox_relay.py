@@ -0,0 +1,161 @@
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.logging import logger
+from src.message_broker.broker.interface import IMessageBroker
+from src.models.outbox import OutboxEventModel
+from src.monitoring.metrics import (
+    OUTBOX_EVENTS_RELAYED, OUTBOX_RELAY_DELAY, OUTBOX_RELAY_FAILURES
+)
+from src.repositories.sqlalchemy.outbox import SQLAlchemyOutboxRepository
+
+
+class OutboxRelay:
+    """Publishes committed outbox events to Kafka in the background.
+
+    Every round claims the oldest events for ``lease_seconds`` in a short
+    transaction, publishes them with no transaction open, then deletes the
+    published ones and releases the rest in another. Events of one key are
+    published one after another, different keys concurrently. A key with
+    a live claim is not claimed again, and a failed event holds back the
+    rest of its key until the next round, so they never overtake it.
+    Delivery is at least once: a relay that dies mid-round leaves its
+    claims to expire, and the events are published again.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        broker: IMessageBroker,
+        batch_size: int = 100,
+        poll_interval: float = 0.5,
+        lease_seconds: float = 30.0,
+        publish_timeout: float = 5.0
+    ) -> None:
+        self.session_factory = session_factory
+        self.broker = broker
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.publish_timeout = publish_timeout
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._relay_forever())
+            logger.info("Outbox relay: Started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Outbox relay: Stopped")
+
+    async def relay_batch(self) -> int:
+        """Publish one batch of events, return how many were published."""
+        loop = asyncio.get_running_loop()
+        # The last publish has to end before the claim does
+        deadline = loop.time() + self.lease_seconds - self.publish_timeout
+        events = await self._claim_batch()
+        if not events:
+            return 0
+
+        by_key: defaultdict[str | int, list[OutboxEventModel]] = (
+            defaultdict(list)
+        )
+        for event in events:
+            # Events without a key need no order among themselves
+            key = event.key if event.key is not None else event.id
+            by_key[key].append(event)
+
+        published = await asyncio.gather(*(
+            self._publish_in_order(key_events, deadline)
+            for key_events in by_key.values()
+        ))
+        published_ids = {event_id for ids in published for event_id in ids}
+        unpublished_ids = [
+            event.id for event in events if event.id not in published_ids
+        ]
+
+        async with self.session_factory() as session:
+            repository = SQLAlchemyOutboxRepository(session)
+
+            if published_ids:
+                await repository.delete_by_ids(list(published_ids))
+            if unpublished_ids:
+                await repository.release(unpublished_ids)
+            await session.commit()
+
+        logger.debug(f"Outbox relay: Published {len(published_ids)} events")
+        return len(published_ids)
+
+    async def _claim_batch(self) -> list[OutboxEventModel]:
+        async with self.session_factory() as session:
+            repository = SQLAlchemyOutboxRepository(session)
+
+            if not await repository.acquire_relay_lock():
+                logger.debug("Outbox relay: Another relay is claiming events")
+                return []
+
+            events = await repository.claim_batch(
+                self.batch_size, self.lease_seconds
+            )
+            await session.commit()
+
+        return events
+
+    async def _relay_forever(self) -> None:
+        while True:
+            try:
+                published = await self.relay_batch()
+            except Exception as e:
+                logger.error(f"Outbox relay: Round failed: {e}")
+                published = 0
+
+            # A full batch means more events are probably waiting
+            if published < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _publish_in_order(
+        self, events: list[OutboxEventModel], deadline: float
+    ) -> list[int]:
+        loop = asyncio.get_running_loop()
+        published = []
+
+        for event in events:
+            if loop.time() >= deadline:
+                logger.warning(
+                    f"Outbox relay: Claim is running out, leaving event "
+                    f"{event.id} and the rest of its key to the next round"
+                )
+                break
+
+            try:
+                await asyncio.wait_for(
+                    self.broker.publish(event.topic, event.payload, event.key),
+                    self.publish_timeout
+                )
+            except Exception as e:
+                OUTBOX_RELAY_FAILURES.labels(topic=event.topic).inc()
+                logger.warning(
+                    f"Outbox relay: Failed to publish event {event.id} to "
+                    f"'{event.topic}', retrying next round: {e}"
+                )
+                break
+
+            OUTBOX_EVENTS_RELAYED.labels(topic=event.topic).inc()
+            OUTBOX_RELAY_DELAY.observe(
+                (datetime.utcnow() - event.created_at).total_seconds()
+            )
+            published.append(event.id)
+
+        return published
@@ -0,0 +1,67 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.logging import logger
+from src.repositories.sqlalchemy.processed_event import (
+    SQLAlchemyProcessedEventRepository
+)
+
+
+class ProcessedEventsCleaner:
+    """Deletes processed event IDs older than ``retention`` in the
+    background. A redelivery of an event older than that is applied again,
+    so keep it well above how long an event can be in flight."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        retention: timedelta,
+        interval: float = 3600.0
+    ) -> None:
+        self.session_factory = session_factory
+        self.retention = retention
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._clean_forever())
+            logger.info("Processed events cleaner: Started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Processed events cleaner: Stopped")
+
+    async def clean(self) -> int:
+        cutoff = datetime.utcnow() - self.retention
+
+        async with self.session_factory() as session:
+            deleted = await SQLAlchemyProcessedEventRepository(
+                session
+            ).delete_processed_before(cutoff)
+            await session.commit()
+
+        logger.info(
+            f"Processed events cleaner: Deleted {deleted} events processed "
+            f"before {cutoff}"
+        )
+        return deleted
+
+    async def _clean_forever(self) -> None:
+        while True:
+            try:
+                await self.clean()
+            except Exception as e:
+                logger.error(f"Processed events cleaner: Round failed: {e}")
+
+            await asyncio.sleep(self.interval)
@@ -1,5 +1,7 @@
 from typing import Protocol
 
+from src.message_broker.events.base import BaseEvent
+
 
 class IEventPublisher(Protocol):
-    async def publish(self, topic: str, data: dict) -> None: ...
+    async def publish(self, topic: str, event: BaseEvent) -> None: ...
@@ -0,0 +1,21 @@
+from src.core.logging import logger
+from src.message_broker.events.base import BaseEvent
+from src.repositories.interfaces.outbox import IOutboxRepository
+
+
+class OutboxEventPublisher:
+    """Writes events to the outbox in the caller's transaction.
+
+    Nothing reaches Kafka until the transaction commits, then the outbox
+    relay publishes the event. A rollback discards it with the change.
+    """
+
+    def __init__(self, repository: IOutboxRepository):
+        self.repository = repository
+
+    async def publish(self, topic: str, event: BaseEvent):
+        message = event.model_dump(mode="json")
+        logger.info(
+            f"Outbox Publisher: Queueing event for topic '{topic}': {message}"
+        )
+        await self.repository.add(topic, message, event.partition_key)
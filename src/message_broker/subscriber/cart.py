@@ -1,28 +1,115 @@
+import asyncio
+from collections import defaultdict
+from decimal import Decimal
+from uuid import UUID
+
+from src.core.cache import cart_cache
+from src.core.config import get_settings
 from src.core.database import async_session
 from src.core.logging import logger
-from src.exceptions.cart import CartNotFoundError
+from src.exceptions.cart import CartNotFoundError, CartVersionConflictError
 from src.message_broker.config import kafka_broker
 from src.message_broker.events.cart import CartUpdatedEvent
 from src.message_broker.topics import TOPIC_CART_UPDATED
+from src.repositories.interfaces.processed_event import (
+    IProcessedEventRepository
+)
 from src.repositories.sqlalchemy.cart import SQLAlchemyCartRepository
+from src.repositories.sqlalchemy.processed_event import (
+    SQLAlchemyProcessedEventRepository
+)
+from src.repositories.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from src.schemas.cart import CartRead
+from src.services.cart.interface import ICartService
 from src.services.cart.service import CartService
 
+settings = get_settings()
+
+CART_UPDATE_GROUP = "cart-update-service"
+
+BATCH_RETRY_DELAY = 1.0
+MAX_BATCH_RETRY_DELAY = 30.0
+
+
+async def apply_cart_event(
+    cart_service: ICartService, event: CartUpdatedEvent
+) -> CartRead:
+    if event.total_price_delta is not None:
+        return await cart_service.add_to_total(
+            event.user_id, event.total_price_delta
+        )
+    return await cart_service.update_cart(
+        event.user_id, event.cart_data, event.version
+    )
+
+
+async def drop_applied_events(
+    repository: IProcessedEventRepository, events: list[CartUpdatedEvent]
+) -> list[CartUpdatedEvent]:
+    """Record the events as applied, in the caller's transaction, and return
+    the ones that were not applied before. Deltas can't be applied twice,
+    and the outbox relay and Kafka both deliver at least once."""
+    unique: dict[UUID, CartUpdatedEvent] = {}
+    for event in events:
+        unique.setdefault(event.event_id, event)
+
+    new_ids = await repository.add_new(CART_UPDATE_GROUP, list(unique))
+
+    if skipped := len(events) - len(new_ids):
+        logger.info(
+            f"Cart subscriber: Skipped {skipped} events that were "
+            f"already applied"
+        )
+
+    return [
+        event for event_id, event in unique.items() if event_id in new_ids
+    ]
+
+
+def coalesce_cart_events(
+    events: list[CartUpdatedEvent]
+) -> tuple[dict[int, list[Decimal]], list[CartUpdatedEvent]]:
+    """Group the deltas of a batch by user. Users with an absolute update
+    keep all of their events, in order, to be applied one by one."""
+    absolute_user_ids = {
+        event.user_id for event in events if event.total_price_delta is None
+    }
+    deltas: defaultdict[int, list[Decimal]] = defaultdict(list)
+    ordered = []
+
+    for event in events:
+        if event.user_id in absolute_user_ids:
+            ordered.append(event)
+        else:
+            deltas[event.user_id].append(event.total_price_delta)
+
+    return dict(deltas), ordered
+
 
-@kafka_broker.subscriber(TOPIC_CART_UPDATED, group_id="cart-update-service")
 async def update_cart_on_cart_updated(event: CartUpdatedEvent):
     logger.info(
         f"Cart subscriber: Received CartUpdatedEvent for user {event.user_id}"
     )
     user_id = event.user_id
-    cart_data = event.cart_data
 
     async with async_session() as session:
+        uow = SQLAlchemyUnitOfWork(session)
+        cart_service = CartService(
+            SQLAlchemyCartRepository(session), uow, cart_cache
+        )
+
         try:
-            repo = SQLAlchemyCartRepository(session)
-            cart_service = CartService(repo)
+            # Recorded with the change, so a redelivery is skipped
+            async with uow:
+                if not await drop_applied_events(
+                    SQLAlchemyProcessedEventRepository(session), [event]
+                ):
+                    return
 
-            logger.info(f"Cart subscriber: Updating cart for user {user_id}")
-            upd_cart = await cart_service.update_cart(user_id, cart_data)
+                logger.info(
+                    f"Cart subscriber: Updating cart for user {user_id}"
+                )
+                upd_cart = await apply_cart_event(cart_service, event)
 
             logger.info(
                 f"Cart subscriber: Cart was updated for user "
@@ -33,13 +120,91 @@ async def update_cart_on_cart_updated(event: CartUpdatedEvent):
                 f"total_price={upd_cart.total_price}"
             )
 
+        except CartVersionConflictError as e:
+            # Stale, a newer change of the cart has already been applied
+            logger.warning(f"Cart subscriber: Event was dropped: {e}")
         except CartNotFoundError as e:
+            # Redelivering it can't bring the cart back, it is acknowledged
             logger.error(
-                f"Cart subscriber: Cart was not found for user {user_id}: {e}"
+                f"Cart subscriber: Cart was not found for user {user_id}, "
+                f"event was dropped: {e}"
             )
-            raise
         except Exception as e:
             logger.error(
                 f"Cart subscriber: Failed to update cart for user {user_id}: {e}"
             )
             raise
+
+
+async def apply_cart_batch(events: list[CartUpdatedEvent]) -> tuple[int, int]:
+    """Apply a batch in one transaction. Returns the number of carts changed
+    in bulk and of events applied one by one."""
+    async with async_session() as session:
+        uow = SQLAlchemyUnitOfWork(session)
+        cart_service = CartService(
+            SQLAlchemyCartRepository(session), uow, cart_cache
+        )
+
+        # Events are recorded in the transaction, so a batch that is
+        # retried or redelivered after it committed is skipped
+        async with uow:
+            new_events = await drop_applied_events(
+                SQLAlchemyProcessedEventRepository(session), events
+            )
+            deltas, ordered = coalesce_cart_events(new_events)
+
+            if deltas:
+                await cart_service.add_to_totals(deltas)
+
+            for event in ordered:
+                try:
+                    await apply_cart_event(cart_service, event)
+                except (CartVersionConflictError, CartNotFoundError) as e:
+                    logger.warning(f"Cart subscriber: Event was dropped: {e}")
+
+    return len(deltas), len(ordered)
+
+
+async def update_carts_on_cart_updated(events: list[CartUpdatedEvent]):
+    logger.info(f"Cart subscriber: Received {len(events)} CartUpdatedEvents")
+    delay = BATCH_RETRY_DELAY
+
+    # Retried here until it commits, offsets are committed only after the
+    # handler returns. A nack would seek back only the partition of the
+    # first event, the rest of the batch would be skipped
+    while True:
+        try:
+            bulk_count, ordered_count = await apply_cart_batch(events)
+            break
+        except Exception as e:
+            logger.error(
+                f"Cart subscriber: Failed to apply a batch of "
+                f"{len(events)} events, retrying in {delay:.1f}s: {e!r}"
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_BATCH_RETRY_DELAY)
+
+    logger.info(
+        f"Cart subscriber: Batch of {len(events)} events was applied to "
+        f"{bulk_count} carts in bulk and {ordered_count} one by one"
+    )
+
+
+if settings.cart_subscriber_batch_size > 1:
+    kafka_broker.subscriber(
+        TOPIC_CART_UPDATED,
+        group_id=CART_UPDATE_GROUP,
+        batch=True,
+        max_records=settings.cart_subscriber_batch_size,
+        batch_timeout_ms=settings.cart_subscriber_batch_timeout_ms,
+        auto_commit=False
+    )(update_carts_on_cart_updated)
+else:
+    # Manual commits make FastStream run one consumer per worker, so
+    # partitions are processed concurrently and each one in order
+    kafka_broker.subscriber(
+        TOPIC_CART_UPDATED,
+        group_id=CART_UPDATE_GROUP,
+        auto_commit=False,
+        max_workers=settings.kafka_subscriber_max_workers
+    )(update_cart_on_cart_updated)
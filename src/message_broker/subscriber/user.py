@@ -1,16 +1,26 @@
+from src.core.cache import cart_cache
+from src.core.config import get_settings
 from src.core.database import async_session
 from src.core.logging import logger
 from src.exceptions.cart import CartAlreadyExistsError
 from src.message_broker.config import kafka_broker
 from src.message_broker.events.user import UserCreatedEvent
-from src.message_broker.topics import (
-    TOPIC_USER_CREATED
-)
+from src.message_broker.topics import TOPIC_USER_CREATED
 from src.repositories.sqlalchemy.cart import SQLAlchemyCartRepository
+from src.repositories.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
 from src.services.cart.service import CartService
 
+settings = get_settings()
+
 
-@kafka_broker.subscriber(TOPIC_USER_CREATED, group_id="cart-create-service")
+# Events are keyed by user ID, a worker per partition keeps each user's
+# events in order
+@kafka_broker.subscriber(
+    TOPIC_USER_CREATED,
+    group_id="cart-create-service",
+    auto_commit=False,
+    max_workers=settings.kafka_subscriber_max_workers
+)
 async def create_cart_on_user_created(event: UserCreatedEvent):
     logger.info(
         f"User subscriber: Received UserCreatedEvent for user {event.user_id}"
@@ -23,7 +33,9 @@ async def create_cart_on_user_created(event: UserCreatedEvent):
                 f"User subscriber: Initializing cart repo and service for user {user_id}"
             )
             repo = SQLAlchemyCartRepository(session)
-            cart_service = CartService(repo)
+            cart_service = CartService(
+                repo, SQLAlchemyUnitOfWork(session), cart_cache
+            )
 
             logger.info(f"User subscriber: Creating cart for user {user_id}")
             cart = await cart_service.create_cart(user_id)
@@ -34,10 +46,12 @@ async def create_cart_on_user_created(event: UserCreatedEvent):
             )
 
         except CartAlreadyExistsError as e:
+            # A redelivered event, acknowledged. Only transient errors are
+            # raised to have the event delivered again
             logger.warning(
-                f"User subscriber: Cart already exists for user {user_id}: {e}"
+                f"User subscriber: Cart already exists for user {user_id}, "
+                f"event was skipped: {e}"
             )
-            raise
         except Exception as e:
             logger.error(
                 f"User subscriber: Failed to create cart for user {user_id}: {e}"
@@ -0,0 +1,43 @@
+from fastapi import Request
+
+from src.core.database import async_engine, replica_engine
+from src.core.logging import logger
+from src.monitoring.metrics import (
+    DB_QUERIES_PER_REQUEST, DB_QUERY_TIME_PER_REQUEST
+)
+from src.monitoring.query_stats import setup_query_listeners, track_queries
+
+
+def setup_query_stats(app, settings):
+    for engine in (async_engine, replica_engine):
+        if engine is not None:
+            setup_query_listeners(engine)
+
+    threshold = settings.n_plus_one_threshold
+
+    @app.middleware("http")
+    async def collect_query_stats(request: Request, call_next):
+        with track_queries() as stats:
+            response = await call_next(request)
+
+        route = request.scope.get("route")
+        handler = route.path if route else "none"
+        DB_QUERIES_PER_REQUEST.labels(request.method, handler).observe(
+            stats.count
+        )
+        DB_QUERY_TIME_PER_REQUEST.labels(request.method, handler).observe(
+            stats.duration
+        )
+
+        response.headers.append(
+            "Server-Timing",
+            f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"'
+        )
+
+        for statement, count in stats.repeated_statements(threshold):
+            logger.warning(
+                f"Possible N+1 query: {request.method} {handler} ran the same "
+                f"statement {count} times: {statement[:200]}"
+            )
+
+        return response
@@ -0,0 +1,125 @@
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Request, Response
+from starlette.routing import compile_path
+
+from src.cache.response import CachedResponse
+from src.core.cache import response_cache
+from src.core.utils.conditional_get import (
+    CacheValidators, is_not_modified, not_modified_response
+)
+from src.services.meal.service import MEAL_TAG, MEALS_TAG
+from src.services.meal_category.service import CATEGORIES_TAG, CATEGORY_TAG
+
+# Catalog reads that may be cached, with the tags that purge them. Only
+# routes given a TTL in RESPONSE_CACHE_ROUTE_TTLS are cached.
+CACHEABLE_ROUTES = {
+    "/api/v1/meal-categories": (CATEGORIES_TAG,),
+    "/api/v1/meal-categories/{category_id}": (CATEGORY_TAG,),
+    "/api/v1/meal-categories/{category_id}/meals": (CATEGORY_TAG, MEALS_TAG),
+    "/api/v1/meal-categories/{category_id}/meals/{meal_id}": (
+        CATEGORY_TAG, MEAL_TAG
+    )
+}
+
+# Added per response by outer middlewares, or recomputed on the way out
+SKIPPED_HEADERS = {"content-length", "server-timing"}
+
+
+def setup_response_cache(app, settings):
+    if not settings.response_cache_enabled:
+        return
+
+    routes = [
+        (compile_path(path)[0], tags, ttl)
+        for path, tags in CACHEABLE_ROUTES.items()
+        if (ttl := settings.response_cache_route_ttls.get(path, 0)) > 0
+    ]
+
+    @app.middleware("http")
+    async def cache_responses(request: Request, call_next):
+        if not is_cacheable_request(request):
+            return await call_next(request)
+
+        for regex, tag_templates, ttl in routes:
+            match = regex.match(request.url.path)
+            if match:
+                break
+        else:
+            return await call_next(request)
+
+        tags = [tag.format(**match.groupdict()) for tag in tag_templates]
+        key = f"{request.url.path}?{normalize_query(request)}"
+        cached, versions = await response_cache.lookup(key, tags)
+
+        if cached is not None:
+            return response_from_cache(request, cached)
+
+        response = await call_next(request)
+        if not is_storable(response):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        cached = CachedResponse(
+            status_code=response.status_code,
+            headers=[
+                (name, value) for name, value in response.headers.items()
+                if name not in SKIPPED_HEADERS
+            ],
+            body=body
+        )
+        await response_cache.store(key, cached, versions, ttl)
+
+        return build_response(cached)
+
+
+def is_cacheable_request(request: Request) -> bool:
+    # Credentials could make a response personal, profiling needs the app
+    return (
+        request.method == "GET"
+        and "authorization" not in request.headers
+        and "access_token" not in request.cookies
+        and "profile" not in request.query_params
+    )
+
+
+def normalize_query(request: Request) -> str:
+    return urlencode(
+        sorted(parse_qsl(request.url.query, keep_blank_values=True))
+    )
+
+
+def is_storable(response: Response) -> bool:
+    cache_control = response.headers.get("cache-control", "")
+    return (
+        response.status_code == 200
+        and "set-cookie" not in response.headers
+        and "private" not in cache_control
+        and "no-store" not in cache_control
+    )
+
+
+def build_response(cached: CachedResponse) -> Response:
+    return Response(
+        content=cached.body,
+        status_code=cached.status_code,
+        headers=dict(cached.headers)
+    )
+
+
+def response_from_cache(request: Request, cached: CachedResponse) -> Response:
+    headers = dict(cached.headers)
+
+    if "etag" in headers:
+        last_modified = headers.get("last-modified")
+        validators = CacheValidators(
+            etag=headers["etag"],
+            last_modified=(
+                parsedate_to_datetime(last_modified) if last_modified else None
+            )
+        )
+        if is_not_modified(request, validators):
+            return not_modified_response(validators)
+
+    return build_response(cached)
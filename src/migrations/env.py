@@ -32,6 +32,8 @@ from src.models.cart import CartModel
 from src.models.cart_item import CartItemModel
 from src.models.order import OrderModel
 from src.models.order_item import OrderItemModel
+from src.models.outbox import OutboxEventModel
+from src.models.processed_event import ProcessedEventModel
 
 target_metadata = Base.metadata
 # target_metadata = None
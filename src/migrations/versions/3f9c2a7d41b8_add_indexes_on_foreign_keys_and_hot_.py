@@ -0,0 +1,54 @@
+"""Add indexes on foreign keys and hot filter columns
+
+Revision ID: 3f9c2a7d41b8
+Revises: 6bc6e78da04f
+Create Date: 2026-10-18 10:12:31.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d41b8'
+down_revision: Union[str, None] = '6bc6e78da04f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns). The (cart_id, meal_id) index also serves
+# lookups and cascading deletes on cart_id alone.
+INDEXES = [
+    ('ix_cart_items_cart_id_meal_id', 'cart_items', ['cart_id', 'meal_id']),
+    ('ix_cart_items_meal_id', 'cart_items', ['meal_id']),
+    ('ix_meals_category_id', 'meals', ['category_id']),
+    (
+        'ix_orders_user_id_created_at', 'orders',
+        ['user_id', sa.text('created_at DESC')]
+    ),
+    ('ix_order_items_order_id', 'order_items', ['order_id']),
+    ('ix_order_items_meal_id', 'order_items', ['meal_id']),
+    ('ix_user_identities_user_id', 'user_identities', ['user_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,42 @@
+"""Add outbox table
+
+Revision ID: 5d2e7a91c0f4
+Revises: 8c1e4b9a2f37
+Create Date: 2026-10-18 16:20:11.604127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e7a91c0f4'
+down_revision: Union[str, None] = '8c1e4b9a2f37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'outbox',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('topic', sa.String(length=255), nullable=False),
+        sa.Column('key', sa.String(length=255), nullable=True),
+        sa.Column(
+            'payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column(
+            'created_at', sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"), nullable=True
+        ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('outbox')
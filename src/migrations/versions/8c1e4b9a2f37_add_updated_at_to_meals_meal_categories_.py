@@ -0,0 +1,42 @@
+"""Add updated_at to meals, meal_categories and orders
+
+Revision ID: 8c1e4b9a2f37
+Revises: 3f9c2a7d41b8
+Create Date: 2026-10-18 14:05:47.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1e4b9a2f37'
+down_revision: Union[str, None] = '3f9c2a7d41b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['meals', 'meal_categories', 'orders']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(table, sa.Column(
+            'updated_at', sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True
+        ))
+        # Existing rows have not changed since they were created
+        op.execute(
+            f'UPDATE {table} '
+            f'SET updated_at = COALESCE(created_at, updated_at)'
+        )
+        op.alter_column(table, 'updated_at', nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_column(table, 'updated_at')
@@ -0,0 +1,30 @@
+"""Add version to carts
+
+Revision ID: a47c3e18d5b2
+Revises: 5d2e7a91c0f4
+Create Date: 2026-10-18 17:02:36.118420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a47c3e18d5b2'
+down_revision: Union[str, None] = '5d2e7a91c0f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('carts', sa.Column(
+        'version', sa.Integer(), server_default='0', nullable=False
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('carts', 'version')
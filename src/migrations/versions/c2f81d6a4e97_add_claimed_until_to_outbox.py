@@ -0,0 +1,30 @@
+"""Add claimed_until to outbox
+
+Revision ID: c2f81d6a4e97
+Revises: a47c3e18d5b2
+Create Date: 2026-10-19 10:14:52.307815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f81d6a4e97'
+down_revision: Union[str, None] = 'a47c3e18d5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'outbox', sa.Column('claimed_until', sa.DateTime(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('outbox', 'claimed_until')
@@ -0,0 +1,45 @@
+"""Add processed_events table
+
+Revision ID: e5a9b3c07d21
+Revises: c2f81d6a4e97
+Create Date: 2026-10-19 11:02:37.581406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9b3c07d21'
+down_revision: Union[str, None] = 'c2f81d6a4e97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'processed_events',
+        sa.Column('consumer', sa.String(length=255), nullable=False),
+        sa.Column('event_id', sa.Uuid(), nullable=False),
+        sa.Column(
+            'processed_at', sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint('consumer', 'event_id')
+    )
+    op.create_index(
+        op.f('ix_processed_events_processed_at'), 'processed_events',
+        ['processed_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f('ix_processed_events_processed_at'),
+        table_name='processed_events'
+    )
+    op.drop_table('processed_events')
@@ -21,12 +21,17 @@ class CartModel(Base):
     total_price: Mapped[Decimal] = mapped_column(
         Numeric(10, 2), nullable=False, default=Decimal("0.00")
     )
+    # Bumped on every total change, absolute updates check it to drop stale
+    # events
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow
     )
 
     user: Mapped["UserModel"] = relationship(
-        "UserModel", back_populates="cart", lazy="joined"
+        "UserModel", back_populates="cart", lazy="raise_on_sql"
     )
     items: Mapped["CartItemModel"] = relationship(
         "CartItemModel", back_populates="cart", cascade="all, delete-orphan"
@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Integer, String, Numeric, DateTime
+from sqlalchemy import ForeignKey, Index, Integer, String, Numeric, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.core.database import Base
 from src.schemas.cart_item import CartItemRead
@@ -9,6 +9,9 @@ from src.schemas.cart_item import CartItemRead
 
 class CartItemModel(Base):
     __tablename__ = "cart_items"
+    __table_args__ = (
+        Index("ix_cart_items_cart_id_meal_id", "cart_id", "meal_id"),
+    )
     __pydantic_model__ = CartItemRead
 
     id: Mapped[int] = mapped_column(
@@ -18,7 +21,7 @@ class CartItemModel(Base):
         ForeignKey("carts.id", ondelete="CASCADE"), nullable=False
     )
     meal_id: Mapped[int] = mapped_column(
-        ForeignKey("meals.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("meals.id", ondelete="CASCADE"), nullable=False, index=True
     )
     meal_name: Mapped[str] = mapped_column(String, nullable=False)
     quantity: Mapped[int] = mapped_column(default=1, nullable=False)
@@ -31,10 +34,10 @@ class CartItemModel(Base):
     )
 
     cart: Mapped["CartModel"] = relationship(
-        "CartModel", back_populates="items", lazy="joined"
+        "CartModel", back_populates="items", lazy="raise_on_sql"
     )
     meal: Mapped["MealModel"] = relationship(
-        "MealModel", back_populates="cart_items", lazy="joined"
+        "MealModel", back_populates="cart_items", lazy="raise_on_sql"
     )
 
     repr_cols_num = 3
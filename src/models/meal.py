@@ -1,7 +1,9 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Text, Integer, String, Numeric, DateTime
+from sqlalchemy import (
+    ForeignKey, Text, Integer, String, Numeric, DateTime, func
+)
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from src.core.database import Base
@@ -20,13 +22,21 @@ class MealModel(Base):
     )
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     category_id: Mapped[int] = mapped_column(
-        ForeignKey("meal_categories.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("meal_categories.id", ondelete="CASCADE"),
+        nullable=False, index=True
     )
     description: Mapped[str] = mapped_column(Text, nullable=False)
     unit_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.timezone("utc", func.now()),
+        nullable=False
+    )
 
     category: Mapped["MealCategoryModel"] = relationship(
         "MealCategoryModel", back_populates="meals"
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, String, DateTime
+from sqlalchemy import Integer, String, DateTime, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from src.core.database import Base
@@ -18,6 +18,13 @@ class MealCategoryModel(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.timezone("utc", func.now()),
+        nullable=False
+    )
 
     meals: Mapped["MealModel"] = relationship(
         "MealModel", back_populates="category"
@@ -1,7 +1,9 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Integer, Enum, Numeric, DateTime, String
+from sqlalchemy import (
+    ForeignKey, Index, Integer, Enum, Numeric, DateTime, String, func
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.core.database import Base
 import enum
@@ -79,12 +81,19 @@ class OrderModel(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=func.timezone("utc", func.now()),
+        nullable=False
+    )
 
     items: Mapped[list["OrderItemModel"]] = relationship(
         "OrderItemModel", back_populates="order", cascade="all, delete-orphan"
     )
     user: Mapped["UserModel"] = relationship(
-        "UserModel", back_populates="orders", lazy="joined"
+        "UserModel", back_populates="orders", lazy="raise_on_sql"
     )
 
     repr_cols_num = 3
@@ -92,3 +101,10 @@ class OrderModel(Base):
 
     def __str__(self):
         return f"Order of user with id={self.user_id}"
+
+
+Index(
+    "ix_orders_user_id_created_at",
+    OrderModel.user_id,
+    OrderModel.created_at.desc()
+)
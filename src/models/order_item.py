@@ -16,10 +16,10 @@ class OrderItemModel(Base):
         Integer, primary_key=True, autoincrement=True
     )
     order_id: Mapped[int] = mapped_column(
-        ForeignKey("orders.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("orders.id", ondelete="CASCADE"), nullable=False, index=True
     )
     meal_id: Mapped[int] = mapped_column(
-        ForeignKey("meals.id", ondelete="SET NULL"), nullable=True
+        ForeignKey("meals.id", ondelete="SET NULL"), nullable=True, index=True
     )
     meal_name: Mapped[str] = mapped_column(String, nullable=False)
     quantity: Mapped[int] = mapped_column(default=1, nullable=False)
@@ -35,7 +35,7 @@ class OrderItemModel(Base):
         "OrderModel", back_populates="items"
     )
     meal: Mapped["MealModel"] = relationship(
-        "MealModel", lazy="joined"
+        "MealModel", lazy="raise_on_sql"
     )
 
     repr_cols_num = 3
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+
+
+class OutboxEventModel(Base):
+    __tablename__ = "outbox"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=True
+    )
+    topic: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Events with the same key are relayed in the order they were written
+    key: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.timezone("utc", func.now())
+    )
+    # Set while a relay publishes the event, an expired claim is taken over
+    claimed_until: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True
+    )
+
+    repr_cols_num = 3
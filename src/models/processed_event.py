@@ -0,0 +1,24 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, String, Uuid, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+
+
+class ProcessedEventModel(Base):
+    __tablename__ = "processed_events"
+
+    # Events a consumer group has applied, recorded in the transaction that
+    # applied them
+    consumer: Mapped[str] = mapped_column(String(255), primary_key=True)
+    event_id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    processed_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.timezone("utc", func.now()),
+        nullable=False,
+        index=True
+    )
+
+    repr_cols_num = 3
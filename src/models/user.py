@@ -67,7 +67,7 @@ class UserIdentityModel(Base):
         Integer, primary_key=True, autoincrement=True
     )
     user_id: Mapped[int] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     provider: Mapped[IdentityProviderEnum] = mapped_column(
         Enum(IdentityProviderEnum, name="identity_provider_enum")
@@ -1,4 +1,4 @@
-from prometheus_client import Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
 CPU_USAGE = Gauge(
     'process_cpu_usage',
@@ -8,3 +8,102 @@ MEMORY_USAGE = Gauge(
     'process_memory_usage_bytes',
     'Current memory usage in bytes'
 )
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting for a connection from the database pool',
+    ['engine'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+DB_POOL_SIZE = Gauge(
+    'db_pool_size',
+    'Configured number of persistent connections in the database pool',
+    ['engine']
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out_connections',
+    'Database connections currently in use',
+    ['engine']
+)
+DB_POOL_OVERFLOW = Gauge(
+    'db_pool_overflow_connections',
+    'Database connections opened above the pool size',
+    ['engine']
+)
+DB_REPLICA_LAG = Gauge(
+    'db_replica_lag_seconds',
+    'Last measured replication lag of the read replica'
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    'db_queries_per_request',
+    'Number of SQL statements executed while serving a request',
+    ['method', 'handler'],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+)
+DB_QUERY_TIME_PER_REQUEST = Histogram(
+    'db_query_time_per_request_seconds',
+    'Total time spent in SQL statements while serving a request',
+    ['method', 'handler'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+
+CACHE_HITS = Counter(
+    'cache_hits_total',
+    'Lookups answered from an in-process cache',
+    ['cache']
+)
+CACHE_MISSES = Counter(
+    'cache_misses_total',
+    'Lookups that missed an in-process cache',
+    ['cache']
+)
+CACHE_EVICTIONS = Counter(
+    'cache_evictions_total',
+    'Entries evicted from an in-process cache to stay within its size',
+    ['cache']
+)
+
+SINGLEFLIGHT_EXECUTIONS = Counter(
+    'singleflight_executions_total',
+    'Calls executed by a singleflight leader',
+    ['operation']
+)
+SINGLEFLIGHT_COALESCED = Counter(
+    'singleflight_coalesced_total',
+    'Callers that joined a call already in flight instead of running it',
+    ['operation']
+)
+SINGLEFLIGHT_TIMEOUTS = Counter(
+    'singleflight_timeouts_total',
+    'Coalesced callers that stopped waiting and ran the call themselves',
+    ['operation']
+)
+
+NEGATIVE_CACHE_HITS = Counter(
+    'negative_cache_hits_total',
+    'Lookups of missing rows answered from the negative cache, no query run',
+    ['entity']
+)
+
+INVALIDATION_MESSAGES = Counter(
+    'cache_invalidation_messages_total',
+    'Invalidation messages received from other workers over LISTEN/NOTIFY',
+    ['entity']
+)
+
+OUTBOX_EVENTS_RELAYED = Counter(
+    'outbox_events_relayed_total',
+    'Outbox events published to Kafka by the relay',
+    ['topic']
+)
+OUTBOX_RELAY_FAILURES = Counter(
+    'outbox_relay_failures_total',
+    'Outbox events the relay failed to publish, retried on the next round',
+    ['topic']
+)
+OUTBOX_RELAY_DELAY = Histogram(
+    'outbox_relay_delay_seconds',
+    'Time from writing an outbox event to publishing it',
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
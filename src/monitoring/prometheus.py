@@ -1,8 +1,12 @@
 import psutil
 from prometheus_fastapi_instrumentator import Instrumentator
 from prometheus_fastapi_instrumentator.metrics import default as default_metrics
+from src.core.database import async_engine, replica_engine
 from src.core.logging import logger
-from src.monitoring.metrics import CPU_USAGE, MEMORY_USAGE
+from src.monitoring.metrics import (
+    CPU_USAGE, MEMORY_USAGE, DB_POOL_SIZE, DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW
+)
 from prometheus_client import REGISTRY, CollectorRegistry, Metric
 
 
@@ -27,10 +31,26 @@ async def update_system_metrics(info):
         logger.warning(f"Failed to update system metrics: {e}")
 
 
+async def update_db_pool_metrics(info):
+    try:
+        for engine in (async_engine, replica_engine):
+            if engine is None:
+                continue
+
+            pool = engine.pool
+            engine_name = pool.logging_name
+            DB_POOL_SIZE.labels(engine_name).set(pool.size())
+            DB_POOL_CHECKED_OUT.labels(engine_name).set(pool.checkedout())
+            DB_POOL_OVERFLOW.labels(engine_name).set(max(pool.overflow(), 0))
+    except Exception as e:
+        logger.warning(f"Failed to update database pool metrics: {e}")
+
+
 def setup_instrumentator(app):
     instrumentator = Instrumentator(
         should_respect_env_var=True, registry=AppNameRegistry()
     )
     instrumentator.add(default_metrics())
     instrumentator.add(update_system_metrics)
+    instrumentator.add(update_db_pool_metrics)
     instrumentator.instrument(app).expose(app)
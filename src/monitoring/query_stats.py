@@ -0,0 +1,87 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.logging import logger
+
+
+class QueryStats:
+    def __init__(self, parent: "QueryStats | None" = None) -> None:
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+        if self.parent is not None:
+            self.parent.record(statement, duration)
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def get_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    # Nested trackers also report to the enclosing one, so a test can wrap a
+    # request that the middleware tracks on its own
+    stats = QueryStats(parent=_query_stats.get())
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    if _query_stats.get() is not None:
+        context._query_start_time = perf_counter()
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    stats = _query_stats.get()
+    start = getattr(context, "_query_start_time", None)
+
+    if stats is not None and start is not None:
+        stats.record(statement, perf_counter() - start)
+
+
+def setup_query_listeners(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+
+    if event.contains(
+        sync_engine, "before_cursor_execute", _before_cursor_execute
+    ):
+        return
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    logger.info(
+        f"SQL query listeners were attached to the "
+        f"{engine.pool.logging_name} engine"
+    )
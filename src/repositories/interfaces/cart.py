@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Protocol
 
 from src.models.cart import CartModel
@@ -9,7 +10,18 @@ class ICartRepository(Protocol):
     async def get_by_user_id(self, user_id: int) -> CartModel | None: ...
 
     async def update(
-        self, user_id: int, cart_data: dict[str, str]
+        self,
+        user_id: int,
+        cart_data: dict[str, str],
+        version: int | None = None
     ) -> CartModel | None: ...
 
+    async def add_to_total(
+        self, user_id: int, delta: Decimal
+    ) -> CartModel | None: ...
+
+    async def add_to_totals(
+        self, changes: dict[int, tuple[Decimal, int]]
+    ) -> list[CartModel]: ...
+
     async def delete(self, cart_id: int) -> None: ...
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Protocol
 
 from src.models.cart_item import CartItemModel
@@ -10,14 +11,16 @@ class ICartItemRepository(Protocol):
     async def get_all_by_cart_id(self, cart_id: int) -> list[CartItemModel]:
         ...
 
-    async def get_by_id(self, item_id: int) -> CartItemModel | None: ...
+    async def get_by_id(
+        self, item_id: int, for_update: bool = False
+    ) -> CartItemModel | None: ...
 
     async def get_by_cart_and_item_id(
-        self, cart_id: int, item_id: int
+        self, cart_id: int, item_id: int, for_update: bool = False
     ) -> CartItemModel | None: ...
 
     async def get_by_cart_and_meal_id(
-        self, cart_id: int, meal_id: int
+        self, cart_id: int, meal_id: int, for_update: bool = False
     ) -> CartItemModel | None: ...
 
     async def update(
@@ -26,4 +29,4 @@ class ICartItemRepository(Protocol):
 
     async def delete_by_id(self, item_id: int) -> None: ...
 
-    async def delete_all_by_cart_id(self, cart_id: int) -> None: ...
+    async def delete_all_by_cart_id(self, cart_id: int) -> Decimal: ...
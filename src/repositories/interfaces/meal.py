@@ -1,3 +1,4 @@
+from datetime import datetime
 from decimal import Decimal
 from typing import Protocol
 
@@ -10,8 +11,14 @@ class IMealRepository(Protocol):
     ) -> MealModel: ...
 
     async def get_all_by_category_id(
-        self, category_id: int, limit: int, offset: int
-    ) -> list[MealModel]: ...
+        self,
+        category_id: int,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_total: bool = False
+    ) -> tuple[list[MealModel], int | None]: ...
 
     async def get_by_id(self, meal_id: int) -> MealModel | None: ...
 
@@ -19,6 +26,16 @@ class IMealRepository(Protocol):
 
     async def get_total_count(self, category_id: int) -> int: ...
 
+    async def get_estimated_count(self, category_id: int) -> int: ...
+
+    async def get_updated_at(
+        self, meal_id: int, category_id: int
+    ) -> datetime | None: ...
+
+    async def get_list_version(
+        self, category_id: int
+    ) -> tuple[datetime | None, int]: ...
+
     async def update(
         self, meal_id: int, meal_data: dict[str, int | str | Decimal]
     ) -> MealModel: ...
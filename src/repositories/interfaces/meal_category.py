@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Protocol
 
 from src.models.meal_category import MealCategoryModel
@@ -9,8 +10,13 @@ class IMealCategoryRepository(Protocol):
     ) -> MealCategoryModel: ...
 
     async def get_all(
-        self, limit: int, offset: int
-    ) -> list[MealCategoryModel]: ...
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_total: bool = False
+    ) -> tuple[list[MealCategoryModel], int | None]: ...
 
     async def get_by_id(self, category_id: int) -> MealCategoryModel | None:
         ...
@@ -21,6 +27,12 @@ class IMealCategoryRepository(Protocol):
 
     async def get_total_count(self) -> int: ...
 
+    async def get_estimated_count(self) -> int: ...
+
+    async def get_updated_at(self, category_id: int) -> datetime | None: ...
+
+    async def get_list_version(self) -> tuple[datetime | None, int]: ...
+
     async def update(
         self, category_id: int, category_data: dict[str, int | str]
     ) -> MealCategoryModel: ...
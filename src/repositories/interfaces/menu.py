@@ -0,0 +1,10 @@
+from typing import Protocol
+
+from src.models.meal import MealModel
+from src.models.meal_category import MealCategoryModel
+
+
+class IMenuRepository(Protocol):
+    async def get_all_categories(self) -> list[MealCategoryModel]: ...
+
+    async def get_all_meals(self) -> list[MealModel]: ...
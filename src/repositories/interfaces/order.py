@@ -19,6 +19,14 @@ class IOrderRepository(Protocol):
         self, user_id: int, order_id: int
     ) -> OrderModel | None: ...
 
+    async def get_updated_at(
+        self, user_id: int, order_id: int
+    ) -> datetime | None: ...
+
+    async def get_list_version(
+        self, user_id: int
+    ) -> tuple[datetime | None, int]: ...
+
     async def delete_one(self, user_id: int, order_id: int) -> None: ...
 
-    async def delete_all(self, user_id: int) -> None: ...
+    async def delete_all(self, user_id: int) -> int: ...
@@ -0,0 +1,19 @@
+from typing import Any, Protocol
+
+from src.models.outbox import OutboxEventModel
+
+
+class IOutboxRepository(Protocol):
+    async def add(
+        self, topic: str, payload: dict[str, Any], key: str | None = None
+    ) -> None: ...
+
+    async def acquire_relay_lock(self) -> bool: ...
+
+    async def claim_batch(
+        self, limit: int, lease_seconds: float
+    ) -> list[OutboxEventModel]: ...
+
+    async def release(self, event_ids: list[int]) -> None: ...
+
+    async def delete_by_ids(self, event_ids: list[int]) -> None: ...
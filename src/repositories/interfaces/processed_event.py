@@ -0,0 +1,11 @@
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+
+class IProcessedEventRepository(Protocol):
+    async def add_new(
+        self, consumer: str, event_ids: list[UUID]
+    ) -> set[UUID]: ...
+
+    async def delete_processed_before(self, cutoff: datetime) -> int: ...
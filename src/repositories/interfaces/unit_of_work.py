@@ -0,0 +1,26 @@
+from types import TracebackType
+from typing import Any, Callable, Protocol, Self
+
+
+class IUnitOfWork(Protocol):
+    async def __aenter__(self) -> Self: ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None
+    ) -> None: ...
+
+    @property
+    def in_transaction(self) -> bool: ...
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+    async def notify_invalidation(
+        self, entity: str, *entity_ids: int
+    ) -> None: ...
+
+    def add_after_commit_hook(self, hook: Callable[[], Any]) -> None: ...
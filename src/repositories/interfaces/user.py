@@ -6,7 +6,14 @@ from src.models.user import UserModel
 class IUserRepository(Protocol):
     async def create(self, user_data: dict[str, int | str]) -> UserModel: ...
 
-    async def get_all(self, limit: int, offset: int) -> list[UserModel]: ...
+    async def get_all(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_total: bool = False
+    ) -> tuple[list[UserModel], int | None]: ...
 
     async def get_by_id(self, user_id: int) -> UserModel | None: ...
 
@@ -14,6 +21,8 @@ class IUserRepository(Protocol):
 
     async def get_total_count(self) -> int: ...
 
+    async def get_estimated_count(self) -> int: ...
+
     async def update(
         self, user_id: int, user_data: dict[str, int | str]
     ) -> UserModel: ...
@@ -1,6 +1,10 @@
+from decimal import Decimal
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete, update
+from sqlalchemy import (
+    Integer, Numeric, column, insert, delete, update, values
+)
 
 from src.core.logging import logger
 from src.models.cart import CartModel
@@ -12,11 +16,9 @@ class SQLAlchemyCartRepository:
 
     async def create(self, user_id: int) -> CartModel:
         logger.debug(f"SQLAlchemy Cart repo: Creating cart for user {user_id}")
-        cart = CartModel(user_id=user_id)
-        self.db.add(cart)
-
-        await self.db.commit()
-        await self.db.refresh(cart)
+        cart = await self.db.scalar(
+            insert(CartModel).values(user_id=user_id).returning(CartModel)
+        )
         logger.info(
             f"SQLAlchemy Cart repo: New cart {cart.id} for user {user_id}"
         )
@@ -44,28 +46,100 @@ class SQLAlchemyCartRepository:
         return cart
 
     async def update(
-        self, user_id: int, cart_data: dict[str, str]
+        self,
+        user_id: int,
+        cart_data: dict[str, str],
+        version: int | None = None
     ) -> CartModel | None:
         logger.debug(
             f"SQLAlchemy Cart repo: Updating cart for user {user_id}, "
-            f"data: {cart_data}"
+            f"data: {cart_data}, version: {version}"
         )
-        await self.db.execute(
+        stmt = update(CartModel).where(CartModel.user_id == user_id)
+
+        if version is not None:
+            stmt = stmt.where(CartModel.version == version)
+
+        updated_cart = await self.db.scalar(
+            stmt
+            .values(**cart_data, version=CartModel.version + 1)
+            .returning(CartModel)
+            .execution_options(populate_existing=True)
+        )
+        if updated_cart:
+            logger.info(
+                f"SQLAlchemy Cart repo: Cart updated for user {user_id}"
+            )
+
+        return updated_cart
+
+    async def add_to_total(
+        self, user_id: int, delta: Decimal
+    ) -> CartModel | None:
+        logger.debug(
+            f"SQLAlchemy Cart repo: Adding {delta} to cart total "
+            f"for user {user_id}"
+        )
+        # One statement, so concurrent deltas for a cart never get lost
+        updated_cart = await self.db.scalar(
             update(CartModel)
             .where(CartModel.user_id == user_id)
-            .values(**cart_data)
+            .values(
+                total_price=CartModel.total_price + delta,
+                version=CartModel.version + 1
+            )
+            .returning(CartModel)
+            .execution_options(populate_existing=True)
         )
-        await self.db.commit()
-
-        updated_cart = await self.get_by_user_id(user_id)
-        logger.info(f"SQLAlchemy Cart repo: Cart updated for user {user_id}")
+        if updated_cart:
+            logger.info(
+                f"SQLAlchemy Cart repo: Cart total changed by {delta} "
+                f"for user {user_id}"
+            )
 
         return updated_cart
 
+    async def add_to_totals(
+        self, changes: dict[int, tuple[Decimal, int]]
+    ) -> list[CartModel]:
+        """Apply the total change and the number of changes it sums up for
+        every user ID in ``changes``, in one UPDATE."""
+        logger.debug(
+            f"SQLAlchemy Cart repo: Changing cart totals for "
+            f"{len(changes)} users"
+        )
+        rows = values(
+            column("user_id", Integer),
+            column("delta", Numeric(10, 2)),
+            column("changes", Integer),
+            name="changes"
+        ).data([
+            (user_id, delta, count)
+            for user_id, (delta, count) in changes.items()
+        ])
+        result = await self.db.scalars(
+            update(CartModel)
+            .where(CartModel.user_id == rows.c.user_id)
+            .values(
+                total_price=CartModel.total_price + rows.c.delta,
+                version=CartModel.version + rows.c.changes
+            )
+            .returning(CartModel)
+            .execution_options(
+                populate_existing=True, synchronize_session=False
+            )
+        )
+        carts = list(result.all())
+        logger.info(
+            f"SQLAlchemy Cart repo: Cart totals changed for "
+            f"{len(carts)} users"
+        )
+
+        return carts
+
     async def delete(self, user_id: int) -> None:
         logger.debug(f"SQLAlchemy Cart repo: Deleting cart for user {user_id}")
         await self.db.execute(
             delete(CartModel).where(CartModel.user_id == user_id)
         )
-        await self.db.commit()
         logger.info(f"SQLAlchemy Cart repo: Cart deleted for user {user_id}")
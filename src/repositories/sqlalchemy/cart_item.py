@@ -1,4 +1,6 @@
-from sqlalchemy import update, delete
+from decimal import Decimal
+
+from sqlalchemy import insert, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -14,11 +16,9 @@ class SQLAlchemyCartItemRepository:
         logger.debug(
             f"SQLAlchemy Cart Item repo: Creating cart item, data: {cart_data}"
         )
-        item = CartItemModel(**cart_data)
-        self.db.add(item)
-
-        await self.db.commit()
-        await self.db.refresh(item)
+        item = await self.db.scalar(
+            insert(CartItemModel).values(**cart_data).returning(CartItemModel)
+        )
         logger.info(
             f"SQLAlchemy Cart Item repo: Cart item created with ID: "
             f"{item.id}, meal_id: {item.meal_id}, quantity: {item.quantity}"
@@ -40,13 +40,21 @@ class SQLAlchemyCartItemRepository:
 
         return items
 
-    async def get_by_id(self, item_id: int) -> CartItemModel | None:
+    async def get_by_id(
+        self, item_id: int, for_update: bool = False
+    ) -> CartItemModel | None:
         logger.debug(
             f"SQLAlchemy Cart Item repo: Getting item by ID: {item_id}"
         )
-        result = await self.db.execute(
-            select(CartItemModel).where(CartItemModel.id == item_id)
-        )
+        stmt = select(CartItemModel).where(CartItemModel.id == item_id)
+
+        if for_update:
+            # Reloads a row left stale by an earlier read in this session
+            stmt = stmt.with_for_update().execution_options(
+                populate_existing=True
+            )
+
+        result = await self.db.execute(stmt)
         item = result.scalar_one_or_none()
 
         if item:
@@ -62,19 +70,24 @@ class SQLAlchemyCartItemRepository:
         return item
 
     async def get_by_cart_and_item_id(
-        self, cart_id: int, item_id: int
+        self, cart_id: int, item_id: int, for_update: bool = False
     ) -> CartItemModel | None:
         logger.debug(
             f"SQLAlchemy Cart Item repo: Getting item {item_id} "
             f"from cart {cart_id}"
         )
-        result = await self.db.execute(
-            select(CartItemModel)
-            .where(
-                CartItemModel.cart_id == cart_id,
-                CartItemModel.id == item_id
-            )
+        stmt = select(CartItemModel).where(
+            CartItemModel.cart_id == cart_id,
+            CartItemModel.id == item_id
         )
+
+        if for_update:
+            # Reloads a row left stale by an earlier read in this session
+            stmt = stmt.with_for_update().execution_options(
+                populate_existing=True
+            )
+
+        result = await self.db.execute(stmt)
         item = result.scalar_one_or_none()
 
         if item:
@@ -90,19 +103,23 @@ class SQLAlchemyCartItemRepository:
         return item
 
     async def get_by_cart_and_meal_id(
-        self, cart_id: int, meal_id: int
+        self, cart_id: int, meal_id: int, for_update: bool = False
     ) -> CartItemModel | None:
         logger.debug(
             f"SQLAlchemy Cart Item repo: Getting item for meal {meal_id} "
             f"in cart {cart_id}"
         )
-        result = await self.db.execute(
-            select(CartItemModel)
-            .where(
-                CartItemModel.cart_id == cart_id,
-                CartItemModel.meal_id == meal_id
-            )
+        stmt = select(CartItemModel).where(
+            CartItemModel.cart_id == cart_id,
+            CartItemModel.meal_id == meal_id
         )
+
+        if for_update:
+            stmt = stmt.with_for_update().execution_options(
+                populate_existing=True
+            )
+
+        result = await self.db.execute(stmt)
         item = result.scalar_one_or_none()
 
         if item:
@@ -124,13 +141,13 @@ class SQLAlchemyCartItemRepository:
             f"SQLAlchemy Cart Item repo: Updating item {item_id}, "
             f"data: {cart_data}"
         )
-        await self.db.execute(
+        updated_item = await self.db.scalar(
             update(CartItemModel)
             .where(CartItemModel.id == item_id)
             .values(**cart_data)
+            .returning(CartItemModel)
+            .execution_options(populate_existing=True)
         )
-        await self.db.commit()
-        updated_item = await self.get_by_id(item_id)
         logger.info(f"SQLAlchemy Cart Item repo: Item {item_id} was updated")
 
         return updated_item
@@ -140,18 +157,23 @@ class SQLAlchemyCartItemRepository:
         await self.db.execute(
             delete(CartItemModel).where(CartItemModel.id == item_id)
         )
-        await self.db.commit()
         logger.info(f"SQLAlchemy Cart Item repo: Item {item_id} was deleted")
 
-    async def delete_all_by_cart_id(self, cart_id: int) -> None:
+    async def delete_all_by_cart_id(self, cart_id: int) -> Decimal:
         logger.debug(
             f"SQLAlchemy Cart Item repo: Deleting all items for cart {cart_id}"
         )
-        await self.db.execute(
-            delete(CartItemModel).where(CartItemModel.cart_id == cart_id)
+        # Totals of the rows actually deleted, including ones added since
+        # the items were read
+        result = await self.db.execute(
+            delete(CartItemModel)
+            .where(CartItemModel.cart_id == cart_id)
+            .returning(CartItemModel.total_price)
         )
-        await self.db.commit()
+        deleted_total = sum(result.scalars().all(), Decimal("0.00"))
         logger.info(
             f"SQLAlchemy Cart Item repo: All items were "
-            f"deleted from cart {cart_id}"
+            f"deleted from cart {cart_id}, total: {deleted_total}"
         )
+
+        return deleted_total
@@ -1,28 +1,31 @@
+from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import update, delete, func
+from sqlalchemy import insert, update, delete, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.core.logging import logger
+from src.core.utils.count_cache import count_cache
 from src.models.meal import MealModel
+from src.repositories.sqlalchemy.pagination import paginate_by_id, unpack_page
 
 
 class SQLAlchemyMealRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, read_db: AsyncSession | None = None):
         self.db = db
+        self.read_db = read_db or db
 
     async def create(
         self, meal_data: dict[str, int | str | Decimal]
     ) -> MealModel:
         logger.debug(f"SQLAlchemy Meal repo: Creating meal, data: {meal_data}")
-        meal = MealModel(**meal_data)
-        self.db.add(meal)
-
         try:
-            await self.db.commit()
-            await self.db.refresh(meal)
+            meal = await self.db.scalar(
+                insert(MealModel).values(**meal_data).returning(MealModel)
+            )
+            count_cache.invalidate("meals:")
             logger.info(
                 f"SQLAlchemy Meal repo: Meal was created with "
                 f"ID: {meal.id}, name: {meal.name}"
@@ -33,29 +36,37 @@ class SQLAlchemyMealRepository:
                 f"SQLAlchemy Meal repo: Failed to create meal "
                 f"due to integrity error: {e}"
             )
-            await self.db.rollback()
             raise
 
     async def get_all_by_category_id(
-        self, category_id: int, limit: int, offset: int
-    ) -> list[MealModel]:
+        self,
+        category_id: int,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_total: bool = False
+    ) -> tuple[list[MealModel], int | None]:
         logger.debug(
             f"SQLAlchemy Meal repo: Getting meals for category {category_id}, "
-            f"limit: {limit}, offset: {offset}"
+            f"limit: {limit}, offset: {offset}, after: {after_id}, "
+            f"before: {before_id}"
         )
-        result = await self.db.execute(
-            select(MealModel)
-            .where(MealModel.category_id == category_id)
-            .limit(limit)
-            .offset(offset)
-        )
-        meals = result.scalars().all()
+        result = await self.read_db.execute(paginate_by_id(
+            select(MealModel).where(MealModel.category_id == category_id),
+            MealModel, limit, offset, after_id, before_id, with_total
+        ))
+        meals, total = unpack_page(result, with_total)
+
+        if with_total and total is None:
+            total = await self.get_total_count(category_id)
+
         logger.debug(
             f"SQLAlchemy Meal repo: {len(meals)} meals from"
             f" category {category_id}"
         )
 
-        return meals
+        return meals, total
 
     async def get_by_id(self, meal_id: int) -> MealModel | None:
         logger.debug(f"SQLAlchemy Meal repo: Getting meal by ID {meal_id}")
@@ -95,7 +106,7 @@ class SQLAlchemyMealRepository:
             f"SQLAlchemy Meal repo: Getting total meal count for "
             f"category {category_id}"
         )
-        result = await self.db.execute(
+        result = await self.read_db.execute(
             select(func.count())
             .where(MealModel.category_id == category_id)
             .select_from(MealModel)
@@ -108,21 +119,63 @@ class SQLAlchemyMealRepository:
 
         return count
 
+    async def get_updated_at(
+        self, meal_id: int, category_id: int
+    ) -> datetime | None:
+        logger.debug(
+            f"SQLAlchemy Meal repo: Getting updated_at of meal {meal_id} "
+            f"in category {category_id}"
+        )
+        return await self.db.scalar(
+            select(MealModel.updated_at)
+            .where(
+                MealModel.id == meal_id, MealModel.category_id == category_id
+            )
+        )
+
+    async def get_list_version(
+        self, category_id: int
+    ) -> tuple[datetime | None, int]:
+        logger.debug(
+            f"SQLAlchemy Meal repo: Getting meals list version for "
+            f"category {category_id}"
+        )
+        result = await self.read_db.execute(
+            select(func.max(MealModel.updated_at), func.count())
+            .where(MealModel.category_id == category_id)
+        )
+        last_modified, count = result.one()
+
+        return last_modified, count
+
+    async def get_estimated_count(self, category_id: int) -> int:
+        # Filtered by category, so the planner's table-wide estimate is of no
+        # use here and the exact count is cached instead
+        cache_key = f"meals:{category_id}"
+        count = count_cache.get(cache_key)
+
+        if count is None:
+            count = await self.get_total_count(category_id)
+            count_cache.set(cache_key, count)
+
+        return count
+
     async def update(
         self, meal_id: int, meal_data: dict[str, int | str | Decimal]
     ) -> MealModel:
         logger.debug(
             f"SQLAlchemy Meal repo: Updating meal {meal_id}, data: {meal_data}"
         )
-        await self.db.execute(
-            update(MealModel)
-            .where(MealModel.id == meal_id)
-            .values(**meal_data)
-        )
-
         try:
-            await self.db.commit()
-            updated_meal = await self.get_by_id(meal_id)
+            updated_meal = await self.db.scalar(
+                update(MealModel)
+                .where(MealModel.id == meal_id)
+                .values(**meal_data)
+                .returning(MealModel)
+                .execution_options(populate_existing=True)
+            )
+            if "category_id" in meal_data:
+                count_cache.invalidate("meals:")
             logger.info(f"SQLAlchemy Meal repo: Meal {meal_id} was updated")
             return updated_meal
         except IntegrityError as e:
@@ -130,11 +183,10 @@ class SQLAlchemyMealRepository:
                 f"SQLAlchemy Meal repo: Failed to update meal {meal_id} "
                 f"due to integrity error: {e}"
             )
-            await self.db.rollback()
             raise
 
     async def delete(self, meal_id: int) -> None:
         logger.debug(f"SQLAlchemy Meal repo: Deleting meal {meal_id}")
         await self.db.execute(delete(MealModel).where(MealModel.id == meal_id))
-        await self.db.commit()
+        count_cache.invalidate("meals:")
         logger.info(f"SQLAlchemy Meal repo: Meal {meal_id} was deleted")
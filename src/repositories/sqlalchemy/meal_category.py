@@ -1,27 +1,35 @@
-from sqlalchemy import update, delete, func
+from datetime import datetime
+
+from sqlalchemy import insert, update, delete, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.core.logging import logger
+from src.core.utils.count_cache import count_cache
 from src.models.meal_category import MealCategoryModel
+from src.repositories.sqlalchemy.pagination import (
+    paginate_by_id, unpack_page, estimate_row_count
+)
 
 
 class SQLAlchemyMealCategoryRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, read_db: AsyncSession | None = None):
         self.db = db
+        self.read_db = read_db or db
 
     async def create(self, category_data: dict[str, str]) -> MealCategoryModel:
         logger.debug(
             f"SQLAlchemy Meal Category repo: Creating category, "
             f"data: {category_data}"
         )
-        category = MealCategoryModel(**category_data)
-        self.db.add(category)
-
         try:
-            await self.db.commit()
-            await self.db.refresh(category)
+            category = await self.db.scalar(
+                insert(MealCategoryModel)
+                .values(**category_data)
+                .returning(MealCategoryModel)
+            )
+            count_cache.invalidate("meal_categories")
             logger.info(
                 f"SQLAlchemy Meal Category repo: Category created with "
                 f"ID: {category.id}, name: {category.name}"
@@ -33,25 +41,35 @@ class SQLAlchemyMealCategoryRepository:
                 f"SQLAlchemy Meal Category repo: Failed to create category "
                 f"due to integrity error: {e}"
             )
-            await self.db.rollback()
             raise
 
     async def get_all(
-        self, limit: int, offset: int
-    ) -> list[MealCategoryModel]:
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_total: bool = False
+    ) -> tuple[list[MealCategoryModel], int | None]:
         logger.debug(
             f"SQLAlchemy Meal Category repo: Getting categories, "
-            f"limit: {limit}, offset: {offset}"
-        )
-        result = await self.db.execute(
-            select(MealCategoryModel).limit(limit).offset(offset)
+            f"limit: {limit}, offset: {offset}, after: {after_id}, "
+            f"before: {before_id}"
         )
-        categories = result.scalars().all()
+        result = await self.read_db.execute(paginate_by_id(
+            select(MealCategoryModel), MealCategoryModel,
+            limit, offset, after_id, before_id, with_total
+        ))
+        categories, total = unpack_page(result, with_total)
+
+        if with_total and total is None:
+            total = await self.get_total_count()
+
         logger.debug(
             f"SQLAlchemy Meal Category repo: {len(categories)} categories"
         )
 
-        return categories
+        return categories, total
 
     async def get_by_id(self, category_id: int) -> MealCategoryModel | None:
         logger.debug(
@@ -107,7 +125,7 @@ class SQLAlchemyMealCategoryRepository:
         logger.debug(
             "SQLAlchemy Meal Category repo: Getting total meal category count"
         )
-        result = await self.db.execute(
+        result = await self.read_db.execute(
             select(func.count()).select_from(MealCategoryModel)
         )
         count = result.scalar_one()
@@ -117,6 +135,45 @@ class SQLAlchemyMealCategoryRepository:
 
         return count
 
+    async def get_updated_at(self, category_id: int) -> datetime | None:
+        logger.debug(
+            f"SQLAlchemy Meal Category repo: Getting updated_at of "
+            f"category {category_id}"
+        )
+        return await self.db.scalar(
+            select(MealCategoryModel.updated_at)
+            .where(MealCategoryModel.id == category_id)
+        )
+
+    async def get_list_version(self) -> tuple[datetime | None, int]:
+        logger.debug(
+            "SQLAlchemy Meal Category repo: Getting categories list version"
+        )
+        result = await self.read_db.execute(
+            select(func.max(MealCategoryModel.updated_at), func.count())
+            .select_from(MealCategoryModel)
+        )
+        last_modified, count = result.one()
+
+        return last_modified, count
+
+    async def get_estimated_count(self) -> int:
+        count = count_cache.get("meal_categories")
+
+        if count is None:
+            count = await estimate_row_count(
+                self.read_db, MealCategoryModel.__table__
+            )
+            if count is None:
+                count = await self.get_total_count()
+            count_cache.set("meal_categories", count)
+
+        logger.debug(
+            f"SQLAlchemy Meal Category repo: Estimated meal categories: {count}"
+        )
+
+        return count
+
     async def update(
         self, category_id: int, category_data: dict[str, str]
     ) -> MealCategoryModel:
@@ -124,15 +181,14 @@ class SQLAlchemyMealCategoryRepository:
             f"SQLAlchemy Meal Category repo: Updating meal category "
             f"{category_id}, data: {category_data}"
         )
-        await self.db.execute(
-            update(MealCategoryModel)
-            .where(MealCategoryModel.id == category_id)
-            .values(**category_data)
-        )
-
         try:
-            await self.db.commit()
-            updated_category = await self.get_by_id(category_id)
+            updated_category = await self.db.scalar(
+                update(MealCategoryModel)
+                .where(MealCategoryModel.id == category_id)
+                .values(**category_data)
+                .returning(MealCategoryModel)
+                .execution_options(populate_existing=True)
+            )
             logger.info(
                 f"SQLAlchemy Meal Category repo: Category {category_id} "
                 f"was updated"
@@ -144,7 +200,6 @@ class SQLAlchemyMealCategoryRepository:
                 f"SQLAlchemy Meal Category repo: Failed to update category "
                 f"{category_id} due to integrity error: {e}"
             )
-            await self.db.rollback()
             raise
 
     async def delete(self, category_id: int) -> None:
@@ -155,7 +210,9 @@ class SQLAlchemyMealCategoryRepository:
             delete(MealCategoryModel)
             .where(MealCategoryModel.id == category_id)
         )
-        await self.db.commit()
+        # Meals of the category go with it through ON DELETE CASCADE
+        count_cache.invalidate("meal_categories")
+        count_cache.invalidate("meals:")
         logger.info(
             f"SQLAlchemy Meal Category repo: Category {category_id} was deleted"
         )
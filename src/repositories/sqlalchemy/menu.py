@@ -0,0 +1,35 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.core.logging import logger
+from src.models.meal import MealModel
+from src.models.meal_category import MealCategoryModel
+
+
+class SQLAlchemyMenuRepository:
+    # Always reads the primary: the snapshot is rebuilt right after a write
+    # commits and a lagging replica would freeze the old menu in it
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_all_categories(self) -> list[MealCategoryModel]:
+        logger.debug("SQLAlchemy Menu repo: Getting all categories")
+        result = await self.db.execute(
+            select(MealCategoryModel).order_by(MealCategoryModel.id)
+        )
+        categories = result.scalars().all()
+        logger.debug(
+            f"SQLAlchemy Menu repo: Retrieved {len(categories)} categories"
+        )
+
+        return categories
+
+    async def get_all_meals(self) -> list[MealModel]:
+        logger.debug("SQLAlchemy Menu repo: Getting all meals")
+        result = await self.db.execute(
+            select(MealModel).order_by(MealModel.category_id, MealModel.id)
+        )
+        meals = result.scalars().all()
+        logger.debug(f"SQLAlchemy Menu repo: Retrieved {len(meals)} meals")
+
+        return meals
@@ -1,10 +1,11 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import delete
+from sqlalchemy import insert, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.core.logging import logger
 from src.models.order import OrderModel
@@ -12,6 +13,8 @@ from src.models.order_item import OrderItemModel
 
 
 class SQLAlchemyOrderRepository:
+    # Order history stays on the primary, a user reads it right after
+    # checking out and a lagging replica would miss the new order
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -25,31 +28,38 @@ class SQLAlchemyOrderRepository:
             f"SQLAlchemy Order repo: Creating order for user {user_id} "
             f"with {len(items_data)} items"
         )
-        order = OrderModel(user_id=user_id, **order_data)
-        self.db.add(order)
-        await self.db.flush()
-
-        order_items = [
-            OrderItemModel(
-                order_id=order.id,
-                meal_id=item_data["meal_id"],
-                quantity=item_data["quantity"],
-                meal_name=item_data["meal_name"],
-                unit_price=item_data["unit_price"],
-                total_price=item_data["total_price"]
+        order = await self.db.scalar(
+            insert(OrderModel)
+            .values(user_id=user_id, **order_data)
+            .returning(OrderModel)
+        )
+
+        order_items = []
+        if items_data:
+            result = await self.db.scalars(
+                insert(OrderItemModel)
+                .returning(OrderItemModel, sort_by_parameter_order=True),
+                [
+                    {
+                        "order_id": order.id,
+                        "meal_id": item_data["meal_id"],
+                        "quantity": item_data["quantity"],
+                        "meal_name": item_data["meal_name"],
+                        "unit_price": item_data["unit_price"],
+                        "total_price": item_data["total_price"]
+                    }
+                    for item_data in items_data
+                ]
             )
-            for item_data in items_data
-        ]
+            order_items = result.all()
 
-        self.db.add_all(order_items)
-        await self.db.commit()
-        await self.db.refresh(order)
+        set_committed_value(order, "items", order_items)
         logger.info(
             f"SQLAlchemy Order repo: Order was created for user "
             f"{user_id} with ID: {order.id}"
         )
 
-        return await self.get_by_user_and_order_id(user_id, order.id)
+        return order
 
     async def get_all(self, user_id: int) -> list[OrderModel]:
         logger.debug(
@@ -94,6 +104,33 @@ class SQLAlchemyOrderRepository:
 
         return order
 
+    async def get_updated_at(
+        self, user_id: int, order_id: int
+    ) -> datetime | None:
+        logger.debug(
+            f"SQLAlchemy Order repo: Getting updated_at of order {order_id} "
+            f"for user {user_id}"
+        )
+        return await self.db.scalar(
+            select(OrderModel.updated_at)
+            .where(OrderModel.id == order_id, OrderModel.user_id == user_id)
+        )
+
+    async def get_list_version(
+        self, user_id: int
+    ) -> tuple[datetime | None, int]:
+        logger.debug(
+            f"SQLAlchemy Order repo: Getting orders list version for "
+            f"user {user_id}"
+        )
+        result = await self.db.execute(
+            select(func.max(OrderModel.updated_at), func.count())
+            .where(OrderModel.user_id == user_id)
+        )
+        last_modified, count = result.one()
+
+        return last_modified, count
+
     async def delete_one(self, user_id: int, order_id: int) -> None:
         logger.debug(
             f"SQLAlchemy Order repo: Deleting order {order_id} "
@@ -103,19 +140,20 @@ class SQLAlchemyOrderRepository:
             delete(OrderModel)
             .where(OrderModel.id == order_id, OrderModel.user_id == user_id)
         )
-        await self.db.commit()
         logger.info(
             f"SQLAlchemy Order repo: Order {order_id} deleted for user {user_id}"
         )
 
-    async def delete_all(self, user_id: int) -> None:
+    async def delete_all(self, user_id: int) -> int:
         logger.debug(
             f"SQLAlchemy Order repo: Deleting all orders for user {user_id}"
         )
-        await self.db.execute(
+        result = await self.db.execute(
             delete(OrderModel).where(OrderModel.user_id == user_id)
         )
-        await self.db.commit()
         logger.info(
-            f"SQLAlchemy Order repo: All orders were deleted for user {user_id}"
+            f"SQLAlchemy Order repo: {result.rowcount} orders were deleted "
+            f"for user {user_id}"
         )
+
+        return result.rowcount
@@ -0,0 +1,92 @@
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import DateTime, delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import logger
+from src.models.outbox import OutboxEventModel
+
+# Advisory lock held while a relay claims events, one claim at a time keeps
+# the events of a key in order
+OUTBOX_RELAY_LOCK_ID = 724011
+
+
+class SQLAlchemyOutboxRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add(
+        self, topic: str, payload: dict[str, Any], key: str | None = None
+    ) -> None:
+        logger.debug(
+            f"SQLAlchemy Outbox repo: Adding event for topic '{topic}', "
+            f"key: {key}"
+        )
+        await self.db.execute(
+            insert(OutboxEventModel).values(
+                topic=topic, key=key, payload=payload
+            )
+        )
+
+    async def acquire_relay_lock(self) -> bool:
+        # Released with the transaction
+        return await self.db.scalar(
+            select(func.pg_try_advisory_xact_lock(OUTBOX_RELAY_LOCK_ID))
+        )
+
+    async def claim_batch(
+        self, limit: int, lease_seconds: float
+    ) -> list[OutboxEventModel]:
+        """Claim the oldest unclaimed events for ``lease_seconds``. Keys
+        with a live claim are skipped, their events wait for it to end."""
+        now = func.timezone("utc", func.now(), type_=DateTime)
+        claimed_keys = select(OutboxEventModel.key).where(
+            OutboxEventModel.claimed_until >= now,
+            OutboxEventModel.key.is_not(None)
+        )
+        claimable_ids = (
+            select(OutboxEventModel.id)
+            .where(
+                or_(
+                    OutboxEventModel.claimed_until.is_(None),
+                    OutboxEventModel.claimed_until < now
+                ),
+                or_(
+                    OutboxEventModel.key.is_(None),
+                    OutboxEventModel.key.not_in(claimed_keys)
+                )
+            )
+            .order_by(OutboxEventModel.id)
+            .limit(limit)
+        )
+        result = await self.db.scalars(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_(claimable_ids))
+            .values(claimed_until=now + timedelta(seconds=lease_seconds))
+            .returning(OutboxEventModel)
+            .execution_options(synchronize_session=False)
+        )
+        events = sorted(result.all(), key=lambda event: event.id)
+        logger.debug(f"SQLAlchemy Outbox repo: Claimed {len(events)} events")
+
+        return events
+
+    async def release(self, event_ids: list[int]) -> None:
+        logger.debug(
+            f"SQLAlchemy Outbox repo: Releasing {len(event_ids)} events"
+        )
+        await self.db.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_(event_ids))
+            .values(claimed_until=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_by_ids(self, event_ids: list[int]) -> None:
+        logger.debug(
+            f"SQLAlchemy Outbox repo: Deleting {len(event_ids)} relayed events"
+        )
+        await self.db.execute(
+            delete(OutboxEventModel).where(OutboxEventModel.id.in_(event_ids))
+        )
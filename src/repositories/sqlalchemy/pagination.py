@@ -0,0 +1,64 @@
+from typing import Any
+
+from sqlalchemy import Select, Result, Table, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+
+def paginate_by_id(
+    stmt: Select,
+    entity: type[Any],
+    limit: int,
+    offset: int,
+    after_id: int | None = None,
+    before_id: int | None = None,
+    with_total: bool = False
+) -> Select:
+    if with_total:
+        # Counted before the cursor filter and limit are applied, so every
+        # row carries the size of the whole filtered set
+        counted = stmt.add_columns(
+            func.count().over().label("total")
+        ).subquery()
+        entity = aliased(entity, counted)
+        stmt = select(entity, counted.c.total)
+
+    id_column = entity.id
+
+    if after_id is not None:
+        stmt = stmt.where(id_column > after_id).order_by(id_column)
+    elif before_id is not None:
+        # Walk backwards from the cursor, the caller restores ascending order
+        stmt = stmt.where(id_column < before_id).order_by(id_column.desc())
+    else:
+        stmt = stmt.order_by(id_column).offset(offset)
+
+    return stmt.limit(limit)
+
+
+def unpack_page(
+    result: Result, with_total: bool
+) -> tuple[list[Any], int | None]:
+    if not with_total:
+        return list(result.scalars().all()), None
+
+    rows = result.all()
+    # An empty page carries no count, the caller has to fall back to COUNT
+    total = rows[0].total if rows else None
+
+    return [row[0] for row in rows], total
+
+
+async def estimate_row_count(db: AsyncSession, table: Table) -> int | None:
+    reltuples = await db.scalar(
+        text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = to_regclass(:table_name)"
+        ),
+        {"table_name": table.fullname}
+    )
+
+    # -1 means the table has never been vacuumed or analyzed
+    if reltuples is None or reltuples < 0:
+        return None
+    return reltuples
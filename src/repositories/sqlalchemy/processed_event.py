@@ -0,0 +1,52 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import logger
+from src.models.processed_event import ProcessedEventModel
+
+
+class SQLAlchemyProcessedEventRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add_new(
+        self, consumer: str, event_ids: list[UUID]
+    ) -> set[UUID]:
+        """Record the events as processed by ``consumer``, return the IDs
+        that were not recorded before."""
+        if not event_ids:
+            return set()
+
+        logger.debug(
+            f"SQLAlchemy Processed Event repo: Recording {len(event_ids)} "
+            f"events of {consumer}"
+        )
+        # A concurrent transaction recording the same ID makes this one wait
+        # for it to end, so an event is applied by one of them only
+        result = await self.db.scalars(
+            insert(ProcessedEventModel)
+            .values([
+                {"consumer": consumer, "event_id": event_id}
+                for event_id in event_ids
+            ])
+            .on_conflict_do_nothing()
+            .returning(ProcessedEventModel.event_id)
+        )
+
+        return set(result.all())
+
+    async def delete_processed_before(self, cutoff: datetime) -> int:
+        result = await self.db.execute(
+            delete(ProcessedEventModel)
+            .where(ProcessedEventModel.processed_at < cutoff)
+        )
+        logger.debug(
+            f"SQLAlchemy Processed Event repo: Deleted {result.rowcount} "
+            f"events processed before {cutoff}"
+        )
+
+        return result.rowcount
@@ -0,0 +1,86 @@
+import inspect
+from types import TracebackType
+from typing import Any, Callable, Self
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.invalidation import invalidation_bus
+from src.core.logging import logger
+from src.core.utils.background import run_in_background
+
+
+class SQLAlchemyUnitOfWork:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._depth = 0
+        self._after_commit_hooks: list[Callable[[], Any]] = []
+
+    async def __aenter__(self) -> Self:
+        self._depth += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None
+    ) -> None:
+        self._depth -= 1
+
+        # Nested service calls share the outermost transaction
+        if self._depth > 0:
+            return
+
+        if exc_type is not None:
+            logger.warning(
+                f"SQLAlchemy UoW: Rolling back transaction due to "
+                f"{exc_type.__name__}"
+            )
+            await self.rollback()
+            return
+
+        try:
+            await self.commit()
+        except Exception:
+            await self.rollback()
+            raise
+
+        await self._run_after_commit_hooks()
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._depth > 0
+
+    async def notify_invalidation(self, entity: str, *entity_ids: int) -> None:
+        # Sent with the transaction, other workers hear of committed changes
+        await invalidation_bus.notify(self.db, entity, *entity_ids)
+
+    def add_after_commit_hook(self, hook: Callable[[], Any]) -> None:
+        # Outside of a transaction there is nothing to wait for
+        if self._depth == 0:
+            result = hook()
+            if inspect.isawaitable(result):
+                run_in_background(result, "SQLAlchemy UoW: After-commit hook")
+            return
+        self._after_commit_hooks.append(hook)
+
+    async def _run_after_commit_hooks(self) -> None:
+        hooks, self._after_commit_hooks = self._after_commit_hooks, []
+
+        # Coroutine hooks are awaited, so caches are settled on return
+        for hook in hooks:
+            try:
+                result = hook()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"SQLAlchemy UoW: After-commit hook failed: {e}")
+
+    async def commit(self) -> None:
+        await self.db.commit()
+        logger.debug("SQLAlchemy UoW: Transaction was committed")
+
+    async def rollback(self) -> None:
+        self._after_commit_hooks.clear()
+        await self.db.rollback()
+        logger.debug("SQLAlchemy UoW: Transaction was rolled back")
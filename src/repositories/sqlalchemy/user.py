@@ -1,9 +1,13 @@
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, insert, update, delete, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logging import logger
+from src.core.utils.count_cache import count_cache
 from src.models.user import UserModel
+from src.repositories.sqlalchemy.pagination import (
+    paginate_by_id, unpack_page, estimate_row_count
+)
 
 
 class SQLAlchemyUserRepository:
@@ -15,16 +19,17 @@ class SQLAlchemyUserRepository:
             f"SQLAlchemy User repo: Creating user "
             f"{user_data.get('name')} {user_data.get('surname')}"
         )
-        user = UserModel(
-            name=user_data["name"],
-            surname=user_data["surname"],
-            phone_number=user_data["phone_number"]
-        )
-        self.db.add(user)
-
         try:
-            await self.db.commit()
-            await self.db.refresh(user)
+            user = await self.db.scalar(
+                insert(UserModel)
+                .values(
+                    name=user_data["name"],
+                    surname=user_data["surname"],
+                    phone_number=user_data["phone_number"]
+                )
+                .returning(UserModel)
+            )
+            count_cache.invalidate("users")
             logger.debug(
                 f"SQLAlchemy User repo: New user created with ID: {user.id}"
             )
@@ -34,21 +39,32 @@ class SQLAlchemyUserRepository:
             logger.error(
                 f"SQLAlchemy User repo: DB integrity error creating user: {e}"
             )
-            await self.db.rollback()
             raise
 
-    async def get_all(self, limit: int, offset: int) -> list[UserModel]:
+    async def get_all(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_total: bool = False
+    ) -> tuple[list[UserModel], int | None]:
         logger.debug(
             f"SQLAlchemy User repo: Getting users, limit: {limit}, "
-            f"offset: {offset}"
-        )
-        result = await self.db.execute(
-            select(UserModel).limit(limit).offset(offset)
+            f"offset: {offset}, after: {after_id}, before: {before_id}"
         )
-        users = result.scalars().all()
+        result = await self.db.execute(paginate_by_id(
+            select(UserModel), UserModel,
+            limit, offset, after_id, before_id, with_total
+        ))
+        users, total = unpack_page(result, with_total)
+
+        if with_total and total is None:
+            total = await self.get_total_count()
+
         logger.debug(f"SQLAlchemy User repo: Retrieved {len(users)} users")
 
-        return users
+        return users, total
 
     async def get_by_id(self, user_id: int) -> UserModel | None:
         logger.debug(f"SQLAlchemy User repo: Getting user by ID: {user_id}")
@@ -96,21 +112,33 @@ class SQLAlchemyUserRepository:
 
         return count
 
+    async def get_estimated_count(self) -> int:
+        count = count_cache.get("users")
+
+        if count is None:
+            count = await estimate_row_count(self.db, UserModel.__table__)
+            if count is None:
+                count = await self.get_total_count()
+            count_cache.set("users", count)
+
+        logger.debug(f"SQLAlchemy User repo: Estimated users: {count}")
+
+        return count
+
     async def update(
         self, user_id: int, user_data: dict[str, str]
     ) -> UserModel:
         logger.debug(
             f"SQLAlchemy User repo: Updating user {user_id}, data: {user_data}"
         )
-        await self.db.execute(
-            update(UserModel)
-            .where(UserModel.id == user_id)
-            .values(**user_data)
-        )
-
         try:
-            await self.db.commit()
-            updated_user = await self.get_by_id(user_id)
+            updated_user = await self.db.scalar(
+                update(UserModel)
+                .where(UserModel.id == user_id)
+                .values(**user_data)
+                .returning(UserModel)
+                .execution_options(populate_existing=True)
+            )
             logger.info(f"SQLAlchemy User repo: User {user_id} was updated")
 
             return updated_user
@@ -119,11 +147,10 @@ class SQLAlchemyUserRepository:
                 f"SQLAlchemy User repo: Failed to update user {user_id} "
                 f"due to integrity error: {e}"
             )
-            await self.db.rollback()
             raise
 
     async def delete(self, user_id: int) -> None:
         logger.debug(f"SQLAlchemy User repo: Deleting user {user_id}")
         await self.db.execute(delete(UserModel).where(UserModel.id == user_id))
-        await self.db.commit()
+        count_cache.invalidate("users")
         logger.info(f"SQLAlchemy User repo: User {user_id} was deleted")
@@ -2,7 +2,7 @@ from sqlalchemy.exc import IntegrityError
 
 from src.core.logging import logger
 from src.models.user import UserIdentityModel
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -17,17 +17,17 @@ class SQLAlchemyUserIdentityRepository:
             f"SQLAlchemy User Identity repo: Creating identity for user "
             f"{user_id} with provider {identity_data['provider']}"
         )
-        identity = UserIdentityModel(
-            user_id=user_id,
-            provider=identity_data["provider"],
-            provider_id=identity_data["provider_id"],
-            username=identity_data["username"]
-        )
-        self.db.add(identity)
-
         try:
-            await self.db.commit()
-            await self.db.refresh(identity)
+            identity = await self.db.scalar(
+                insert(UserIdentityModel)
+                .values(
+                    user_id=user_id,
+                    provider=identity_data["provider"],
+                    provider_id=identity_data["provider_id"],
+                    username=identity_data["username"]
+                )
+                .returning(UserIdentityModel)
+            )
             logger.info(
                 f"SQLAlchemy User Identity repo: Identity created  for "
                 f"user {user_id} with ID {identity.id}"
@@ -39,7 +39,6 @@ class SQLAlchemyUserIdentityRepository:
                 f"SQLAlchemy User Identity repo: Failed to create identity "
                 f"for user {user_id} due to integrity error: {e}"
             )
-            await self.db.rollback()
             raise
 
     async def get_by_provider(
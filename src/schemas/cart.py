@@ -23,5 +23,6 @@ class CartPatchUpdate(BaseModel):
 class CartRead(CartBase):
     id: int
     total_price: Decimal | None
+    version: int = 0
     created_at: datetime
     model_config = {"from_attributes": True}
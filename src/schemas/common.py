@@ -1,14 +1,81 @@
+from enum import Enum
+
 from pydantic import BaseModel, Field
 
 
+class TotalKind(str, Enum):
+    exact = "exact"
+    estimated = "estimated"
+    none = "none"
+
+
 class PaginationParams(BaseModel):
     page: int = Field(1, ge=1, description="Page number (starts from 1)")
     per_page: int = Field(
         10, ge=1, le=50, description="Number of items per page"
     )
+    after: str | None = Field(
+        None,
+        description=(
+            "Cursor from `next_cursor`, returns the items after it. "
+            "Takes precedence over `page`"
+        )
+    )
+    before: str | None = Field(
+        None,
+        description=(
+            "Cursor from `prev_cursor`, returns the items before it. "
+            "Takes precedence over `page`"
+        )
+    )
+
+    include_total: bool | None = Field(
+        None,
+        description=(
+            "Whether to count the total number of items, by default only "
+            "when paginating by page number"
+        )
+    )
+    estimate_total: bool = Field(
+        False,
+        description=(
+            "Return a cheaper cached or estimated total instead of "
+            "an exact count"
+        )
+    )
+
+    @property
+    def total_kind(self) -> TotalKind:
+        include_total = self.include_total
+        if include_total is None:
+            # A cursor walks past the rows a count would have to scan
+            include_total = not self.is_cursor_mode
+
+        if not include_total:
+            return TotalKind.none
+        if self.estimate_total:
+            return TotalKind.estimated
+        return TotalKind.exact
+
+    @property
+    def is_cursor_mode(self) -> bool:
+        return self.after is not None or self.before is not None
 
 
 class PaginatedBaseResponse(BaseModel):
-    total: int
-    page: int
-    total_pages: int
+    total: int | None = Field(
+        None, description="Total number of items, null when not counted"
+    )
+    total_kind: TotalKind = Field(
+        TotalKind.exact, description="How `total` was obtained"
+    )
+    page: int | None = Field(
+        None, description="Page number, null when paginating by cursor"
+    )
+    total_pages: int | None = None
+    next_cursor: str | None = Field(
+        None, description="Pass as `after` to get the next page"
+    )
+    prev_cursor: str | None = Field(
+        None, description="Pass as `before` to get the previous page"
+    )
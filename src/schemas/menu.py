@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+from src.schemas.meal import MealRead
+from src.schemas.meal_category import MealCategoryRead
+
+
+class MenuCategoryRead(MealCategoryRead):
+    meals: list[MealRead]
+
+
+class MenuRead(BaseModel):
+    categories: list[MenuCategoryRead]
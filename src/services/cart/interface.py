@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Protocol
 
 from src.schemas.cart import CartRead, CartPatchUpdate
@@ -9,7 +10,16 @@ class ICartService(Protocol):
     async def get_cart_by_user_id(self, user_id: int) -> CartRead: ...
 
     async def update_cart(
-        self, user_id: int, cart_data: CartPatchUpdate
+        self,
+        user_id: int,
+        cart_data: CartPatchUpdate,
+        version: int | None = None
     ) -> CartRead: ...
 
+    async def add_to_total(self, user_id: int, delta: Decimal) -> CartRead: ...
+
+    async def add_to_totals(
+        self, deltas: dict[int, list[Decimal]]
+    ) -> list[CartRead]: ...
+
     async def delete_cart_by_user_id(self, user_id: int) -> None: ...
@@ -1,29 +1,52 @@
+from decimal import Decimal
+from functools import partial
+
+from src.cache.decorators import evict, read_through, write_through
+from src.cache.interface import ICache
+from src.core.config import get_settings
 from src.core.logging import logger
-from src.exceptions.cart import CartAlreadyExistsError, CartNotFoundError
+from src.exceptions.cart import (
+    CartAlreadyExistsError, CartNotFoundError, CartVersionConflictError
+)
 from src.repositories.interfaces.cart import ICartRepository
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
 from src.schemas.cart import CartRead, CartPatchUpdate
 
+settings = get_settings()
+
+CART_CACHE_KEY = "cart:{user_id}"
+
 
 class CartService:
-    def __init__(self, repository: ICartRepository) -> None:
+    def __init__(
+        self, repository: ICartRepository, uow: IUnitOfWork, cache: ICache
+    ) -> None:
         self.repository = repository
+        self.uow = uow
+        self.cache = cache
 
+    # Every write refreshes the cached cart once its unit of work commits,
+    # so cart item and order operations rarely read the cart row
+    @write_through(CART_CACHE_KEY, ttl=settings.cart_cache_ttl_seconds)
     async def create_cart(self, user_id: int) -> CartRead:
-        logger.info(f"Cart service: Creating cart for user {user_id}")
-
-        if await self.repository.get_by_user_id(user_id):
-            logger.warning(
-                f"Cart service: Cart already exists for user {user_id}"
+        async with self.uow:
+            logger.info(f"Cart service: Creating cart for user {user_id}")
+
+            if await self.repository.get_by_user_id(user_id):
+                logger.warning(
+                    f"Cart service: Cart already exists for user {user_id}"
+                )
+                raise CartAlreadyExistsError(user_id)
+
+            cart = await self.repository.create(user_id)
+            await self.uow.notify_invalidation("cart", user_id)
+            logger.info(
+                f"Cart service: Cart was created for user {user_id} with ID: {cart.id}"
             )
-            raise CartAlreadyExistsError(user_id)
 
-        cart = await self.repository.create(user_id)
-        logger.info(
-            f"Cart service: Cart was created for user {user_id} with ID: {cart.id}"
-        )
-
-        return CartRead.model_validate(cart)
+            return CartRead.model_validate(cart)
 
+    @read_through(CART_CACHE_KEY, ttl=settings.cart_cache_ttl_seconds)
     async def get_cart_by_user_id(self, user_id: int) -> CartRead:
         logger.debug(f"Cart service: Getting cart for user {user_id}")
         cart = await self.repository.get_by_user_id(user_id)
@@ -37,37 +60,112 @@ class CartService:
         logger.debug(f"Cart service: Found cart {cart.id} for user {user_id}")
         return CartRead.model_validate(cart)
 
+    @write_through(CART_CACHE_KEY, ttl=settings.cart_cache_ttl_seconds)
     async def update_cart(
-        self, user_id: int, cart_data: CartPatchUpdate
+        self,
+        user_id: int,
+        cart_data: CartPatchUpdate,
+        version: int | None = None
     ) -> CartRead:
-        logger.debug(f"Cart service: Updating cart for user {user_id}")
-        cart = await self.repository.get_by_user_id(user_id)
+        async with self.uow:
+            logger.debug(f"Cart service: Updating cart for user {user_id}")
+            upd_cart = await self.repository.update(
+                user_id, cart_data.model_dump(exclude_unset=True), version
+            )
 
-        if not cart:
-            logger.warning(
-                f"Cart service: Cart not found for user {user_id} during update"
+            if not upd_cart:
+                if (
+                    version is not None
+                    and await self.repository.get_by_user_id(user_id)
+                ):
+                    logger.warning(
+                        f"Cart service: Cart of user {user_id} has changed "
+                        f"since version {version}, update was dropped"
+                    )
+                    raise CartVersionConflictError(user_id, version)
+
+                logger.warning(
+                    f"Cart service: Cart not found for user {user_id} during update"
+                )
+                raise CartNotFoundError(user_id)
+
+            await self.uow.notify_invalidation("cart", user_id)
+            logger.info(
+                f"Cart service: Cart was updated successfully for user {user_id}"
             )
-            raise CartNotFoundError(user_id)
 
-        upd_cart = await self.repository.update(
-            user_id, cart_data.model_dump(exclude_unset=True)
-        )
-        logger.info(
-            f"Cart service: Cart was updated successfully for user {user_id}"
-        )
+            return CartRead.model_validate(upd_cart)
 
-        return CartRead.model_validate(upd_cart)
+    @write_through(CART_CACHE_KEY, ttl=settings.cart_cache_ttl_seconds)
+    async def add_to_total(self, user_id: int, delta: Decimal) -> CartRead:
+        async with self.uow:
+            logger.debug(
+                f"Cart service: Adding {delta} to cart total of user {user_id}"
+            )
+            upd_cart = await self.repository.add_to_total(user_id, delta)
+
+            if not upd_cart:
+                logger.warning(
+                    f"Cart service: Cart not found for user {user_id} during update"
+                )
+                raise CartNotFoundError(user_id)
+
+            await self.uow.notify_invalidation("cart", user_id)
+            logger.info(
+                f"Cart service: Cart total was changed by {delta} "
+                f"for user {user_id}"
+            )
 
-    async def delete_cart_by_user_id(self, user_id: int) -> None:
-        logger.debug(f"Cart service: Deleting cart for user {user_id}")
-        cart = await self.repository.get_by_user_id(user_id)
+            return CartRead.model_validate(upd_cart)
 
-        if not cart:
-            logger.warning(
-                f"Cart service: Cart was not found for "
-                f"user {user_id} during deletion"
+    async def add_to_totals(
+        self, deltas: dict[int, list[Decimal]]
+    ) -> list[CartRead]:
+        """Apply the total changes of many carts, keyed by user ID, in one
+        statement. Carts that don't exist are skipped."""
+        async with self.uow:
+            logger.debug(
+                f"Cart service: Changing cart totals of {len(deltas)} users"
+            )
+            carts = await self.repository.add_to_totals({
+                user_id: (sum(user_deltas, Decimal("0.00")), len(user_deltas))
+                for user_id, user_deltas in deltas.items()
+            })
+            user_ids = [cart.user_id for cart in carts]
+
+            if missing := deltas.keys() - set(user_ids):
+                logger.warning(
+                    f"Cart service: Carts were not found for users "
+                    f"{sorted(missing)}, their changes were dropped"
+                )
+
+            if user_ids:
+                await self.uow.notify_invalidation("cart", *user_ids)
+                # Evicted, not rewritten, so one call drops them all
+                self.uow.add_after_commit_hook(partial(
+                    self.cache.delete,
+                    *[CART_CACHE_KEY.format(user_id=uid) for uid in user_ids]
+                ))
+            logger.info(
+                f"Cart service: Cart totals were changed for "
+                f"{len(carts)} users"
             )
-            raise CartNotFoundError(user_id)
 
-        await self.repository.delete(user_id)
-        logger.info(f"Cart service: Cart deleted successfully for user {user_id}")
+            return [CartRead.model_validate(cart) for cart in carts]
+
+    @evict(CART_CACHE_KEY)
+    async def delete_cart_by_user_id(self, user_id: int) -> None:
+        async with self.uow:
+            logger.debug(f"Cart service: Deleting cart for user {user_id}")
+            cart = await self.repository.get_by_user_id(user_id)
+
+            if not cart:
+                logger.warning(
+                    f"Cart service: Cart was not found for "
+                    f"user {user_id} during deletion"
+                )
+                raise CartNotFoundError(user_id)
+
+            await self.repository.delete(user_id)
+            await self.uow.notify_invalidation("cart", user_id)
+            logger.info(f"Cart service: Cart deleted successfully for user {user_id}")
@@ -1,3 +1,4 @@
+from src.core.utils.conditional_get import CacheValidators
 from src.schemas.common import PaginationParams
 from src.schemas.meal import (
     MealCreate, MealPatchUpdate, MealPutUpdate, MealRead, PaginatedMealResponse
@@ -20,6 +21,16 @@ class IMealService:
     ) -> MealRead:
         ...
 
+    async def get_meal_validators(
+        self, meal_id: int, category_id: int
+    ) -> CacheValidators | None:
+        ...
+
+    async def get_meals_validators(
+        self, category_id: int, pagination_params: PaginationParams
+    ) -> CacheValidators:
+        ...
+
     async def update_meal(
         self,
         category_id: int,
@@ -1,68 +1,108 @@
+from functools import partial
+
 from sqlalchemy.exc import IntegrityError
 
+from src.cache.negative import NegativeCache
+from src.cache.response import ResponseCache
 from src.core.logging import logger
+from src.core.utils.conditional_get import CacheValidators, build_validators
+from src.core.utils.singleflight import SingleFlight
+from src.core.utils.pagination import (
+    decode_pagination_cursors, split_keyset_page, count_total_pages
+)
 from src.core.utils.type_converters import url_to_str
 from src.exceptions.meal import (
     MealNotFoundError, MealAlreadyExistsError, NoMealUpdateDataError
 )
 from src.exceptions.meal_category import MealCategoryNotFoundError
 from src.repositories.interfaces.meal import IMealRepository
-from src.schemas.common import PaginationParams
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
+from src.schemas.common import PaginationParams, TotalKind
 from src.schemas.meal import (
     MealCreate, MealPatchUpdate, MealPutUpdate, MealRead, PaginatedMealResponse
 )
 from src.services.meal_category.interface import IMealCategoryService
+from src.services.menu.snapshot import MenuSnapshotStore
+
+# Response cache tags of a category's meal list and of a single meal
+MEALS_TAG = "meals:{category_id}"
+MEAL_TAG = "meal:{meal_id}"
 
 
 class MealService:
     def __init__(
         self,
         repository: IMealRepository,
-        category_service: IMealCategoryService
+        category_service: IMealCategoryService,
+        uow: IUnitOfWork,
+        menu_snapshot_store: MenuSnapshotStore,
+        singleflight: SingleFlight,
+        negative_cache: NegativeCache,
+        response_cache: ResponseCache
     ) -> None:
         self.repository = repository
         self.category_service = category_service
+        self.uow = uow
+        self.menu_snapshot_store = menu_snapshot_store
+        self.singleflight = singleflight
+        self.negative_cache = negative_cache
+        self.response_cache = response_cache
 
     async def create_meal(
         self, category_id: int, meal_data: MealCreate
     ) -> MealRead:
-        logger.info(
-            f"Meal service: Creating meal '{meal_data.name}' "
-            f"in category {category_id}"
-        )
-
-        if not await self.category_service.get_category(category_id):
-            logger.warning(
-                f"Meal service: Category {category_id} was not "
-                f"found for meal creation"
+        async with self.uow:
+            logger.info(
+                f"Meal service: Creating meal '{meal_data.name}' "
+                f"in category {category_id}"
             )
-            raise MealCategoryNotFoundError(category_id)
 
-        if await self.repository.get_by_name(meal_data.name):
-            logger.warning(
-                f"Meal service: Meal '{meal_data.name}' already exists"
-            )
-            raise MealAlreadyExistsError(meal_data.name)
+            if not await self.category_service.get_category(category_id):
+                logger.warning(
+                    f"Meal service: Category {category_id} was not "
+                    f"found for meal creation"
+                )
+                raise MealCategoryNotFoundError(category_id)
+
+            if await self.repository.get_by_name(meal_data.name):
+                logger.warning(
+                    f"Meal service: Meal '{meal_data.name}' already exists"
+                )
+                raise MealAlreadyExistsError(meal_data.name)
 
-        if meal_data.image_url:
-            meal_data.image_url = url_to_str(meal_data.image_url)
+            if meal_data.image_url:
+                meal_data.image_url = url_to_str(meal_data.image_url)
 
-        meal_dict = meal_data.model_dump()
-        meal_dict["category_id"] = category_id
+            meal_dict = meal_data.model_dump()
+            meal_dict["category_id"] = category_id
 
-        try:
-            meal = await self.repository.create(meal_dict)
-            logger.info(
-                f"Meal service: Meal '{meal_data.name}' was created "
-                f"with ID: {meal.id}"
-            )
-            return MealRead.model_validate(meal)
-        except IntegrityError as e:
-            logger.error(
-                f"Meal service: Failed to create meal '{meal_dict['name']}' "
-                f"due to integrity error: {e}"
-            )
-            raise MealAlreadyExistsError(meal_dict["name"])
+            try:
+                meal = await self.repository.create(meal_dict)
+                await self.uow.notify_invalidation("meal", meal.id)
+                await self.uow.notify_invalidation("category_meals", category_id)
+                self.uow.add_after_commit_hook(
+                    partial(self.negative_cache.forget, "meal", meal.id)
+                )
+                self.uow.add_after_commit_hook(
+                    partial(
+                        self.response_cache.purge,
+                        MEALS_TAG.format(category_id=category_id)
+                    )
+                )
+                self.uow.add_after_commit_hook(
+                    self.menu_snapshot_store.invalidate
+                )
+                logger.info(
+                    f"Meal service: Meal '{meal_data.name}' was created "
+                    f"with ID: {meal.id}"
+                )
+                return MealRead.model_validate(meal)
+            except IntegrityError as e:
+                logger.error(
+                    f"Meal service: Failed to create meal '{meal_dict['name']}' "
+                    f"due to integrity error: {e}"
+                )
+                raise MealAlreadyExistsError(meal_dict["name"])
 
     async def get_meals_by_category_id(
         self, category_id: int, pagination_params: PaginationParams
@@ -71,7 +111,17 @@ class MealService:
             f"Meal service:: Getting meals for category {category_id}, page: "
             f"{pagination_params.page}, per_page: {pagination_params.per_page}"
         )
+        return await self.singleflight.do(
+            f"meals:{category_id}:{pagination_params.model_dump_json()}",
+            partial(
+                self._load_meals_by_category_id, category_id, pagination_params
+            ),
+            operation="get_meals_by_category_id"
+        )
 
+    async def _load_meals_by_category_id(
+        self, category_id: int, pagination_params: PaginationParams
+    ) -> PaginatedMealResponse:
         if not await self.category_service.get_category(category_id):
             logger.warning(
                 f"Meal service: Category {category_id} was not "
@@ -79,23 +129,36 @@ class MealService:
             )
             raise MealCategoryNotFoundError(category_id)
 
+        after_id, before_id = decode_pagination_cursors(pagination_params)
         offset = (pagination_params.page - 1) * pagination_params.per_page
-        meals = await self.repository.get_all_by_category_id(
-            category_id, pagination_params.per_page, offset
+        total_kind = pagination_params.total_kind
+        rows, total = await self.repository.get_all_by_category_id(
+            category_id, pagination_params.per_page + 1, offset,
+            after_id, before_id, with_total=total_kind == TotalKind.exact
         )
-        total = await self.repository.get_total_count(category_id)
-        total_pages = (
-            (total + pagination_params.per_page - 1) // pagination_params.per_page
+        meals, next_cursor, prev_cursor = split_keyset_page(
+            rows, pagination_params
         )
 
+        if total_kind == TotalKind.estimated:
+            total = await self.repository.get_estimated_count(category_id)
+
+        total_pages = count_total_pages(total, pagination_params.per_page)
+
         logger.info(
             f"Meal service:: Retrieved {len(meals)} meals from category "
             f"{category_id} (page {pagination_params.page}/{total_pages})"
         )
         return PaginatedMealResponse(
             total=total,
-            page=pagination_params.page,
+            total_kind=total_kind,
+            page=(
+                None if pagination_params.is_cursor_mode
+                else pagination_params.page
+            ),
             total_pages=total_pages,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
             items=[MealRead.model_validate(meal) for meal in meals]
         )
 
@@ -106,10 +169,30 @@ class MealService:
             f"Meal service:: Getting meal {meal_id}" +
             (f" from category {category_id}" if category_id else "")
         )
+
+        # Read by a write in its own transaction, e.g. for the unit price of
+        # a new cart item, not by another request's read
+        if self.uow.in_transaction:
+            return await self._load_meal(meal_id, category_id)
+
+        if await self.negative_cache.is_missing("meal", meal_id):
+            logger.debug(f"Meal service: Meal {meal_id} is known to be missing")
+            raise MealNotFoundError(meal_id)
+
+        return await self.singleflight.do(
+            f"meal:{meal_id}:{category_id}",
+            partial(self._load_meal, meal_id, category_id),
+            operation="get_meal"
+        )
+
+    async def _load_meal(
+        self, meal_id: int, category_id: int | None
+    ) -> MealRead:
         meal = await self.repository.get_by_id(meal_id)
 
         if not meal:
             logger.warning(f"Meal service: Meal {meal_id} was not found")
+            await self.negative_cache.remember("meal", meal_id)
             raise MealNotFoundError(meal_id)
 
         if category_id is not None and meal.category_id != category_id:
@@ -127,6 +210,34 @@ class MealService:
         )
         return MealRead.model_validate(meal)
 
+    async def get_meal_validators(
+        self, meal_id: int, category_id: int
+    ) -> CacheValidators | None:
+        if await self.negative_cache.is_missing(
+            "meal", meal_id, record_hit=False
+        ):
+            return None
+
+        updated_at = await self.repository.get_updated_at(meal_id, category_id)
+
+        if updated_at is None:
+            return None
+        return build_validators(updated_at, "meal", meal_id, category_id)
+
+    async def get_meals_validators(
+        self, category_id: int, pagination_params: PaginationParams
+    ) -> CacheValidators:
+        if not await self.category_service.get_category(category_id):
+            raise MealCategoryNotFoundError(category_id)
+
+        last_modified, count = await self.repository.get_list_version(
+            category_id
+        )
+        return build_validators(
+            last_modified, "meals", category_id, count,
+            pagination_params.model_dump()
+        )
+
     async def update_meal(
         self,
         category_id: int,
@@ -134,82 +245,104 @@ class MealService:
         meal_data: MealPutUpdate | MealPatchUpdate,
         is_partial: bool = False
     ) -> MealRead:
-        update_type = "partial" if is_partial else "full"
-        logger.debug(
-            f"Meal service: {update_type} update for meal "
-            f"{meal_id} in category {category_id}"
-        )
-        new_data = (
-            meal_data.model_dump(exclude_unset=True) if is_partial
-            else meal_data.model_dump()
-        )
-
-        if not new_data:
-            logger.warning(
-                f"Meal service: No update data provided for meal {meal_id}"
+        async with self.uow:
+            update_type = "partial" if is_partial else "full"
+            logger.debug(
+                f"Meal service: {update_type} update for meal "
+                f"{meal_id} in category {category_id}"
             )
-            raise NoMealUpdateDataError()
-
-        if not await self.category_service.get_category(category_id):
-            logger.warning(
-                f"Meal service: Category {category_id} was not found "
-                f"for meal update"
+            new_data = (
+                meal_data.model_dump(exclude_unset=True) if is_partial
+                else meal_data.model_dump()
             )
-            raise MealCategoryNotFoundError(category_id)
 
-        meal = await self.repository.get_by_id(meal_id)
-        if not meal or meal.category_id != category_id:
-            logger.warning(
-                f"Meal service: Meal {meal_id} was not found in "
-                f"category {category_id}"
-            )
-            raise MealNotFoundError(meal_id)
-
-        if "image_url" in new_data and new_data["image_url"] is not None:
-            new_data["image_url"] = url_to_str(new_data["image_url"])
+            if not new_data:
+                logger.warning(
+                    f"Meal service: No update data provided for meal {meal_id}"
+                )
+                raise NoMealUpdateDataError()
 
-        if "name" in new_data:
-            existing = await self.repository.get_by_name(new_data["name"])
+            if not await self.category_service.get_category(category_id):
+                logger.warning(
+                    f"Meal service: Category {category_id} was not found "
+                    f"for meal update"
+                )
+                raise MealCategoryNotFoundError(category_id)
 
-            if existing and existing.id != meal_id:
+            meal = await self.repository.get_by_id(meal_id)
+            if not meal or meal.category_id != category_id:
                 logger.warning(
-                    f"Meal service: Meal name '{new_data['name']}'"
-                    f" already exists (ID: {existing.id})"
+                    f"Meal service: Meal {meal_id} was not found in "
+                    f"category {category_id}"
                 )
-                raise MealAlreadyExistsError(new_data["name"])
-
-        try:
-            upd_meal = await self.repository.update(meal_id, new_data)
-            logger.info(f"Meal service: Meal {meal_id} was updated")
-            return MealRead.model_validate(upd_meal)
-        except IntegrityError as e:
-            logger.error(
-                f"Meal service: Failed to update meal {meal_id} "
-                f"due to integrity error: {e}"
-            )
-            raise MealAlreadyExistsError(new_data.get("name", "unknown"))
+                raise MealNotFoundError(meal_id)
 
-    async def delete_meal(self, category_id: int, meal_id: int) -> None:
-        logger.debug(
-            f"Meal service: Deleting meal {meal_id} from category {category_id}"
-        )
+            if "image_url" in new_data and new_data["image_url"] is not None:
+                new_data["image_url"] = url_to_str(new_data["image_url"])
 
-        if not await self.category_service.get_category(category_id):
-            logger.warning(
-                f"Meal service: Category {category_id} was not found"
+            if "name" in new_data:
+                existing = await self.repository.get_by_name(new_data["name"])
+
+                if existing and existing.id != meal_id:
+                    logger.warning(
+                        f"Meal service: Meal name '{new_data['name']}'"
+                        f" already exists (ID: {existing.id})"
+                    )
+                    raise MealAlreadyExistsError(new_data["name"])
+
+            try:
+                upd_meal = await self.repository.update(meal_id, new_data)
+                await self.uow.notify_invalidation("meal", meal_id)
+                await self.uow.notify_invalidation("category_meals", category_id)
+                self.uow.add_after_commit_hook(
+                    self.menu_snapshot_store.invalidate
+                )
+                self.uow.add_after_commit_hook(
+                    partial(self._purge_responses, category_id, meal_id)
+                )
+                logger.info(f"Meal service: Meal {meal_id} was updated")
+                return MealRead.model_validate(upd_meal)
+            except IntegrityError as e:
+                logger.error(
+                    f"Meal service: Failed to update meal {meal_id} "
+                    f"due to integrity error: {e}"
+                )
+                raise MealAlreadyExistsError(new_data.get("name", "unknown"))
+
+    async def delete_meal(self, category_id: int, meal_id: int) -> None:
+        async with self.uow:
+            logger.debug(
+                f"Meal service: Deleting meal {meal_id} from category {category_id}"
             )
-            raise MealCategoryNotFoundError(category_id)
 
-        meal = await self.repository.get_by_id(meal_id)
-        if not meal or meal.category_id != category_id:
-            logger.warning(
-                f"Meal service: Meal {meal_id} was not found in "
+            if not await self.category_service.get_category(category_id):
+                logger.warning(
+                    f"Meal service: Category {category_id} was not found"
+                )
+                raise MealCategoryNotFoundError(category_id)
+
+            meal = await self.repository.get_by_id(meal_id)
+            if not meal or meal.category_id != category_id:
+                logger.warning(
+                    f"Meal service: Meal {meal_id} was not found in "
+                    f"category {category_id}"
+                )
+                raise MealNotFoundError(meal_id)
+
+            await self.repository.delete(meal_id)
+            await self.uow.notify_invalidation("meal", meal_id)
+            await self.uow.notify_invalidation("category_meals", category_id)
+            self.uow.add_after_commit_hook(self.menu_snapshot_store.invalidate)
+            self.uow.add_after_commit_hook(
+                partial(self._purge_responses, category_id, meal_id)
+            )
+            logger.info(
+                f"Meal service: Meal {meal_id} was deleted from "
                 f"category {category_id}"
             )
-            raise MealNotFoundError(meal_id)
 
-        await self.repository.delete(meal_id)
-        logger.info(
-            f"Meal service: Meal {meal_id} was deleted from "
-            f"category {category_id}"
+    async def _purge_responses(self, category_id: int, meal_id: int) -> None:
+        await self.response_cache.purge(
+            MEALS_TAG.format(category_id=category_id),
+            MEAL_TAG.format(meal_id=meal_id)
         )
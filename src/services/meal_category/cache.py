@@ -0,0 +1,13 @@
+from src.cache.lru import TTLLRUCache
+from src.core.config import get_settings
+from src.schemas.meal_category import MealCategoryRead
+
+settings = get_settings()
+
+# Shared by every request of the worker, categories are few and read by
+# almost every meal endpoint
+meal_category_cache: TTLLRUCache[int, MealCategoryRead] = TTLLRUCache(
+    "meal_category",
+    maxsize=settings.meal_category_cache_maxsize,
+    ttl_seconds=settings.meal_category_cache_ttl_seconds
+)
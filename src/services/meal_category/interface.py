@@ -1,5 +1,6 @@
 from typing import Protocol
 
+from src.core.utils.conditional_get import CacheValidators
 from src.schemas.common import PaginationParams
 from src.schemas.meal_category import (
     MealCategoryPatchUpdate, MealCategoryCreate, MealCategoryRead,
@@ -21,6 +22,16 @@ class IMealCategoryService(Protocol):
     async def get_category(self, category_id: int) -> MealCategoryRead:
         ...
 
+    async def get_category_validators(
+        self, category_id: int
+    ) -> CacheValidators | None:
+        ...
+
+    async def get_categories_validators(
+        self, pagination_params: PaginationParams
+    ) -> CacheValidators:
+        ...
+
     async def update_category(
         self, category_id: int, category_data: MealCategoryPatchUpdate
     ) -> MealCategoryRead:
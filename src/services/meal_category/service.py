@@ -1,43 +1,90 @@
+from functools import partial
+
 from sqlalchemy.exc import IntegrityError
 
+from src.cache.lru import TTLLRUCache
+from src.cache.negative import NegativeCache
+from src.cache.response import ResponseCache
 from src.core.logging import logger
+from src.core.utils.conditional_get import CacheValidators, build_validators
+from src.core.utils.singleflight import SingleFlight
+from src.core.utils.pagination import (
+    decode_pagination_cursors, split_keyset_page, count_total_pages
+)
 from src.exceptions.meal_category import (
     MealCategoryAlreadyExistsError, MealCategoryNotFoundError,
     NoMealCategoryUpdateDataError
 )
 from src.repositories.interfaces.meal_category import IMealCategoryRepository
-from src.schemas.common import PaginationParams
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
+from src.schemas.common import PaginationParams, TotalKind
 from src.schemas.meal_category import (
     MealCategoryPatchUpdate, MealCategoryCreate, MealCategoryRead,
     PaginatedMealCategoryResponse
 )
+from src.services.menu.snapshot import MenuSnapshotStore
+
+# Response cache tags of the category list and of a single category
+CATEGORIES_TAG = "meal_categories"
+CATEGORY_TAG = "meal_category:{category_id}"
 
 
 class MealCategoryService:
-    def __init__(self, repository: IMealCategoryRepository) -> None:
+    def __init__(
+        self,
+        repository: IMealCategoryRepository,
+        uow: IUnitOfWork,
+        cache: TTLLRUCache[int, MealCategoryRead],
+        menu_snapshot_store: MenuSnapshotStore,
+        singleflight: SingleFlight,
+        negative_cache: NegativeCache,
+        response_cache: ResponseCache
+    ) -> None:
         self.repository = repository
+        self.uow = uow
+        self.cache = cache
+        self.menu_snapshot_store = menu_snapshot_store
+        self.singleflight = singleflight
+        self.negative_cache = negative_cache
+        self.response_cache = response_cache
 
     async def create_category(
         self, category_data: MealCategoryCreate
     ) -> MealCategoryRead:
-        logger.info(
-            f"Meal item service: Creating meal category: {category_data.name}"
-        )
-        category_dict = category_data.model_dump()
-
-        try:
-            category = await self.repository.create(category_dict)
+        async with self.uow:
             logger.info(
-                f"Meal item service: Meal category was created with "
-                f"ID: {category.id}"
-            )
-        except IntegrityError:
-            logger.warning(
-                f"Meal item service: Meal category '{category_dict['name']}' "
-                f"already exists"
+                f"Meal item service: Creating meal category: {category_data.name}"
             )
-            raise MealCategoryAlreadyExistsError(category_dict["name"])
-        return MealCategoryRead.model_validate(category)
+            category_dict = category_data.model_dump()
+
+            try:
+                category = await self.repository.create(category_dict)
+                await self.uow.notify_invalidation("meal_category", category.id)
+                self.uow.add_after_commit_hook(
+                    partial(self.cache.delete, category.id)
+                )
+                self.uow.add_after_commit_hook(
+                    partial(
+                        self.negative_cache.forget, "meal_category", category.id
+                    )
+                )
+                self.uow.add_after_commit_hook(
+                    partial(self.response_cache.purge, CATEGORIES_TAG)
+                )
+                self.uow.add_after_commit_hook(
+                    self.menu_snapshot_store.invalidate
+                )
+                logger.info(
+                    f"Meal item service: Meal category was created with "
+                    f"ID: {category.id}"
+                )
+            except IntegrityError:
+                logger.warning(
+                    f"Meal item service: Meal category '{category_dict['name']}' "
+                    f"already exists"
+                )
+                raise MealCategoryAlreadyExistsError(category_dict["name"])
+            return MealCategoryRead.model_validate(category)
 
     async def get_categories(
         self, pagination_params: PaginationParams
@@ -46,14 +93,21 @@ class MealCategoryService:
             f"Meal item service: Fetching meal categories - page: "
             f"{pagination_params.page}, per_page: {pagination_params.per_page}"
         )
+        after_id, before_id = decode_pagination_cursors(pagination_params)
         offset = (pagination_params.page - 1) * pagination_params.per_page
-        categories = await self.repository.get_all(
-            pagination_params.per_page, offset
+        total_kind = pagination_params.total_kind
+        rows, total = await self.repository.get_all(
+            pagination_params.per_page + 1, offset, after_id, before_id,
+            with_total=total_kind == TotalKind.exact
         )
-        total = await self.repository.get_total_count()
-        total_pages = (
-            (total + pagination_params.per_page - 1) // pagination_params.per_page
+        categories, next_cursor, prev_cursor = split_keyset_page(
+            rows, pagination_params
         )
+
+        if total_kind == TotalKind.estimated:
+            total = await self.repository.get_estimated_count()
+
+        total_pages = count_total_pages(total, pagination_params.per_page)
         logger.info(
             f"Meal item service: Retrieved {len(categories)} meal categories "
             f"(page {pagination_params.page}/{total_pages})"
@@ -61,82 +115,171 @@ class MealCategoryService:
 
         return PaginatedMealCategoryResponse(
             total=total,
-            page=pagination_params.page,
+            total_kind=total_kind,
+            page=(
+                None if pagination_params.is_cursor_mode
+                else pagination_params.page
+            ),
             total_pages=total_pages,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
             items=[MealCategoryRead.model_validate(c) for c in categories]
         )
 
     async def get_category(self, category_id: int) -> MealCategoryRead:
         logger.debug(f"Meal item service: Getting meal category {category_id}")
+
+        # Checked by a write in its own transaction, not by a cached copy
+        # or another request's read
+        if self.uow.in_transaction:
+            return await self._load_category(category_id)
+
+        cached_category = self.cache.get(category_id)
+
+        if cached_category is not None:
+            logger.debug(
+                f"Meal item service: Meal category {category_id} "
+                f"was served from cache"
+            )
+            return cached_category
+
+        if await self.negative_cache.is_missing("meal_category", category_id):
+            logger.debug(
+                f"Meal item service: Meal category {category_id} "
+                f"is known to be missing"
+            )
+            raise MealCategoryNotFoundError(category_id)
+
+        return await self.singleflight.do(
+            f"meal_category:{category_id}",
+            partial(self._load_category, category_id),
+            operation="get_category"
+        )
+
+    async def _load_category(self, category_id: int) -> MealCategoryRead:
+        # Read before the query, an update committed meanwhile wins
+        generation = self.cache.generation
         category = await self.repository.get_by_id(category_id)
 
         if not category:
             logger.warning(
                 f"Meal item service: Meal category {category_id} was not found"
             )
+            await self.negative_cache.remember("meal_category", category_id)
             raise MealCategoryNotFoundError(category_id)
 
         logger.debug(f"Meal item service: Found meal category {category_id}")
-        return MealCategoryRead.model_validate(category)
+        category_read = MealCategoryRead.model_validate(category)
+        self.cache.set(category_id, category_read, generation=generation)
+
+        return category_read
+
+    async def get_category_validators(
+        self, category_id: int
+    ) -> CacheValidators | None:
+        if await self.negative_cache.is_missing(
+            "meal_category", category_id, record_hit=False
+        ):
+            return None
+
+        updated_at = await self.repository.get_updated_at(category_id)
+
+        if updated_at is None:
+            return None
+        return build_validators(updated_at, "meal_category", category_id)
+
+    async def get_categories_validators(
+        self, pagination_params: PaginationParams
+    ) -> CacheValidators:
+        last_modified, count = await self.repository.get_list_version()
+        return build_validators(
+            last_modified, "meal_categories", count,
+            pagination_params.model_dump()
+        )
 
     async def update_category(
         self, category_id: int, category_data: MealCategoryPatchUpdate
     ) -> MealCategoryRead:
-        logger.debug(
-            f"Meal item service: Updating meal category {category_id}"
-        )
-        new_data = category_data.model_dump(exclude_unset=True)
-
-        if not new_data:
-            logger.warning(
-                f"Meal item service: Update meal category {category_id}"
+        async with self.uow:
+            logger.debug(
+                f"Meal item service: Updating meal category {category_id}"
             )
-            raise NoMealCategoryUpdateDataError()
+            new_data = category_data.model_dump(exclude_unset=True)
 
-        logger.debug(
-            f"Meal item service:: Update category {category_id}: {new_data}"
-        )
-        category = await self.repository.get_by_id(category_id)
+            if not new_data:
+                logger.warning(
+                    f"Meal item service: Update meal category {category_id}"
+                )
+                raise NoMealCategoryUpdateDataError()
 
-        if not category:
-            logger.warning(
-                f"Meal item service: Meal category {category_id} was not "
-                f"found for update"
-            )
-            raise MealCategoryNotFoundError(category_id)
-        if category_data.name and category.name == category_data.name:
-            logger.warning(
-                f"Meal item service: Meal category name '{category_data.name}' "
-                f"already exists"
+            logger.debug(
+                f"Meal item service:: Update category {category_id}: {new_data}"
             )
-            raise MealCategoryAlreadyExistsError(category_data.name)
+            category = await self.repository.get_by_id(category_id)
 
-        try:
-            upd_category = await self.repository.update(category_id, new_data)
-            logger.info(
-                f"Meal item service: Meal category {category_id} was updated"
-            )
+            if not category:
+                logger.warning(
+                    f"Meal item service: Meal category {category_id} was not "
+                    f"found for update"
+                )
+                raise MealCategoryNotFoundError(category_id)
+            if category_data.name and category.name == category_data.name:
+                logger.warning(
+                    f"Meal item service: Meal category name '{category_data.name}' "
+                    f"already exists"
+                )
+                raise MealCategoryAlreadyExistsError(category_data.name)
 
-            return MealCategoryRead.model_validate(upd_category)
-        except IntegrityError as e:
-            logger.error(
-                f"Meal item service: Failed to update meal category "
-                f"{category_id} due to integrity error: {e}"
-            )
-            raise MealCategoryAlreadyExistsError(new_data["name"])
+            try:
+                upd_category = await self.repository.update(category_id, new_data)
+                await self.uow.notify_invalidation("meal_category", category_id)
+                self.uow.add_after_commit_hook(
+                    partial(self.cache.delete, category_id)
+                )
+                self.uow.add_after_commit_hook(
+                    partial(self._purge_responses, category_id)
+                )
+                self.uow.add_after_commit_hook(
+                    self.menu_snapshot_store.invalidate
+                )
+                logger.info(
+                    f"Meal item service: Meal category {category_id} was updated"
+                )
+
+                return MealCategoryRead.model_validate(upd_category)
+            except IntegrityError as e:
+                logger.error(
+                    f"Meal item service: Failed to update meal category "
+                    f"{category_id} due to integrity error: {e}"
+                )
+                raise MealCategoryAlreadyExistsError(new_data["name"])
 
     async def delete_category(self, category_id: int) -> None:
-        logger.debug(f"Meal item service: Deleting meal category {category_id}")
-        category = await self.repository.get_by_id(category_id)
+        async with self.uow:
+            logger.debug(f"Meal item service: Deleting meal category {category_id}")
+            category = await self.repository.get_by_id(category_id)
 
-        if not category:
-            logger.warning(
-                f"Meal item service: Meal category {category_id} was not "
-                f"found for deletion"
+            if not category:
+                logger.warning(
+                    f"Meal item service: Meal category {category_id} was not "
+                    f"found for deletion"
+                )
+                raise MealCategoryNotFoundError(category_id)
+
+            await self.repository.delete(category_id)
+            await self.uow.notify_invalidation("meal_category", category_id)
+            self.uow.add_after_commit_hook(
+                partial(self.cache.delete, category_id)
+            )
+            self.uow.add_after_commit_hook(
+                partial(self._purge_responses, category_id)
+            )
+            self.uow.add_after_commit_hook(self.menu_snapshot_store.invalidate)
+            logger.info(
+                f"Meal item service:: Meal category {category_id} was deleted"
             )
-            raise MealCategoryNotFoundError(category_id)
 
-        await self.repository.delete(category_id)
-        logger.info(
-            f"Meal item service:: Meal category {category_id} was deleted"
+    async def _purge_responses(self, category_id: int) -> None:
+        await self.response_cache.purge(
+            CATEGORIES_TAG, CATEGORY_TAG.format(category_id=category_id)
         )
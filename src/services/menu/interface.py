@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from src.services.menu.snapshot import MenuSnapshot
+
+
+class IMenuService(Protocol):
+    async def get_menu(self) -> MenuSnapshot:
+        ...
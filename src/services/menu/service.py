@@ -0,0 +1,62 @@
+import hashlib
+from collections import defaultdict
+
+from src.core.logging import logger
+from src.repositories.interfaces.menu import IMenuRepository
+from src.schemas.meal import MealRead
+from src.schemas.menu import MenuRead, MenuCategoryRead
+from src.services.menu.snapshot import MenuSnapshot, MenuSnapshotStore
+
+
+class MenuService:
+    def __init__(
+        self, repository: IMenuRepository, snapshot_store: MenuSnapshotStore
+    ) -> None:
+        self.repository = repository
+        self.snapshot_store = snapshot_store
+
+    async def get_menu(self) -> MenuSnapshot:
+        snapshot = self.snapshot_store.get()
+
+        if snapshot is not None:
+            return snapshot
+
+        # Only one request per worker rebuilds, the rest wait for its result
+        async with self.snapshot_store.lock:
+            snapshot = self.snapshot_store.get()
+
+            if snapshot is not None:
+                return snapshot
+
+            version = self.snapshot_store.version
+            snapshot = await self._build_snapshot()
+            self.snapshot_store.set(snapshot, version)
+
+            return snapshot
+
+    async def _build_snapshot(self) -> MenuSnapshot:
+        logger.info("Menu service: Building menu snapshot")
+        categories = await self.repository.get_all_categories()
+        meals_by_category: dict[int, list[MealRead]] = defaultdict(list)
+
+        for meal in await self.repository.get_all_meals():
+            meals_by_category[meal.category_id].append(
+                MealRead.model_validate(meal)
+            )
+
+        menu = MenuRead(categories=[
+            MenuCategoryRead(
+                id=category.id,
+                name=category.name,
+                created_at=category.created_at,
+                meals=meals_by_category[category.id]
+            ) for category in categories
+        ])
+        body = menu.model_dump_json().encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        logger.info(
+            f"Menu service: Menu snapshot was built with {len(categories)} "
+            f"categories, {len(body)} bytes"
+        )
+
+        return MenuSnapshot(body=body, etag=etag)
@@ -0,0 +1,41 @@
+import asyncio
+from dataclasses import dataclass
+
+from src.core.logging import logger
+
+
+@dataclass(frozen=True)
+class MenuSnapshot:
+    body: bytes
+    etag: str
+
+
+class MenuSnapshotStore:
+    """Holds the serialized menu of this worker until the catalog changes.
+
+    Every invalidation bumps ``version``, a snapshot built from an older
+    version is dropped instead of stored, so a rebuild racing with a write
+    cannot bring the old menu back.
+    """
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.version = 0
+        self._snapshot: MenuSnapshot | None = None
+
+    def get(self) -> MenuSnapshot | None:
+        return self._snapshot
+
+    def set(self, snapshot: MenuSnapshot, version: int) -> None:
+        if version != self.version:
+            logger.debug("Menu snapshot: Discarding outdated snapshot")
+            return
+        self._snapshot = snapshot
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._snapshot = None
+        logger.debug(f"Menu snapshot: Invalidated, version {self.version}")
+
+
+menu_snapshot_store = MenuSnapshotStore()
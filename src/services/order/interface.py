@@ -1,5 +1,6 @@
 from typing import Protocol
 
+from src.core.utils.conditional_get import CacheValidators
 from src.schemas.order import OrderRead, OrderCreate
 
 
@@ -12,6 +13,12 @@ class IOrderService(Protocol):
 
     async def get_order(self, user_id: int, order_id: int) -> OrderRead: ...
 
+    async def get_order_validators(
+        self, user_id: int, order_id: int
+    ) -> CacheValidators | None: ...
+
+    async def get_orders_validators(self, user_id: int) -> CacheValidators: ...
+
     async def delete_order(self, user_id: int, order_id: int) -> None: ...
 
     async def delete_orders(self, user_id: int) -> None: ...
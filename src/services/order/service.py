@@ -1,9 +1,11 @@
 from src.core.logging import logger
+from src.core.utils.conditional_get import CacheValidators, build_validators
 from src.core.utils.datetime import strip_timezone
 from src.exceptions.cart import CartNotFoundError
 from src.exceptions.cart_item import CartItemsNotFoundError
 from src.exceptions.order import OrdersNotFound, OrderNotFound
 from src.repositories.interfaces.order import IOrderRepository
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
 from src.schemas.order import OrderRead, OrderCreate
 from src.services.cart.interface import ICartService
 from src.services.cart_item.interface import ICartItemService
@@ -16,62 +18,65 @@ class OrderService:
         repository: IOrderRepository,
         cart_service: ICartService,
         cart_item_service: ICartItemService,
-        order_item_service: IOrderItemService
+        order_item_service: IOrderItemService,
+        uow: IUnitOfWork
     ) -> None:
         self.repository = repository
         self.cart_service = cart_service
         self.cart_item_service = cart_item_service
         self.order_item_service = order_item_service
+        self.uow = uow
 
     async def create_order(
         self, user_id: int, order_data: OrderCreate
     ) -> OrderRead:
-        logger.info(f"Order service: Creating order for user {user_id}")
-        cart = await self.cart_service.get_cart_by_user_id(user_id)
+        async with self.uow:
+            logger.info(f"Order service: Creating order for user {user_id}")
+            cart = await self.cart_service.get_cart_by_user_id(user_id)
 
-        if not cart:
-            logger.warning(f"Order service: Cart not found for user {user_id}")
-            raise CartNotFoundError(user_id)
+            if not cart:
+                logger.warning(f"Order service: Cart not found for user {user_id}")
+                raise CartNotFoundError(user_id)
 
-        cart_items = await self.cart_item_service.get_cart_items(user_id)
-        if not cart_items:
-            logger.warning(
-                f"Order service: No cart items found for user {user_id}"
+            cart_items = await self.cart_item_service.get_cart_items(user_id)
+            if not cart_items:
+                logger.warning(
+                    f"Order service: No cart items found for user {user_id}"
+                )
+                raise CartItemsNotFoundError(user_id)
+
+            order_dict = order_data.model_dump()
+            order_dict.update({
+                "cart_id": cart.id,
+                "total_price": cart.total_price,
+                "scheduled_time": strip_timezone(order_data.scheduled_time)
+            })
+            items_data = [
+                {
+                    "meal_id": cart_item.meal_id,
+                    "quantity": cart_item.quantity,
+                    "meal_name": cart_item.meal_name,
+                    "unit_price": cart_item.unit_price,
+                    "total_price": cart_item.total_price
+                }
+                for cart_item in cart_items
+            ]
+            logger.debug(
+                f"Order service: Creating order with {len(items_data)} items, "
+                f"total: {order_dict['total_price']}"
+            )
+            order = await self.repository.create_with_items(
+                user_id, order_dict, items_data
             )
-            raise CartItemsNotFoundError(user_id)
-
-        order_dict = order_data.model_dump()
-        order_dict.update({
-            "cart_id": cart.id,
-            "total_price": cart.total_price,
-            "scheduled_time": strip_timezone(order_data.scheduled_time)
-        })
-        items_data = [
-            {
-                "meal_id": cart_item.meal_id,
-                "quantity": cart_item.quantity,
-                "meal_name": cart_item.meal_name,
-                "unit_price": cart_item.unit_price,
-                "total_price": cart_item.total_price
-            }
-            for cart_item in cart_items
-        ]
-        logger.debug(
-            f"Order service: Creating order with {len(items_data)} items, "
-            f"total: {order_dict['total_price']}"
-        )
-        order = await self.repository.create_with_items(
-            user_id, order_dict, items_data
-        )
 
-        logger.debug(f"Order service: Clearing cart items for user {user_id}")
-        await self.cart_item_service.remove_items_from_cart(user_id)
-        logger.info(
-            f"Order service: Order created successfully for user "
-            f"{user_id} with ID: {order.id}"
-        )
+            logger.debug(f"Order service: Clearing cart items for user {user_id}")
+            await self.cart_item_service.remove_items_from_cart(user_id)
+            logger.info(
+                f"Order service: Order created successfully for user "
+                f"{user_id} with ID: {order.id}"
+            )
 
-        return OrderRead.model_validate(order)
+            return OrderRead.model_validate(order)
 
     async def get_orders(self, user_id: int) -> list[OrderRead]:
         logger.debug(f"Order service: Getting all orders for user {user_id}")
@@ -103,38 +108,49 @@ class OrderService:
         )
         return OrderRead.model_validate(order)
 
+    async def get_order_validators(
+        self, user_id: int, order_id: int
+    ) -> CacheValidators | None:
+        updated_at = await self.repository.get_updated_at(user_id, order_id)
+
+        if updated_at is None:
+            return None
+        return build_validators(updated_at, "order", user_id, order_id)
+
+    async def get_orders_validators(self, user_id: int) -> CacheValidators:
+        last_modified, count = await self.repository.get_list_version(user_id)
+        return build_validators(last_modified, "orders", user_id, count)
+
     async def delete_order(self, user_id: int, order_id: int) -> None:
-        logger.debug(
-            f"Order service:: Deleting order {order_id} for user {user_id}"
-        )
-        try:
-            await self.get_order(user_id, order_id)
-        except OrderNotFound:
-            logger.warning(
-                f"Order service: Order {order_id} was not found for user "
-                f"{user_id} during deletion"
+        async with self.uow:
+            logger.debug(
+                f"Order service:: Deleting order {order_id} for user {user_id}"
             )
-            raise
+            try:
+                await self.get_order(user_id, order_id)
+            except OrderNotFound:
+                logger.warning(
+                    f"Order service: Order {order_id} was not found for user "
+                    f"{user_id} during deletion"
+                )
+                raise
 
-        await self.repository.delete_one(user_id, order_id)
-        logger.info(
-            f"Order service: Order {order_id} was deleted for user {user_id}"
-        )
+            await self.repository.delete_one(user_id, order_id)
+            logger.info(
+                f"Order service: Order {order_id} was deleted for user {user_id}"
+            )
 
     async def delete_orders(self, user_id: int) -> None:
-        logger.debug(f"Order service: Deleting all orders for user {user_id}")
+        async with self.uow:
+            logger.debug(f"Order service: Deleting all orders for user {user_id}")
+            deleted_count = await self.repository.delete_all(user_id)
 
-        try:
-            orders = await self.get_orders(user_id)
-            if not orders:
+            if not deleted_count:
                 logger.warning(
                     f"Order service: No orders found for user {user_id}"
                 )
                 raise OrdersNotFound(user_id)
-        except OrdersNotFound:
-            raise
 
-        await self.repository.delete_all(user_id)
-        logger.info(
-            f"Order service: All orders were deleted for user {user_id}"
-        )
+            logger.info(
+                f"Order service: All orders were deleted for user {user_id}"
+            )
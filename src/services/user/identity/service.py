@@ -5,37 +5,42 @@ from src.exceptions.user import (
     UserIdentityNotFoundError, UserIdentityAlreadyExistsError
 )
 from src.repositories.interfaces.user_identity import IUserIdentityRepository
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
 from src.schemas.user import IdentityCheck, IdentityRead, IdentityCreate
 
 
 class UserIdentityService:
-    def __init__(self, repository: IUserIdentityRepository) -> None:
+    def __init__(
+        self, repository: IUserIdentityRepository, uow: IUnitOfWork
+    ) -> None:
         self.repository = repository
+        self.uow = uow
 
     async def create_identity(
          self, user_id: int, identity_data: IdentityCreate
     ) -> IdentityRead:
-        logger.info(
-            f"User identity service: Creating identity for user "
-            f"{user_id} with provider {identity_data.provider}"
-        )
-        identity_dict = identity_data.model_dump()
-
-        try:
-            identity = await self.repository.create(user_id, identity_dict)
+        async with self.uow:
             logger.info(
-                f"User identity service: Identity was created for user {user_id}"
-            )
-        except IntegrityError:
-            logger.warning(
-                f"User identity service: Identity already exists for username "
-                f"{identity_dict['username']} in {identity_dict['provider']}"
-            )
-            raise UserIdentityAlreadyExistsError(
-                identity_dict["username"], identity_dict["provider"]
+                f"User identity service: Creating identity for user "
+                f"{user_id} with provider {identity_data.provider}"
             )
+            identity_dict = identity_data.model_dump()
 
-        return IdentityRead.model_validate(identity)
+            try:
+                identity = await self.repository.create(user_id, identity_dict)
+                logger.info(
+                    f"User identity service: Identity was created for user {user_id}"
+                )
+            except IntegrityError:
+                logger.warning(
+                    f"User identity service: Identity already exists for username "
+                    f"{identity_dict['username']} in {identity_dict['provider']}"
+                )
+                raise UserIdentityAlreadyExistsError(
+                    identity_dict["username"], identity_dict["provider"]
+                )
+
+            return IdentityRead.model_validate(identity)
 
     async def get_identity(
         self, identity_data: IdentityCheck
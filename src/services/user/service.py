@@ -1,6 +1,15 @@
+from functools import partial
+
 from sqlalchemy.exc import IntegrityError
 
+from src.cache.decorators import evict, read_through
+from src.cache.interface import ICache
+from src.cache.negative import NegativeCache
+from src.core.config import get_settings
 from src.core.logging import logger
+from src.core.utils.pagination import (
+    decode_pagination_cursors, split_keyset_page, count_total_pages
+)
 from src.exceptions.user import (
     UserNotFoundError, UserPhoneAlreadyExistsError, NoUserUpdateDataError,
     UserIdentityAlreadyExistsError, UserProviderIdAlreadyExistsError
@@ -9,25 +18,37 @@ from src.message_broker.events.user import UserCreatedEvent
 from src.message_broker.publisher.interface import IEventPublisher
 from src.message_broker.topics import TOPIC_USER_CREATED
 from src.repositories.interfaces.user import IUserRepository
-from src.schemas.common import PaginationParams
+from src.repositories.interfaces.unit_of_work import IUnitOfWork
+from src.schemas.common import PaginationParams, TotalKind
 from src.schemas.user import (
     UserRegister, UserPutUpdate, UserPatchUpdate, UserRead, IdentityCheck,
     IdentityCreate, PaginatedUserResponse, ProviderEnum, UserWithTokens
 )
+from src.services.cart.service import CART_CACHE_KEY
 from src.services.user.identity.interface import IUserIdentityService
 from src.core.utils.jwt import create_access_token, create_refresh_token
 
+settings = get_settings()
+
+USER_CACHE_KEY = "user:{user_id}"
+
 
 class UserService:
     def __init__(
         self,
         repository: IUserRepository,
         identity_service: IUserIdentityService,
-        publisher: IEventPublisher
+        publisher: IEventPublisher,
+        uow: IUnitOfWork,
+        cache: ICache,
+        negative_cache: NegativeCache
     ) -> None:
         self.repository = repository
         self.identity_service = identity_service
         self.publisher = publisher
+        self.uow = uow
+        self.cache = cache
+        self.negative_cache = negative_cache
 
     async def create_user(
         self, user_data: UserRegister
@@ -61,38 +82,47 @@ class UserService:
                 user_data.username, user_data.provider
             )
 
-        try:
-            user = await self.repository.create(user_data.model_dump(
-                exclude={"provider", "provider_id", "username"}
-            ))
-            logger.info(
-                f"User service: User created successfully with ID: {user.id}"
-            )
-        except IntegrityError:
-            logger.error(
-                f"User service: User creation failed due to integrity error"
-            )
-            raise UserPhoneAlreadyExistsError(user_data.phone_number)
+        async with self.uow:
+            try:
+                user = await self.repository.create(user_data.model_dump(
+                    exclude={"provider", "provider_id", "username"}
+                ))
+                await self.uow.notify_invalidation("user", user.id)
+                self.uow.add_after_commit_hook(
+                    partial(self.negative_cache.forget, "user", user.id)
+                )
+                logger.info(
+                    f"User service: User created successfully with ID: {user.id}"
+                )
+            except IntegrityError:
+                logger.error(
+                    f"User service: User creation failed due to integrity error"
+                )
+                raise UserPhoneAlreadyExistsError(user_data.phone_number)
+
+            new_identity = IdentityCreate(**user_data.model_dump())
 
-        new_identity = IdentityCreate(**user_data.model_dump())
+            try:
+                await self.identity_service.create_identity(
+                    user.id, new_identity
+                )
+                logger.info(
+                    f"User service: User identity was created for user "
+                    f"{user.id} with provider {user_data.provider}"
+                )
+            except UserIdentityAlreadyExistsError:
+                logger.error(
+                    f"User service: Identity creation failed for user {user.id}"
+                )
+                raise
 
-        try:
-            await self.identity_service.create_identity(user.id, new_identity)
+            # Relayed from the outbox after commit, the cart consumer always
+            # sees the user row
+            event = UserCreatedEvent(user_id=user.id)
+            await self.publisher.publish(TOPIC_USER_CREATED, event)
             logger.info(
-                f"User service: User identity was created for user "
-                f"{user.id} with provider {user_data.provider}"
+                f"User service: UserCreatedEvent was queued for user {user.id}"
             )
-        except UserIdentityAlreadyExistsError:
-            logger.error(
-                f"User service: Identity creation failed for user {user.id}"
-            )
-            raise
-
-        event = UserCreatedEvent(user_id=user.id)
-        await self.publisher.publish(TOPIC_USER_CREATED, event.model_dump())
-        logger.info(
-            f"User service: UserCreatedEvent was published for user {user.id}"
-        )
 
         if user_data.provider == ProviderEnum.web:
             access_token = create_access_token(user.id)
@@ -123,81 +153,109 @@ class UserService:
             f"User service: Fetching users - page: "
             f"{pagination_params.page}, per_page: {pagination_params.per_page}"
         )
+        after_id, before_id = decode_pagination_cursors(pagination_params)
         offset = (pagination_params.page - 1) * pagination_params.per_page
-        users = await self.repository.get_all(
-            pagination_params.per_page, offset
+        total_kind = pagination_params.total_kind
+        rows, total = await self.repository.get_all(
+            pagination_params.per_page + 1, offset, after_id, before_id,
+            with_total=total_kind == TotalKind.exact
         )
-        total = await self.repository.get_total_count()
-        total_pages = (
-            (total + pagination_params.per_page - 1) // pagination_params.per_page
+        users, next_cursor, prev_cursor = split_keyset_page(
+            rows, pagination_params
         )
+
+        if total_kind == TotalKind.estimated:
+            total = await self.repository.get_estimated_count()
+
+        total_pages = count_total_pages(total, pagination_params.per_page)
         logger.info(
             f"User service: Retrieved {len(users)} users out of {total} total users"
         )
 
         return PaginatedUserResponse(
             total=total,
-            page=pagination_params.page,
+            total_kind=total_kind,
+            page=(
+                None if pagination_params.is_cursor_mode
+                else pagination_params.page
+            ),
             total_pages=total_pages,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
             items=[UserRead.model_validate(user) for user in users]
         )
 
+    # Backs /users/me, which clients call on every screen
+    @read_through(USER_CACHE_KEY, ttl=settings.user_cache_ttl_seconds)
     async def get_user(self, user_id: int) -> UserRead | None:
         logger.debug(
             f"User service: Getting user {user_id}"
         )
+
+        if await self.negative_cache.is_missing("user", user_id):
+            logger.debug(f"User service: User {user_id} is known to be missing")
+            raise UserNotFoundError(user_id)
+
         user = await self.repository.get_by_id(user_id)
 
         if not user:
             logger.warning(f"User service: User {user_id} was not found")
+            await self.negative_cache.remember("user", user_id)
             raise UserNotFoundError(user_id)
         return UserRead.model_validate(user)
 
+    @evict(USER_CACHE_KEY)
     async def update_user(
         self,
         user_id: int,
         user_data: UserPutUpdate | UserPatchUpdate,
         is_partial: bool = False
     ) -> UserRead | None:
-        update_type = "partial" if is_partial else "full"
-        logger.debug(f"User service: {update_type} update for user {user_id}")
-
-        new_data = (
-            user_data.model_dump(exclude_unset=True) if is_partial
-            else user_data.model_dump()
-        )
+        async with self.uow:
+            update_type = "partial" if is_partial else "full"
+            logger.debug(f"User service: {update_type} update for user {user_id}")
 
-        if not new_data:
-            logger.warning(
-                f"User service: No update data provided for user {user_id}"
+            new_data = (
+                user_data.model_dump(exclude_unset=True) if is_partial
+                else user_data.model_dump()
             )
-            raise NoUserUpdateDataError()
 
-        if not await self.repository.get_by_id(user_id):
-            logger.warning(
-                f"User service: User {user_id} was not found for update"
-            )
-            raise UserNotFoundError(user_id)
+            if not new_data:
+                logger.warning(
+                    f"User service: No update data provided for user {user_id}"
+                )
+                raise NoUserUpdateDataError()
 
-        try:
-            upd_user = await self.repository.update(user_id, new_data)
-            logger.info(f"User service: User {user_id} was updated")
-        except IntegrityError:
-            logger.warning(
-                f"User service: User {user_id} with this phone already exists"
-            )
-            raise UserPhoneAlreadyExistsError(new_data["phone_number"])
-        return UserRead.model_validate(upd_user)
+            if not await self.repository.get_by_id(user_id):
+                logger.warning(
+                    f"User service: User {user_id} was not found for update"
+                )
+                raise UserNotFoundError(user_id)
+
+            try:
+                upd_user = await self.repository.update(user_id, new_data)
+                await self.uow.notify_invalidation("user", user_id)
+                logger.info(f"User service: User {user_id} was updated")
+            except IntegrityError:
+                logger.warning(
+                    f"User service: User {user_id} with this phone already exists"
+                )
+                raise UserPhoneAlreadyExistsError(new_data["phone_number"])
+            return UserRead.model_validate(upd_user)
 
+    # The user's cart is removed by the cascade, not by CartService
+    @evict(USER_CACHE_KEY, CART_CACHE_KEY)
     async def delete_user(self, user_id: int) -> None:
-        logger.debug(f"User service: Deleting user {user_id}")
-        user = await self.repository.get_by_id(user_id)
+        async with self.uow:
+            logger.debug(f"User service: Deleting user {user_id}")
+            user = await self.repository.get_by_id(user_id)
 
-        if not user:
-            logger.warning(
-                f"User service: User {user_id} was not found for deletion"
-            )
-            raise UserNotFoundError(user_id)
+            if not user:
+                logger.warning(
+                    f"User service: User {user_id} was not found for deletion"
+                )
+                raise UserNotFoundError(user_id)
 
-        await self.repository.delete(user_id)
-        logger.info(f"User service: User {user_id} was deleted")
+            await self.repository.delete(user_id)
+            await self.uow.notify_invalidation("user", user_id)
+            logger.info(f"User service: User {user_id} was deleted")
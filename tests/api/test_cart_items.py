@@ -0,0 +1,61 @@
+import asyncio
+from decimal import Decimal
+
+from sqlalchemy import text
+
+from src.core.database import async_session
+from src.message_broker.topics import TOPIC_CART_UPDATED
+from tests.database import DatabaseTestCase
+
+
+class AddCartItemTest(DatabaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.meal_id = await self.create_meal(await self.create_category())
+        self.user_id = await self.create_user_with_cart()
+
+    async def get_item(self) -> dict:
+        response = await self.client.get(
+            f"/api/v1/users/{self.user_id}/cart/items"
+        )
+        self.assertEqual(response.status_code, 200, response.text)
+        items = response.json()
+        self.assertEqual(len(items), 1)
+
+        return items[0]
+
+    async def get_queued_total(self) -> Decimal:
+        """Sum of the cart total changes waiting in the outbox."""
+        async with async_session() as session:
+            payloads = await session.scalars(
+                text(
+                    "SELECT payload FROM outbox "
+                    "WHERE topic = :topic AND key = :key"
+                ),
+                {"topic": TOPIC_CART_UPDATED, "key": str(self.user_id)}
+            )
+            return sum(
+                (Decimal(str(p["total_price_delta"])) for p in payloads),
+                Decimal("0.00")
+            )
+
+    async def test_repeated_adds_sum_up(self):
+        await self.add_cart_item(self.user_id, self.meal_id, quantity=2)
+        await self.add_cart_item(self.user_id, self.meal_id, quantity=3)
+
+        item = await self.get_item()
+        self.assertEqual(item["quantity"], 5)
+        self.assertEqual(Decimal(item["total_price"]), Decimal("25.00"))
+        self.assertEqual(await self.get_queued_total(), Decimal("25.00"))
+
+    async def test_concurrent_adds_are_not_lost(self):
+        await self.add_cart_item(self.user_id, self.meal_id)
+
+        await asyncio.gather(*(
+            self.add_cart_item(self.user_id, self.meal_id) for _ in range(5)
+        ))
+
+        item = await self.get_item()
+        self.assertEqual(item["quantity"], 6)
+        self.assertEqual(Decimal(item["total_price"]), Decimal("30.00"))
+        self.assertEqual(await self.get_queued_total(), Decimal("30.00"))
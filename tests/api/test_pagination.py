@@ -0,0 +1,78 @@
+from tests.database import DatabaseTestCase
+
+ROWS = 5
+
+
+class CursorPaginationTest(DatabaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.category_id = await self.create_category()
+        self.meal_ids = [
+            await self.create_meal(self.category_id) for _ in range(ROWS)
+        ]
+
+    async def get_page(self, **params) -> dict:
+        response = await self.client.get(
+            f"/api/v1/meal-categories/{self.category_id}/meals",
+            params={"per_page": 2} | params
+        )
+        self.assertEqual(response.status_code, 200, response.text)
+
+        return response.json()
+
+    async def test_walks_forward_and_back(self):
+        first = await self.get_page()
+        second = await self.get_page(after=first["next_cursor"])
+        third = await self.get_page(after=second["next_cursor"])
+
+        self.assertEqual(
+            [meal["id"] for page in (first, second, third)
+             for meal in page["items"]],
+            self.meal_ids
+        )
+        self.assertIsNone(third["next_cursor"])
+
+        back = await self.get_page(before=third["prev_cursor"])
+        self.assertEqual(back["items"], second["items"])
+        self.assertEqual(back["next_cursor"], second["next_cursor"])
+        self.assertEqual(back["prev_cursor"], second["prev_cursor"])
+
+        start = await self.get_page(before=back["prev_cursor"])
+        self.assertEqual(start["items"], first["items"])
+        self.assertIsNone(start["prev_cursor"])
+
+    async def test_cursor_pages_skip_the_total(self):
+        first = await self.get_page()
+        self.assertEqual(
+            (first["total"], first["total_kind"], first["page"]),
+            (ROWS, "exact", 1)
+        )
+
+        second = await self.get_page(after=first["next_cursor"])
+        self.assertEqual(
+            (second["total"], second["total_kind"], second["page"]),
+            (None, "none", None)
+        )
+        self.assertIsNone(second["total_pages"])
+
+    async def test_cursor_pages_count_when_asked(self):
+        first = await self.get_page()
+        second = await self.get_page(
+            after=first["next_cursor"], include_total="true"
+        )
+
+        self.assertEqual(
+            (second["total"], second["total_kind"]), (ROWS, "exact")
+        )
+
+    async def test_conflicting_cursors_are_rejected(self):
+        first = await self.get_page()
+        response = await self.client.get(
+            f"/api/v1/meal-categories/{self.category_id}/meals",
+            params={
+                "after": first["next_cursor"],
+                "before": first["next_cursor"]
+            }
+        )
+
+        self.assertEqual(response.status_code, 400, response.text)
@@ -0,0 +1,81 @@
+from src.services.menu.snapshot import menu_snapshot_store
+from tests.database import DatabaseTestCase
+from tests.query_stats import assert_max_queries
+
+ROWS = 3
+
+
+class QueryBudgetTest(DatabaseTestCase):
+    """Reads whose query count must not grow with the number of rows.
+
+    Every list holds several rows, so an N+1 regression exceeds the budget.
+    """
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.category_id = await self.create_category()
+        self.meal_ids = [
+            await self.create_meal(self.category_id) for _ in range(ROWS)
+        ]
+        self.user_id = await self.create_user_with_cart()
+
+    async def fill_cart(self) -> None:
+        for meal_id in self.meal_ids:
+            await self.add_cart_item(self.user_id, meal_id)
+
+    async def test_menu(self):
+        menu_snapshot_store.invalidate()
+
+        # The categories and their meals
+        with assert_max_queries(2):
+            response = await self.client.get("/api/v1/menu")
+
+        self.assertEqual(response.status_code, 200)
+
+    async def test_meals_list(self):
+        # The category and one page query with its total
+        with assert_max_queries(2):
+            response = await self.client.get(
+                f"/api/v1/meal-categories/{self.category_id}/meals"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["items"]), ROWS)
+
+    async def test_cart_items(self):
+        await self.fill_cart()
+
+        with assert_max_queries(1):
+            response = await self.client.get(
+                f"/api/v1/users/{self.user_id}/cart/items"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), ROWS)
+
+    async def test_orders_list(self):
+        for _ in range(ROWS):
+            await self.fill_cart()
+            response = await self.client.post(
+                f"/api/v1/users/{self.user_id}/orders",
+                json={
+                    "delivery_address": "Test street",
+                    "delivery_latitude": 41.3,
+                    "delivery_longitude": 69.2,
+                    "house_number": "1",
+                    "payment_method": "cash"
+                }
+            )
+            self.assertEqual(response.status_code, 201, response.text)
+
+        # The orders, their items in one batch and the list version
+        with assert_max_queries(3):
+            response = await self.client.get(
+                f"/api/v1/users/{self.user_id}/orders"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), ROWS)
+        self.assertTrue(
+            all(len(order["items"]) == ROWS for order in response.json())
+        )
@@ -0,0 +1,138 @@
+import asyncio
+import socket
+from unittest import IsolatedAsyncioTestCase
+
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from src.cache.interface import ICache
+from src.cache.memory import InMemoryCache
+from src.cache.redis import RedisCache, create_redis_client
+from src.exceptions.cache import CacheBackendError
+
+
+class CacheContract:
+    """Behaviour every ICache backend has to share."""
+
+    cache: ICache
+
+    async def test_get_of_missing_key_returns_none(self):
+        self.assertIsNone(await self.cache.get("missing"))
+
+    async def test_set_then_get(self):
+        await self.cache.set("key", b"value")
+
+        self.assertEqual(await self.cache.get("key"), b"value")
+
+    async def test_set_overwrites(self):
+        await self.cache.set("key", b"old")
+        await self.cache.set("key", b"new")
+
+        self.assertEqual(await self.cache.get("key"), b"new")
+
+    async def test_mget_keeps_order_and_missing_keys(self):
+        await self.cache.set("a", b"1")
+        await self.cache.set("c", b"3")
+
+        self.assertEqual(
+            await self.cache.mget(["a", "b", "c"]), [b"1", None, b"3"]
+        )
+        self.assertEqual(await self.cache.mget([]), [])
+
+    async def test_delete_removes_every_key(self):
+        await self.cache.set("a", b"1")
+        await self.cache.set("b", b"2")
+        await self.cache.set("c", b"3")
+
+        await self.cache.delete("a", "b", "missing")
+        await self.cache.delete()
+
+        self.assertEqual(
+            await self.cache.mget(["a", "b", "c"]), [None, None, b"3"]
+        )
+
+    async def test_entry_expires_after_ttl(self):
+        await self.cache.set("short", b"1", ttl=0.05)
+        await self.cache.set("long", b"2", ttl=60)
+        await asyncio.sleep(0.1)
+
+        self.assertIsNone(await self.cache.get("short"))
+        self.assertEqual(await self.cache.get("long"), b"2")
+
+    async def test_default_ttl_applies(self):
+        await self.cache.set("key", b"1")
+        await asyncio.sleep(0.25)
+
+        self.assertIsNone(await self.cache.get("key"))
+
+    async def test_binary_values_round_trip(self):
+        value = b"\x00\r\n$-1\r\n\xff"
+        await self.cache.set("key", value)
+
+        self.assertEqual(await self.cache.get("key"), value)
+
+
+class InMemoryCacheTest(CacheContract, IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.cache = InMemoryCache(maxsize=100, default_ttl=0.2)
+
+    async def asyncTearDown(self):
+        await self.cache.close()
+
+
+class RedisCacheTest(CacheContract, IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = FakeAsyncRedis(server=FakeServer())
+        self.cache = RedisCache(self.client, default_ttl=0.2)
+
+    async def asyncTearDown(self):
+        await self.cache.close()
+
+    async def test_keys_are_prefixed(self):
+        cache = RedisCache(self.client, key_prefix="cafe:")
+        await cache.set("key", b"1")
+
+        self.assertEqual(await self.client.get("cafe:key"), b"1")
+        self.assertEqual(await cache.get("key"), b"1")
+
+    async def test_ttl_is_sent_in_milliseconds(self):
+        await self.cache.set("key", b"1", ttl=1.5)
+
+        self.assertTrue(1000 < await self.client.pttl("key") <= 1500)
+
+    async def test_error_reply_raises_cache_backend_error(self):
+        await self.client.rpush("key", b"1")
+
+        with self.assertRaisesRegex(CacheBackendError, "GET failed"):
+            await self.cache.get("key")
+
+
+class RedisClientTest(IsolatedAsyncioTestCase):
+    """The real client against servers that fail in ways fakeredis can't."""
+
+    async def test_unreachable_server_raises_cache_backend_error(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        cache = RedisCache(create_redis_client("127.0.0.1", port))
+
+        with self.assertRaisesRegex(CacheBackendError, "GET failed"):
+            await cache.get("key")
+        await cache.close()
+
+    async def test_timeout_raises_cache_backend_error(self):
+        async def never_reply(reader, writer):
+            await reader.read()
+            writer.close()
+
+        server = await asyncio.start_server(never_reply, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        cache = RedisCache(
+            create_redis_client("127.0.0.1", port, timeout=0.05)
+        )
+
+        with self.assertRaisesRegex(CacheBackendError, "TimeoutError"):
+            await cache.get("key")
+
+        await cache.close()
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,62 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+import asyncpg
+
+from src.cache.invalidation import InvalidationBus
+from src.core.config import get_settings
+from tests.database import requires_database
+
+
+class ListenerCrash(BaseException):
+    """Escapes the reconnect loop like a bug in the listener would."""
+
+
+@requires_database
+class InvalidationBusListenerTest(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        settings = get_settings()
+        self.bus = InvalidationBus(
+            channel="test_invalidation",
+            connect_kwargs={
+                "host": settings.postgres_host,
+                "port": settings.postgres_port,
+                "user": settings.postgres_user,
+                "password": settings.postgres_password,
+                "database": settings.postgres_db
+            },
+            reconnect_delay=0.01
+        )
+        self.failures: list[BaseException] = []
+        self.listening = asyncio.Event()
+        self.dropped = asyncio.Event()
+        self.bus.register("meal", lambda entity_id: self.dropped.set())
+
+        wait_until_lost = self.bus._wait_until_lost
+
+        async def fail_first(conn: asyncpg.Connection) -> None:
+            if self.failures:
+                raise self.failures.pop(0)
+            self.listening.set()
+            await wait_until_lost(conn)
+
+        self.bus._wait_until_lost = fail_first
+
+    async def asyncTearDown(self):
+        await self.bus.stop()
+
+    async def test_reconnects_after_interface_error(self):
+        self.failures = [asyncpg.InterfaceError("connection is closed")]
+        await self.bus.start()
+
+        await asyncio.wait_for(self.listening.wait(), timeout=5)
+        self.assertTrue(self.dropped.is_set())
+
+    async def test_restarts_a_listener_that_stopped(self):
+        self.failures = [ListenerCrash()]
+        await self.bus.start()
+
+        await asyncio.wait_for(self.listening.wait(), timeout=5)
+        self.assertFalse(self.bus._task.done())
+        # Whatever was sent meanwhile is lost, the caches are dropped
+        self.assertTrue(self.dropped.is_set())
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+from unittest import TestCase
+
+from src.core.utils.pagination import (
+    decode_cursor, encode_cursor, split_keyset_page
+)
+from src.schemas.common import PaginationParams, TotalKind
+
+
+def rows(*ids: int) -> list[SimpleNamespace]:
+    return [SimpleNamespace(id=item_id) for item_id in ids]
+
+
+def ids(items: list[SimpleNamespace]) -> list[int]:
+    return [item.id for item in items]
+
+
+class SplitKeysetPageTest(TestCase):
+    def test_first_page_has_only_next_cursor(self):
+        params = PaginationParams(per_page=2)
+
+        items, next_cursor, prev_cursor = split_keyset_page(
+            rows(1, 2, 3), params
+        )
+
+        self.assertEqual(ids(items), [1, 2])
+        self.assertEqual(decode_cursor(next_cursor), 2)
+        self.assertIsNone(prev_cursor)
+
+    def test_last_page_has_no_next_cursor(self):
+        params = PaginationParams(per_page=2, after=encode_cursor(2))
+
+        items, next_cursor, prev_cursor = split_keyset_page(
+            rows(3), params
+        )
+
+        self.assertEqual(ids(items), [3])
+        self.assertIsNone(next_cursor)
+        self.assertEqual(decode_cursor(prev_cursor), 3)
+
+    def test_later_offset_page_has_prev_cursor(self):
+        params = PaginationParams(page=2, per_page=2)
+
+        items, next_cursor, prev_cursor = split_keyset_page(
+            rows(3, 4), params
+        )
+
+        self.assertEqual(ids(items), [3, 4])
+        self.assertIsNone(next_cursor)
+        self.assertEqual(decode_cursor(prev_cursor), 3)
+
+    def test_before_restores_ascending_order(self):
+        # Fetched descending from the cursor, with one extra row
+        params = PaginationParams(per_page=2, before=encode_cursor(5))
+
+        items, next_cursor, prev_cursor = split_keyset_page(
+            rows(4, 3, 2), params
+        )
+
+        self.assertEqual(ids(items), [3, 4])
+        self.assertEqual(decode_cursor(next_cursor), 4)
+        self.assertEqual(decode_cursor(prev_cursor), 3)
+
+    def test_before_reaching_the_start_has_no_prev_cursor(self):
+        params = PaginationParams(per_page=2, before=encode_cursor(3))
+
+        items, next_cursor, prev_cursor = split_keyset_page(
+            rows(2, 1), params
+        )
+
+        self.assertEqual(ids(items), [1, 2])
+        self.assertEqual(decode_cursor(next_cursor), 2)
+        self.assertIsNone(prev_cursor)
+
+    def test_empty_page_has_no_cursors(self):
+        params = PaginationParams(after=encode_cursor(9))
+
+        self.assertEqual(split_keyset_page([], params), ([], None, None))
+
+
+class TotalKindTest(TestCase):
+    def test_page_numbers_count_exactly_by_default(self):
+        self.assertEqual(PaginationParams().total_kind, TotalKind.exact)
+
+    def test_cursors_skip_the_count_by_default(self):
+        params = PaginationParams(after=encode_cursor(1))
+
+        self.assertEqual(params.total_kind, TotalKind.none)
+
+    def test_cursors_count_when_asked(self):
+        exact = PaginationParams(after=encode_cursor(1), include_total=True)
+        estimated = PaginationParams(
+            before=encode_cursor(1), include_total=True, estimate_total=True
+        )
+
+        self.assertEqual(exact.total_kind, TotalKind.exact)
+        self.assertEqual(estimated.total_kind, TotalKind.estimated)
+
+    def test_include_total_false_wins(self):
+        params = PaginationParams(include_total=False, estimate_total=True)
+
+        self.assertEqual(params.total_kind, TotalKind.none)
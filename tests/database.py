@@ -0,0 +1,130 @@
+"""Base of the tests that run against the PostgreSQL database of ``.env``,
+migrated to head. They are skipped when the database can't be reached."""
+import socket
+from uuid import uuid4
+
+import httpx
+from sqlalchemy import text
+from unittest import IsolatedAsyncioTestCase, skipUnless
+
+from src.core.config import get_settings
+from src.core.database import async_engine, async_session, replica_engine
+
+
+def database_is_reachable() -> bool:
+    settings = get_settings()
+    try:
+        with socket.create_connection(
+            (settings.postgres_host, settings.postgres_port), timeout=1
+        ):
+            return True
+    except OSError:
+        return False
+
+
+requires_database = skipUnless(
+    database_is_reachable(), "needs the PostgreSQL database of .env"
+)
+
+
+@requires_database
+class DatabaseTestCase(IsolatedAsyncioTestCase):
+    """Calls the app in-process and removes the rows a test created."""
+
+    async def asyncSetUp(self):
+        from src.main import app
+
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+        self.tag = uuid4().hex[:8]
+        self.user_ids: list[int] = []
+        self.category_ids: list[int] = []
+
+    async def asyncTearDown(self):
+        for user_id in self.user_ids:
+            await self.client.delete(f"/api/v1/users/{user_id}")
+        for category_id in self.category_ids:
+            await self.client.delete(f"/api/v1/meal-categories/{category_id}")
+        await self.client.aclose()
+
+        # Nothing relays in tests, drop what the test queued
+        if self.user_ids:
+            async with async_session() as session:
+                await session.execute(
+                    text("DELETE FROM outbox WHERE key = ANY(:keys)"),
+                    {"keys": [str(user_id) for user_id in self.user_ids]}
+                )
+                await session.commit()
+
+        # Pooled connections are bound to this test's event loop
+        await async_engine.dispose()
+        if replica_engine is not None:
+            await replica_engine.dispose()
+
+    async def create_category(self) -> int:
+        response = await self.client.post(
+            "/api/v1/meal-categories",
+            json={"name": f"category-{self.tag}-{len(self.category_ids)}"}
+        )
+        self.assertEqual(response.status_code, 201, response.text)
+        self.category_ids.append(response.json()["id"])
+
+        return self.category_ids[-1]
+
+    async def create_meal(
+        self, category_id: int, unit_price: str = "5.00"
+    ) -> int:
+        response = await self.client.post(
+            f"/api/v1/meal-categories/{category_id}/meals",
+            json={
+                "name": f"meal-{self.tag}-{uuid4().hex[:8]}",
+                "description": "Test meal",
+                "unit_price": unit_price
+            }
+        )
+        self.assertEqual(response.status_code, 201, response.text)
+
+        return response.json()["id"]
+
+    async def create_user_with_cart(self) -> int:
+        suffix = f"{self.tag}{len(self.user_ids)}"
+        response = await self.client.post(
+            "/api/v1/users/register",
+            json={
+                "name": "Test",
+                "surname": "User",
+                "phone_number": f"998{int(suffix, 16) % 10 ** 9:09d}",
+                "provider": "web",
+                "provider_id": suffix,
+                "username": f"user{suffix}"
+            }
+        )
+        self.assertEqual(response.status_code, 201, response.text)
+        body = response.json()
+        user_id = body.get("user", body)["id"]
+        self.user_ids.append(user_id)
+
+        response = await self.client.post(f"/api/v1/users/{user_id}/cart")
+        self.assertEqual(response.status_code, 201, response.text)
+
+        return user_id
+
+    async def add_cart_item(
+        self, user_id: int, meal_id: int, quantity: int = 1
+    ) -> httpx.Response:
+        response = await self.client.post(
+            f"/api/v1/users/{user_id}/cart/items",
+            json={"meal_id": meal_id, "quantity": quantity}
+        )
+        self.assertLess(response.status_code, 300, response.text)
+
+        return response
+
+    async def get_cart_total(self, user_id: int) -> str:
+        async with async_session() as session:
+            total = await session.scalar(
+                text("SELECT total_price FROM carts WHERE user_id = :id"),
+                {"id": user_id}
+            )
+        return f"{total:.2f}"
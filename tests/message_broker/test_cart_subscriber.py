@@ -0,0 +1,163 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import text
+
+from src.core.cache import cart_cache
+from src.core.database import async_session
+from src.message_broker.events.cart import CartUpdatedEvent
+from src.message_broker.subscriber import cart as cart_subscriber
+from src.message_broker.subscriber.cart import (
+    coalesce_cart_events, drop_applied_events, update_cart_on_cart_updated,
+    update_carts_on_cart_updated
+)
+from src.repositories.sqlalchemy.cart import SQLAlchemyCartRepository
+from src.repositories.sqlalchemy.processed_event import (
+    SQLAlchemyProcessedEventRepository
+)
+from src.repositories.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from src.schemas.cart import CartPatchUpdate
+from src.services.cart.service import CartService
+from tests.database import DatabaseTestCase
+
+# No cart is ever created for it
+UNKNOWN_USER_ID = -1
+
+
+def delta(user_id: int, amount: str) -> CartUpdatedEvent:
+    return CartUpdatedEvent(
+        user_id=user_id, total_price_delta=Decimal(amount)
+    )
+
+
+class CoalesceCartEventsTest(TestCase):
+    def test_deltas_are_grouped_by_user(self):
+        events = [delta(1, "1.00"), delta(2, "2.00"), delta(1, "-0.50")]
+
+        deltas, ordered = coalesce_cart_events(events)
+
+        self.assertEqual(
+            deltas,
+            {1: [Decimal("1.00"), Decimal("-0.50")], 2: [Decimal("2.00")]}
+        )
+        self.assertEqual(ordered, [])
+
+    def test_users_with_an_absolute_update_keep_their_order(self):
+        absolute = CartUpdatedEvent(
+            user_id=1,
+            cart_data=CartPatchUpdate(total_price=Decimal("0.00")),
+            version=3
+        )
+        events = [
+            delta(1, "1.00"), absolute, delta(2, "2.00"), delta(1, "4.00")
+        ]
+
+        deltas, ordered = coalesce_cart_events(events)
+
+        self.assertEqual(deltas, {2: [Decimal("2.00")]})
+        self.assertEqual(ordered, [events[0], absolute, events[3]])
+
+    def test_empty_batch(self):
+        self.assertEqual(coalesce_cart_events([]), ({}, []))
+
+
+class CartSubscriberTest(DatabaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.user_id = await self.create_user_with_cart()
+        self.event_ids = []
+
+    async def asyncTearDown(self):
+        async with async_session() as session:
+            await session.execute(
+                text(
+                    "DELETE FROM processed_events WHERE event_id = ANY(:ids)"
+                ),
+                {"ids": self.event_ids}
+            )
+            await session.commit()
+        await super().asyncTearDown()
+
+    def delta(
+        self, amount: str, user_id: int | None = None
+    ) -> CartUpdatedEvent:
+        event = delta(user_id or self.user_id, amount)
+        self.event_ids.append(event.event_id)
+        return event
+
+    async def test_drop_applied_events_skips_duplicates(self):
+        first, second = self.delta("1.00"), self.delta("2.00")
+
+        async with async_session() as session:
+            repository = SQLAlchemyProcessedEventRepository(session)
+
+            self.assertEqual(
+                await drop_applied_events(repository, [first, second, first]),
+                [first, second]
+            )
+            self.assertEqual(
+                await drop_applied_events(repository, [second, first]), []
+            )
+            await session.rollback()
+
+    async def test_add_to_totals_skips_unknown_carts(self):
+        async with async_session() as session:
+            cart_service = CartService(
+                SQLAlchemyCartRepository(session),
+                SQLAlchemyUnitOfWork(session),
+                cart_cache
+            )
+            carts = await cart_service.add_to_totals({
+                self.user_id: [Decimal("1.50"), Decimal("2.00")],
+                UNKNOWN_USER_ID: [Decimal("5.00")]
+            })
+
+        self.assertEqual([cart.user_id for cart in carts], [self.user_id])
+        self.assertEqual(await self.get_cart_total(self.user_id), "3.50")
+
+    async def test_redelivered_batch_is_applied_once(self):
+        events = [
+            self.delta("1.25"),
+            self.delta("2.00"),
+            self.delta("9.99", user_id=UNKNOWN_USER_ID)
+        ]
+
+        await update_carts_on_cart_updated(events)
+        await update_carts_on_cart_updated(events)
+
+        self.assertEqual(await self.get_cart_total(self.user_id), "3.25")
+
+    async def test_event_is_applied_once(self):
+        event = self.delta("2.50")
+
+        await update_cart_on_cart_updated(event)
+        await update_cart_on_cart_updated(event)
+
+        self.assertEqual(await self.get_cart_total(self.user_id), "2.50")
+
+    async def test_event_of_unknown_cart_is_acknowledged(self):
+        event = self.delta("1.00", user_id=UNKNOWN_USER_ID)
+
+        # Raising would have the event redelivered forever
+        await update_cart_on_cart_updated(event)
+
+    async def test_failed_batch_is_retried_before_it_is_acknowledged(self):
+        events = [self.delta("1.00"), self.delta("0.50")]
+        apply_cart_batch = cart_subscriber.apply_cart_batch
+        attempts = []
+
+        async def fail_once(batch):
+            attempts.append(batch)
+            if len(attempts) == 1:
+                raise ConnectionError("database went away")
+            return await apply_cart_batch(batch)
+
+        with (
+            patch.object(cart_subscriber, "BATCH_RETRY_DELAY", 0),
+            patch.object(cart_subscriber, "apply_cart_batch", fail_once)
+        ):
+            await update_carts_on_cart_updated(events)
+
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(await self.get_cart_total(self.user_id), "1.50")
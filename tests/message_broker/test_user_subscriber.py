@@ -0,0 +1,21 @@
+from sqlalchemy import text
+
+from src.core.database import async_session
+from src.message_broker.events.user import UserCreatedEvent
+from src.message_broker.subscriber.user import create_cart_on_user_created
+from tests.database import DatabaseTestCase
+
+
+class CreateCartOnUserCreatedTest(DatabaseTestCase):
+    async def test_duplicate_event_is_acknowledged(self):
+        user_id = await self.create_user_with_cart()
+
+        # Raising would have the event redelivered forever
+        await create_cart_on_user_created(UserCreatedEvent(user_id=user_id))
+
+        async with async_session() as session:
+            carts = await session.scalar(
+                text("SELECT count(*) FROM carts WHERE user_id = :id"),
+                {"id": user_id}
+            )
+        self.assertEqual(carts, 1)
@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from src.monitoring.query_stats import QueryStats, track_queries
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """Fail when the wrapped block runs more than ``limit`` SQL statements.
+
+    Wrap a request made through ``httpx.ASGITransport``:
+
+        with assert_max_queries(4):
+            await client.get(f"/api/v1/users/{user_id}/cart/items")
+    """
+    with track_queries() as stats:
+        yield stats
+
+    if stats.count > limit:
+        statements = "\n".join(
+            f"  {count}x {statement}"
+            for statement, count in stats.statements.most_common()
+        )
+        raise AssertionError(
+            f"Expected at most {limit} queries, {stats.count} were "
+            f"executed:\n{statements}"
+        )